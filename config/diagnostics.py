@@ -0,0 +1,40 @@
+from django.db import connections
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.postgresql_pool.pool import get_pool_stats
+
+
+def get_database_diagnostics(alias):
+    """
+    Возвращает параметры соединений с БД и показатели пула соединений
+    процесса, если БД работает через пул.
+    """
+    connection = connections[alias]
+    settings_dict = connection.settings_dict
+    pool_stats = None
+    if settings_dict["ENGINE"] == "config.postgresql_pool":
+        pool_stats = get_pool_stats(alias, connection.get_connection_params())
+    return {
+        "vendor": connection.vendor,
+        "engine": settings_dict["ENGINE"],
+        "conn_max_age": settings_dict["CONN_MAX_AGE"],
+        "conn_health_checks": settings_dict["CONN_HEALTH_CHECKS"],
+        "pool": pool_stats,
+    }
+
+
+class DatabaseDiagnosticsAPIView(APIView):
+    """
+    Выводит для каждой БД параметры соединений и показатели пула соединений
+    рабочего процесса: выданные и свободные соединения, ожидания свободного
+    соединения и превышения времени ожидания.
+    """
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request):
+        return Response(
+            {alias: get_database_diagnostics(alias) for alias in connections}
+        )
@@ -0,0 +1,71 @@
+"""
+Быстрые рендерер и парсер JSON для DRF на основе orjson.
+
+orjson - необязательная зависимость: без нее рендерер и парсер работают
+как стандартные JSONRenderer и JSONParser DRF на модуле json.
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Кодировщик значений, которые orjson не кодирует сам (ленивые строки,
+# Decimal, QuerySet и т. п.), и кодировщик JSON при отсутствии orjson
+encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+def dumps(data):
+    """
+    Кодирует данные в компактный JSON в UTF-8. Даты (например,
+    Task.deadline) orjson кодирует сам в формате ISO 8601.
+    """
+    if orjson is None:
+        return encoder.encode(data).encode("utf-8")
+    return orjson.dumps(data, default=encoder.default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Рендерер JSON на основе orjson. Выдает тот же компактный JSON, что
+    и JSONRenderer с настройками DRF по умолчанию; ответы с отступами
+    (параметр indent типа содержимого) и ответы без orjson формируются
+    стандартным рендерером.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Как и JSONRenderer, экранирует разделители строк, недопустимые
+        # в строковых литералах JavaScript
+        return (
+            dumps(data)
+            .replace(b"\xe2\x80\xa8", b"\\u2028")
+            .replace(b"\xe2\x80\xa9", b"\\u2029")
+        )
+
+
+class FastJSONParser(JSONParser):
+    """
+    Парсер JSON на основе orjson для запросов в UTF-8.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
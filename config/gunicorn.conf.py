@@ -0,0 +1,70 @@
+"""
+Конфигурация gunicorn для запуска приложения в нескольких рабочих процессах:
+
+    gunicorn -c config/gunicorn.conf.py
+
+Режим задается переменной окружения SERVER_MODE: wsgi (по умолчанию) -
+потоковые рабочие процессы gunicorn с приложением config.wsgi; asgi - рабочие
+процессы uvicorn с приложением config.asgi, в которых асинхронные контроллеры
+не занимают поток на время запроса. В режиме asgi Django 4.2 считывает
+синхронный итератор StreamingHttpResponse в память целиком, поэтому выгрузки
+и дерево задач передаются потоком только в режиме wsgi.
+"""
+
+import multiprocessing
+import os
+
+SERVER_MODES = {
+    "asgi": ("config.asgi:application", "uvicorn.workers.UvicornWorker"),
+    "wsgi": ("config.wsgi:application", "gthread"),
+}
+
+server_mode = os.getenv("SERVER_MODE", "wsgi")
+if server_mode not in SERVER_MODES:
+    raise ValueError(f"Неизвестный режим SERVER_MODE: {server_mode}.")
+wsgi_app, worker_class = SERVER_MODES[server_mode]
+
+bind = os.getenv("SERVER_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("SERVER_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+# Потоки рабочего процесса в режиме wsgi
+threads = int(os.getenv("SERVER_THREADS", 4))
+
+# Приложение загружается в главном процессе до создания рабочих процессов:
+# ошибки импорта обнаруживаются при запуске, а память под код разделяется
+preload_app = True
+
+timeout = int(os.getenv("SERVER_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = 5
+
+# Перезапуск рабочих процессов после заданного количества запросов
+# ограничивает рост памяти; разброс исключает одновременный перезапуск
+max_requests = int(os.getenv("SERVER_MAX_REQUESTS", 10000))
+max_requests_jitter = max_requests // 10
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    """
+    Закрывает соединения с БД, унаследованные рабочим процессом от главного
+    процесса при предзагрузке приложения.
+    """
+    from django.db import connections
+
+    connections.close_all()
+
+
+def worker_exit(server, worker):
+    """
+    Закрывает соединения с БД рабочего процесса, включая свободные
+    соединения пула, чтобы они не оставались открытыми на стороне PostgreSQL
+    до истечения таймаутов.
+    """
+    from django.db import connections
+
+    from config.postgresql_pool.pool import close_pools
+
+    connections.close_all()
+    close_pools()
@@ -0,0 +1,211 @@
+import threading
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import (iscoroutinefunction, markcoroutinefunction,
+                          sync_to_async)
+from django.conf import settings
+from django.db import connections
+from django.http import Http404, HttpResponse
+
+# Имя представления для запросов, не сопоставленных ни одному URL
+UNMATCHED_VIEW_NAME = "unmatched"
+
+
+class RequestMetrics:
+    """
+    Показатели одного запроса: количество запросов к БД и время
+    выполнения запросов к БД, отрисовки ответа и обработки запроса в секундах.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+        self.total_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        """
+        Обертка выполнения запросов к БД (connection.execute_wrapper).
+        """
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries += 1
+
+    def get_server_timing(self):
+        """
+        Возвращает значение заголовка Server-Timing.
+        """
+        return ", ".join(
+            (
+                f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries"',
+                f"render;dur={self.render_time * 1000:.2f}",
+                f"total;dur={self.total_time * 1000:.2f}",
+            )
+        )
+
+
+class MetricsRegistry:
+    """
+    Накопленные в процессе показатели запросов по именам представлений.
+    """
+
+    # Метрики Prometheus: (<имя>, <тип>, <описание>, <атрибут RequestMetrics>)
+    METRICS = (
+        (
+            "http_request_duration_seconds",
+            "summary",
+            "Время обработки запроса.",
+            "total_time",
+        ),
+        (
+            "http_request_db_duration_seconds",
+            "summary",
+            "Время выполнения запросов к БД при обработке запроса.",
+            "db_time",
+        ),
+        (
+            "http_request_render_duration_seconds",
+            "summary",
+            "Время отрисовки ответа.",
+            "render_time",
+        ),
+        (
+            "http_request_db_queries",
+            "summary",
+            "Количество запросов к БД при обработке запроса.",
+            "queries",
+        ),
+    )
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.views = {}
+
+    def record(self, view_name, metrics):
+        """
+        Добавляет показатели запроса к показателям представления.
+        """
+        with self.lock:
+            totals = self.views.setdefault(
+                view_name, {"count": 0, **{attr: 0 for *_, attr in self.METRICS}}
+            )
+            totals["count"] += 1
+            for *_, attr in self.METRICS:
+                totals[attr] += getattr(metrics, attr)
+
+    def clear(self):
+        with self.lock:
+            self.views.clear()
+
+    def render(self):
+        """
+        Возвращает показатели в текстовом формате Prometheus.
+        """
+        with self.lock:
+            views = {name: dict(totals) for name, totals in self.views.items()}
+        lines = []
+        for name, metric_type, help_text, attr in self.METRICS:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for view_name, totals in sorted(views.items()):
+                labels = f'{{view="{view_name}"}}'
+                lines.append(f"{name}_count{labels} {totals['count']}")
+                lines.append(f"{name}_sum{labels} {totals[attr]}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """
+    Промежуточный слой сбора показателей запросов: количества и времени
+    запросов к БД, времени отрисовки ответа и общего времени обработки.
+
+    Показатели возвращаются в заголовке Server-Timing и накапливаются
+    по именам представлений (например, tasks:important-tasks) для выдачи
+    эндпоинтом /metrics. Подключается настройкой METRICS_ENABLED.
+    Показатели накапливаются в памяти процесса, поэтому при нескольких
+    рабочих процессах каждый процесс выдает собственные показатели.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = request.metrics = RequestMetrics()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            self.install_wrappers(stack, metrics)
+            response = self.get_response(request)
+        return self.finish(request, response, metrics, started)
+
+    async def __acall__(self, request):
+        """
+        Асинхронный вариант __call__. Соединения с БД привязаны к потоку,
+        поэтому обертки запросов устанавливаются и снимаются в потоке,
+        в котором асинхронный API ORM выполняет запросы этого HTTP-запроса.
+        """
+        metrics = request.metrics = RequestMetrics()
+        started = time.perf_counter()
+        stack = ExitStack()
+        await sync_to_async(self.install_wrappers)(stack, metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.finish(request, response, metrics, started)
+
+    @staticmethod
+    def install_wrappers(stack, metrics):
+        """
+        Устанавливает обертку выполнения запросов во все соединения с БД.
+        """
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics))
+
+    @staticmethod
+    def finish(request, response, metrics, started):
+        """
+        Учитывает показатели запроса и добавляет заголовок Server-Timing.
+        """
+        metrics.total_time = time.perf_counter() - started
+        resolver_match = request.resolver_match
+        view_name = resolver_match.view_name if resolver_match else None
+        registry.record(view_name or UNMATCHED_VIEW_NAME, metrics)
+        response["Server-Timing"] = metrics.get_server_timing()
+        return response
+
+    def process_template_response(self, request, response):
+        """
+        Засекает время отрисовки ответа (в том числе ответов DRF).
+        """
+        render_started = time.perf_counter()
+
+        def stop_render_timer(rendered_response):
+            request.metrics.render_time = time.perf_counter() - render_started
+
+        response.add_post_render_callback(stop_render_timer)
+        return response
+
+
+def metrics_view(request):
+    """
+    Выдает накопленные показатели запросов в текстовом формате Prometheus.
+    """
+    if not settings.METRICS_ENABLED:
+        raise Http404
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,79 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+from config.postgresql_pool.creation import DatabaseCreation
+from config.postgresql_pool.pool import PoolTimeout, get_pool
+
+if is_psycopg3:
+    raise ImproperlyConfigured(
+        "Бэкенд config.postgresql_pool работает с драйвером psycopg2."
+    )
+
+# Размер пула и время ожидания свободного соединения по умолчанию
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_TIMEOUT = 5
+# Время жизни соединения и время простоя в пуле по умолчанию, в секундах
+DEFAULT_POOL_MAX_LIFETIME = 3600
+DEFAULT_POOL_MAX_IDLE = 600
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    Бэкенд PostgreSQL, берущий соединения из пула процесса (см. ConnectionPool)
+    и возвращающий их в пул при закрытии соединения.
+
+    Настройки пула задаются в словаре POOL настроек БД: SIZE - наибольшее
+    количество соединений процесса, TIMEOUT - время ожидания свободного
+    соединения в секундах, MAX_LIFETIME и MAX_IDLE - время в секундах,
+    после которого соединение закрывается вместо выдачи из пула. При
+    CONN_HEALTH_CHECKS свободное соединение проверяется перед выдачей. Соединения закрываются по окончании каждого
+    запроса (CONN_MAX_AGE = 0) и остаются открытыми в пуле, поэтому
+    пул подходит для рабочих процессов ASGI, в которых запросы выполняются
+    в разных потоках. Свободные соединения пула закрываются перед удалением
+    тестовой БД (см. DatabaseCreation).
+    """
+
+    creation_class = DatabaseCreation
+
+    def get_pool(self, conn_params):
+        """
+        Возвращает пул соединений для параметров подключения.
+        """
+        options = self.settings_dict.get("POOL", {})
+        return get_pool(
+            self.alias,
+            conn_params,
+            options.get("SIZE", DEFAULT_POOL_SIZE),
+            options.get("TIMEOUT", DEFAULT_POOL_TIMEOUT),
+            options.get("MAX_LIFETIME", DEFAULT_POOL_MAX_LIFETIME),
+            options.get("MAX_IDLE", DEFAULT_POOL_MAX_IDLE),
+        )
+
+    def get_new_connection(self, conn_params):
+        check = None
+        if self.settings_dict["CONN_HEALTH_CHECKS"]:
+            check = self.check_pooled_connection
+        try:
+            return self.get_pool(conn_params).getconn(
+                lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+                check,
+            )
+        except PoolTimeout as error:
+            raise self.Database.OperationalError(str(error)) from error
+
+    @staticmethod
+    def check_pooled_connection(connection):
+        """
+        Проверяет пригодность свободного соединения пула запросом к БД.
+        """
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except Exception:
+            return False
+        return True
+
+    def _close(self):
+        if self.connection is not None:
+            self.get_pool(self.get_connection_params()).putconn(self.connection)
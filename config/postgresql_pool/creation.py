@@ -0,0 +1,18 @@
+from django.db.backends.postgresql import creation
+
+from config.postgresql_pool.pool import close_pools
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    """
+    Создание и удаление тестовой БД бэкенда с пулом соединений.
+    """
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        """
+        Закрывает свободные соединения пула с тестовой БД перед ее удалением:
+        соединения, возвращенные в пул, остаются открытыми, и PostgreSQL
+        не удалит БД, к которой есть подключения.
+        """
+        close_pools(self.connection.alias)
+        super()._destroy_test_db(test_database_name, verbosity)
@@ -0,0 +1,229 @@
+import os
+import threading
+import time
+from collections import deque
+
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+
+class PoolTimeout(Exception):
+    """
+    Соединение не освободилось за время ожидания пула.
+    """
+
+
+class ConnectionPool:
+    """
+    Пул соединений с БД в памяти процесса.
+
+    Выдает не более max_size соединений одновременно: при исчерпании пула
+    запрос соединения ожидает его освобождения не дольше timeout секунд.
+    Соединения создаются по требованию функцией connect и возвращаются
+    в пул открытыми; соединения, закрытые или оставшиеся в ошибочной
+    транзакции, отбрасываются. Соединения старше max_lifetime секунд
+    и простаивавшие в пуле дольше max_idle секунд закрываются вместо выдачи
+    (None - без ограничения). Пул учитывает выданные соединения, ожидания
+    и превышения времени ожидания.
+    """
+
+    def __init__(self, max_size, timeout, max_lifetime=None, max_idle=None):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.pid = os.getpid()
+        self.slots = threading.BoundedSemaphore(max_size)
+        self.lock = threading.Lock()
+        # Свободные соединения в виде (соединение, время создания, время возврата)
+        self.idle = deque()
+        # Время создания выданных соединений по id соединения
+        self.connected_at = {}
+        self.checked_out = 0
+        self.checkouts = 0
+        self.created = 0
+        self.expired = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_time = 0.0
+
+    def getconn(self, connect, check=None):
+        """
+        Выдает свободное соединение или создает новое функцией connect.
+        Свободное соединение предварительно проверяется функцией check,
+        если она передана; непригодное соединение закрывается.
+        """
+        if not self.slots.acquire(blocking=False):
+            started = time.monotonic()
+            acquired = self.slots.acquire(timeout=self.timeout)
+            with self.lock:
+                self.waits += 1
+                self.wait_time += time.monotonic() - started
+                if not acquired:
+                    self.timeouts += 1
+            if not acquired:
+                raise PoolTimeout(
+                    f"Нет свободных соединений в пуле из {self.max_size} "
+                    f"соединений за {self.timeout} с."
+                )
+        try:
+            connection, connected_at = self.get_idle(check)
+            if connection is None:
+                connection, connected_at = connect(), time.monotonic()
+                with self.lock:
+                    self.created += 1
+        except BaseException:
+            self.slots.release()
+            raise
+        with self.lock:
+            self.connected_at[id(connection)] = connected_at
+            self.checked_out += 1
+            self.checkouts += 1
+        return connection
+
+    def get_idle(self, check):
+        """
+        Возвращает пригодное свободное соединение и время его создания
+        или (None, None).
+        """
+        while True:
+            with self.lock:
+                if not self.idle:
+                    return None, None
+                connection, connected_at, returned_at = self.idle.pop()
+            if self.is_expired(connected_at, returned_at):
+                with self.lock:
+                    self.expired += 1
+            elif not connection.closed and (check is None or check(connection)):
+                return connection, connected_at
+            self.discard(connection)
+
+    def is_expired(self, connected_at, returned_at):
+        """
+        Проверяет превышение времени жизни или простоя свободного соединения.
+        """
+        now = time.monotonic()
+        return (
+            self.max_lifetime is not None and now - connected_at > self.max_lifetime
+        ) or (self.max_idle is not None and now - returned_at > self.max_idle)
+
+    def putconn(self, connection):
+        """
+        Возвращает соединение в пул, откатывая незавершенную транзакцию.
+        """
+        with self.lock:
+            connected_at = self.connected_at.pop(id(connection), time.monotonic())
+        try:
+            if not connection.closed:
+                status = connection.info.transaction_status
+                if status != TRANSACTION_STATUS_IDLE:
+                    connection.rollback()
+            if connection.closed:
+                self.discard(connection)
+            else:
+                with self.lock:
+                    self.idle.append((connection, connected_at, time.monotonic()))
+        except Exception:
+            self.discard(connection)
+        finally:
+            with self.lock:
+                self.checked_out -= 1
+            self.slots.release()
+
+    def close_idle(self):
+        """
+        Закрывает все свободные соединения пула. Возвращает их количество.
+        """
+        with self.lock:
+            idle = list(self.idle)
+            self.idle.clear()
+        for connection, _, _ in idle:
+            self.discard(connection)
+        return len(idle)
+
+    @staticmethod
+    def discard(connection):
+        """
+        Закрывает соединение, не возвращая его в пул.
+        """
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def get_stats(self):
+        """
+        Возвращает показатели пула.
+        """
+        with self.lock:
+            return {
+                "max_size": self.max_size,
+                "timeout": self.timeout,
+                "max_lifetime": self.max_lifetime,
+                "max_idle": self.max_idle,
+                "checked_out": self.checked_out,
+                "idle": len(self.idle),
+                "checkouts": self.checkouts,
+                "created": self.created,
+                "expired": self.expired,
+                "waits": self.waits,
+                "wait_time": round(self.wait_time, 6),
+                "timeouts": self.timeouts,
+            }
+
+
+# Пулы соединений процесса по псевдонимам БД и параметрам подключения
+pools = {}
+pools_lock = threading.Lock()
+
+
+def get_pool_key(alias, conn_params):
+    """
+    Возвращает ключ пула: соединения с разными БД (например, служебные
+    соединения при создании тестовой БД) выдаются разными пулами.
+    """
+    return alias, repr(sorted(conn_params.items()))
+
+
+def get_pool(alias, conn_params, max_size, timeout, max_lifetime=None, max_idle=None):
+    """
+    Возвращает пул соединений для БД, создавая его при первом обращении.
+    Пул, созданный до fork() (например, при предзагрузке приложения
+    gunicorn), в дочернем процессе заменяется новым: соединения нельзя
+    разделять между процессами.
+    """
+    key = get_pool_key(alias, conn_params)
+    with pools_lock:
+        pool = pools.get(key)
+        if pool is None or pool.pid != os.getpid():
+            pool = pools[key] = ConnectionPool(
+                max_size, timeout, max_lifetime, max_idle
+            )
+        return pool
+
+
+def close_pools(alias=None):
+    """
+    Закрывает свободные соединения пулов процесса для БД alias (для всех БД,
+    если alias не передан), например перед удалением тестовой БД
+    и при завершении рабочего процесса. Возвращает количество закрытых
+    соединений.
+    """
+    with pools_lock:
+        selected = [
+            pool
+            for (pool_alias, _), pool in pools.items()
+            if (alias is None or pool_alias == alias) and pool.pid == os.getpid()
+        ]
+    return sum(pool.close_idle() for pool in selected)
+
+
+def get_pool_stats(alias, conn_params):
+    """
+    Возвращает показатели пула соединений процесса для БД
+    или None, если пул еще не создан.
+    """
+    with pools_lock:
+        pool = pools.get(get_pool_key(alias, conn_params))
+    if pool is None or pool.pid != os.getpid():
+        return None
+    return pool.get_stats()
@@ -0,0 +1,190 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.utils.connection import ConnectionDoesNotExist
+from rest_framework.permissions import AllowAny
+
+# Безопасные методы запросов, чтение которых направляется на реплики
+REPLICA_METHODS = ("GET", "HEAD")
+
+
+class ReplicaState:
+    """
+    Состояние маршрутизации запросов одного HTTP-запроса: допускается ли
+    чтение с реплик, выбранная реплика и признак записи в основную БД.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.replica = None
+        self.selected = False
+        self.written = False
+
+
+replica_state = ContextVar("replica_state", default=None)
+
+# Время, до которого недоступные реплики исключаются из выбора
+unavailable_replicas = {}
+unavailable_replicas_lock = threading.Lock()
+
+
+@contextmanager
+def use_replicas(enabled=True):
+    """
+    Направляет запросы чтения в пределах блока на реплики (см. ReplicaRouter).
+    """
+    state = ReplicaState(enabled)
+    token = replica_state.set(state)
+    try:
+        yield state
+    finally:
+        replica_state.reset(token)
+
+
+def check_replica(alias):
+    """
+    Проверяет возможность подключения к реплике.
+    """
+    try:
+        connections[alias].ensure_connection()
+    except (ConnectionDoesNotExist, DatabaseError):
+        return False
+    return True
+
+
+def get_replica():
+    """
+    Выбирает случайную доступную реплику из DATABASE_REPLICAS или
+    возвращает None, если доступных реплик нет. Реплика, к которой
+    не удалось подключиться, исключается из выбора на REPLICA_RETRY_TIMEOUT
+    секунд.
+    """
+    now = time.monotonic()
+    with unavailable_replicas_lock:
+        replicas = [
+            alias
+            for alias in settings.DATABASE_REPLICAS
+            if unavailable_replicas.get(alias, 0) <= now
+        ]
+    random.shuffle(replicas)
+    for alias in replicas:
+        if check_replica(alias):
+            return alias
+        with unavailable_replicas_lock:
+            unavailable_replicas[alias] = now + settings.REPLICA_RETRY_TIMEOUT
+    return None
+
+
+class ReplicaRouter:
+    """
+    Маршрутизатор БД, направляющий запросы чтения на реплики.
+
+    Чтение с реплик включается для HTTP-запроса промежуточным слоем
+    ReplicaMiddleware (или блоком use_replicas); реплика выбирается один раз
+    на HTTP-запрос. После первой записи запросы чтения до конца HTTP-запроса
+    выполняются в основной БД, чтобы читать только что записанные данные.
+    Вне HTTP-запросов, а также при недоступности реплик используется
+    основная БД.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = replica_state.get()
+        if state is None or not state.enabled or state.written:
+            return None
+        if not state.selected:
+            state.replica = get_replica()
+            state.selected = True
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = replica_state.get()
+        if state is not None:
+            state.written = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Реплики содержат копию основной БД
+        return True
+
+
+class ReplicaMiddleware:
+    """
+    Промежуточный слой, включающий чтение с реплик для запросов GET и HEAD
+    общедоступных (AllowAny) контроллеров модулей REPLICA_VIEW_MODULES.
+
+    После запроса с записью (или успешного запроса, изменяющего данные)
+    клиенту устанавливается cookie REPLICA_PIN_COOKIE: пока она действует
+    (REPLICA_PIN_TIMEOUT секунд), запросы клиента читают основную БД
+    и видят собственные изменения, не дожидаясь репликации.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with use_replicas(enabled=False) as state:
+            request.replica_state = state
+            response = self.get_response(request)
+        return self.finish(request, response, state)
+
+    async def __acall__(self, request):
+        """
+        Асинхронный вариант __call__. Состояние хранится в переменной
+        контекста и доступно запросам ORM, выполняемым в потоках.
+        """
+        with use_replicas(enabled=False) as state:
+            request.replica_state = state
+            response = await self.get_response(request)
+        return self.finish(request, response, state)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.replica_state.enabled = (
+            request.method in REPLICA_METHODS
+            and settings.REPLICA_PIN_COOKIE not in request.COOKIES
+            and self.is_replica_view(view_func)
+        )
+
+    @staticmethod
+    def is_replica_view(view_func):
+        """
+        Проверяет, что контроллер из модулей REPLICA_VIEW_MODULES
+        общедоступен.
+        """
+        view_class = getattr(view_func, "cls", None)
+        return (
+            view_class is not None
+            and view_class.__module__ in settings.REPLICA_VIEW_MODULES
+            and all(
+                permission is AllowAny
+                for permission in view_class.permission_classes
+            )
+        )
+
+    @staticmethod
+    def finish(request, response, state):
+        """
+        Устанавливает cookie чтения из основной БД после записи.
+        """
+        unsafe_request = request.method not in REPLICA_METHODS
+        if state.written or (unsafe_request and response.status_code < 400):
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_TIMEOUT,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
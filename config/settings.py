@@ -36,6 +36,11 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Сбор показателей запросов (Server-Timing и эндпоинт /metrics)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", False) == "True"
+if METRICS_ENABLED:
+    MIDDLEWARE.insert(0, "config.metrics.MetricsMiddleware")
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -56,27 +61,131 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "config.wsgi.application"
 
+# Аутентификация JWT без запроса пользователя из БД (users.authentication);
+# требует общего для рабочих процессов кэша JWT_DENYLIST_CACHE_ALIAS
+JWT_STATELESS_AUTH = os.getenv("JWT_STATELESS_AUTH", "False") == "True"
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.StatelessJWTAuthentication"
+        if JWT_STATELESS_AUTH
+        else "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    # JSON кодируется и разбирается orjson (config.fastjson); даты
+    # сериализаторы передают рендереру без преобразования в строку
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.fastjson.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "config.fastjson.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    "DATE_FORMAT": None,
 }
 
+SIMPLE_JWT = {
+    "TOKEN_OBTAIN_SERIALIZER": "users.tokens.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "users.tokens.DenylistTokenRefreshSerializer",
+}
+
+# Кэш списка отозванных токенов, время хранения в секундах и наибольшее
+# количество пользователей в кэше процесса для токенов без утверждений
+JWT_DENYLIST_CACHE_ALIAS = os.getenv("JWT_DENYLIST_CACHE_ALIAS", "jwt-denylist")
+JWT_USER_CACHE_TTL = int(os.getenv("JWT_USER_CACHE_TTL", 60))
+JWT_USER_CACHE_SIZE = int(os.getenv("JWT_USER_CACHE_SIZE", 1024))
+
+
+# По умолчанию соединения потоков остаются открытыми CONN_MAX_AGE секунд.
+# Пул соединений процесса (config.postgresql_pool) включается явно,
+# например в режиме ASGI, где запросы выполняются в разных потоках
+# и постоянные соединения CONN_MAX_AGE не переиспользуются
+POSTGRES_POOL = os.getenv("POSTGRES_POOL", "False") == "True"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": (
+            "config.postgresql_pool"
+            if POSTGRES_POOL
+            else "django.db.backends.postgresql"
+        ),
         "NAME": os.getenv("POSTGRES_DB"),
         "USER": os.getenv("POSTGRES_USER"),
         "PASSWORD": os.getenv("POSTGRES_PASSWORD"),
         "HOST": os.getenv("POSTGRES_HOST"),
         "PORT": os.getenv("POSTGRES_PORT"),
+        "CONN_MAX_AGE": (
+            0 if POSTGRES_POOL else int(os.getenv("POSTGRES_CONN_MAX_AGE", 60))
+        ),
+        "CONN_HEALTH_CHECKS": (
+            os.getenv("POSTGRES_CONN_HEALTH_CHECKS", "True") == "True"
+        ),
+        "POOL": {
+            "SIZE": int(os.getenv("POSTGRES_POOL_SIZE", 10)),
+            "TIMEOUT": float(os.getenv("POSTGRES_POOL_TIMEOUT", 5)),
+            "MAX_LIFETIME": float(os.getenv("POSTGRES_POOL_MAX_LIFETIME", 3600)),
+            "MAX_IDLE": float(os.getenv("POSTGRES_POOL_MAX_IDLE", 600)),
+        },
     }
 }
 
+# Реплики для чтения общедоступных контроллеров tasks (config.replicas):
+# адреса вида host:port через запятую в POSTGRES_REPLICAS. В тестах реплики
+# используют тестовую основную БД
+DATABASE_REPLICAS = []
+for number, address in enumerate(
+    filter(None, os.getenv("POSTGRES_REPLICAS", "").split(",")), start=1
+):
+    host, _, port = address.strip().partition(":")
+    DATABASE_REPLICAS.append(f"replica{number}")
+    DATABASES[f"replica{number}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+
+REPLICA_VIEW_MODULES = ("tasks.views", "tasks.async_views")
+# Время исключения недоступной реплики из выбора и время чтения из основной
+# БД после записи в секундах
+REPLICA_RETRY_TIMEOUT = int(os.getenv("REPLICA_RETRY_TIMEOUT", 30))
+REPLICA_PIN_TIMEOUT = int(os.getenv("REPLICA_PIN_TIMEOUT", 10))
+REPLICA_PIN_COOKIE = "db_primary"
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ["config.replicas.ReplicaRouter"]
+    MIDDLEWARE.append("config.replicas.ReplicaMiddleware")
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    },
+    # Список отозванных токенов: отдельный кэш, чтобы записи не вытеснялись
+    # ответами API. По умолчанию - память процесса; при JWT_STATELESS_AUTH=True
+    # требуется общий для рабочих процессов кэш без обращений к БД,
+    # например django.core.cache.backends.redis.RedisCache (пакет redis)
+    "jwt-denylist": {
+        "BACKEND": os.getenv(
+            "JWT_DENYLIST_CACHE_BACKEND",
+            "django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.getenv("JWT_DENYLIST_CACHE_LOCATION", "jwt-denylist"),
+    },
+}
+if CACHES["jwt-denylist"]["BACKEND"].endswith(".LocMemCache"):
+    # Кэш в памяти процесса вытесняет записи сверх MAX_ENTRIES
+    CACHES["jwt-denylist"]["OPTIONS"] = {"MAX_ENTRIES": 100000}
+
+# Кэш ответов контроллеров чтения и время хранения ответов в секундах
+API_CACHE_ALIAS = os.getenv("API_CACHE_ALIAS", "default")
+API_CACHE_TIMEOUT = int(os.getenv("API_CACHE_TIMEOUT", 300))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -4,6 +4,9 @@ from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
+from config.diagnostics import DatabaseDiagnosticsAPIView
+from config.metrics import metrics_view
+
 schema_view = get_schema_view(
     openapi.Info(
         title="Snippets API",
@@ -21,6 +24,12 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("", include("tasks.urls", namespace="tasks")),
     path("users/", include("users.urls", namespace="users")),
+    path("metrics", metrics_view, name="metrics"),
+    path(
+        "diagnostics/db",
+        DatabaseDiagnosticsAPIView.as_view(),
+        name="diagnostics-db",
+    ),
     path(
         "swagger/",
         schema_view.with_ui("swagger", cache_timeout=0),
@@ -1,17 +1,103 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR
 
 from tasks.models import Employee, Task
+from tasks.paginations import EstimatedCountPaginator
+from tasks.services import search_employees
+
+
+class InputFilter(admin.SimpleListFilter):
+    """
+    Фильтр списка с полем ввода значения вместо списка вариантов,
+    не загружающий варианты фильтрации из БД.
+    """
+
+    template = "admin/input_filter.html"
+
+    def lookups(self, request, model_admin):
+        # Фильтр выводится, только если список вариантов не пуст
+        return ((),)
+
+    def choices(self, changelist):
+        all_choice = next(super().choices(changelist))
+        all_choice["query_parts"] = [
+            (name, value)
+            for name, value in changelist.params.items()
+            if name not in (self.parameter_name, PAGE_VAR)
+        ]
+        yield all_choice
+
+
+class ReferenceInputFilter(InputFilter):
+    """
+    Фильтр по ссылке на запись: идентификатор, null для записей без ссылки
+    или, если задано поле search_field, начало значения этого поля.
+    """
+
+    search_field = None
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if not value:
+            return queryset
+        if value == "null":
+            return queryset.filter(**{f"{self.parameter_name}__isnull": True})
+        if value.isdigit():
+            return queryset.filter(**{f"{self.parameter_name}_id": value})
+        if self.search_field:
+            return queryset.filter(
+                **{f"{self.parameter_name}__{self.search_field}__istartswith": value}
+            )
+        return queryset.none()
+
+
+class ExecutorFilter(ReferenceInputFilter):
+    title = "исполнителю (ID или начало ФИО)"
+    parameter_name = "executor"
+    search_field = "name"
+
+
+class ParentTaskFilter(ReferenceInputFilter):
+    title = "родительской задаче (ID)"
+    parameter_name = "parent_task"
+
+
+class PositionFilter(InputFilter):
+    title = "должности"
+    parameter_name = "position"
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(position__istartswith=self.value())
+        return queryset
 
 
 @admin.register(Employee)
 class EmployeeAdmin(admin.ModelAdmin):
-    list_display = ("id", "name", "position")
-    list_filter = ("position",)
+    list_display = ("id", "name", "position", "active_tasks_count")
+    list_filter = (PositionFilter,)
+    search_fields = ("name",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Ищет сотрудников по началу слов ФИО, в том числе для автодополнения
+        исполнителя задачи.
+        """
+        if not search_term:
+            return queryset, False
+        return search_employees(queryset, search_term), False
 
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ("id", "title", "parent_task", "status", "executor", "deadline")
-    list_filter = ("status", "executor")
-    search_fields = ("title", "parent_task")
-    order_by = ("-deadline",)
+    list_select_related = ("parent_task", "executor")
+    list_filter = ("status", ExecutorFilter, ParentTaskFilter)
+    search_fields = ("title",)
+    ordering = ("-deadline", "id")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    raw_id_fields = ("parent_task",)
+    autocomplete_fields = ("executor",)
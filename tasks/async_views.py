@@ -0,0 +1,135 @@
+from inspect import isawaitable
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from rest_framework.response import Response
+
+from tasks.views import (EmployeeListAPIView, EmployeeRetrieveAPIView,
+                         TaskListAPIView, TaskRetrieveAPIView)
+
+
+class AsyncAPIViewMixin:
+    """
+    Примесь контроллера DRF с асинхронными обработчиками запросов.
+
+    Обработчики обращаются к БД через асинхронный API ORM, не занимая поток
+    на время запроса в режиме ASGI. Аутентификация отключена: асинхронные
+    контроллеры предназначены для общедоступного чтения, а аутентификация
+    JWT загружает пользователя синхронным запросом к БД. Кэш ответов
+    читается и записывается в потоке через sync_to_async.
+    """
+
+    authentication_classes = ()
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            self.initial(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+            if isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = await sync_to_async(self.finalize_response)(
+            request, response, *args, **kwargs
+        )
+        return self.response
+
+    async def get_cached_response_async(self, request):
+        """
+        Возвращает закэшированный ответ или None (см. CachedResponseMixin).
+        """
+        return await sync_to_async(self.get_cached_response)(request)
+
+
+class AsyncListMixin(AsyncAPIViewMixin):
+    """
+    Асинхронный вывод списка объектов с фильтрацией и постраничным выводом.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        response = await self.get_cached_response_async(request)
+        if response is not None:
+            return response
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.paginator is None:
+            serializer = self.get_serializer(
+                [item async for item in queryset], many=True
+            )
+            return Response(serializer.data)
+        page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+class AsyncRetrieveMixin(AsyncAPIViewMixin):
+    """
+    Асинхронный просмотр объекта.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        response = await self.get_cached_response_async(request)
+        if response is not None:
+            return response
+
+        serializer = self.get_serializer(await self.aget_object())
+        return Response(serializer.data)
+
+    async def aget_object(self):
+        """
+        Асинхронный вариант get_object: ошибка 404 выдается как для
+        отсутствующего объекта, так и для некорректного значения ключа,
+        с теми же сообщениями, что и в синхронном варианте.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            instance = await queryset.aget(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                f"No {queryset.model._meta.object_name} matches the given query."
+            )
+        except (TypeError, ValueError, ValidationError):
+            raise Http404
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+
+class AsyncTaskListAPIView(AsyncListMixin, TaskListAPIView):
+    """
+    Асинхронный вариант TaskListAPIView.
+    """
+
+
+class AsyncTaskRetrieveAPIView(AsyncRetrieveMixin, TaskRetrieveAPIView):
+    """
+    Асинхронный вариант TaskRetrieveAPIView.
+    """
+
+
+class AsyncEmployeeListAPIView(AsyncListMixin, EmployeeListAPIView):
+    """
+    Асинхронный вариант EmployeeListAPIView.
+    """
+
+
+class AsyncEmployeeRetrieveAPIView(AsyncRetrieveMixin, EmployeeRetrieveAPIView):
+    """
+    Асинхронный вариант EmployeeRetrieveAPIView.
+    """
@@ -0,0 +1,385 @@
+import json
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from importlib import import_module
+from io import BytesIO
+from pathlib import Path
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from config.fastjson import FastJSONParser, FastJSONRenderer
+from tasks.models import Employee, Task
+from tasks.serializers import TaskSerializer
+from users.models import User
+
+# Модули URL, все эндпоинты которых должны быть покрыты бенчмарком
+BENCHMARK_URLCONFS = ("tasks.urls", "users.urls")
+
+# Параметры команды seed_perf для данных бенчмарка
+BENCHMARK_SEED_OPTIONS = {
+    "employees": 200,
+    "roots": 100,
+    "depth": 3,
+    "children": 3,
+    "seed": 0,
+}
+
+# Количество замеров каждого эндпоинта, по которым вычисляется медиана
+BENCHMARK_REPEAT = 5
+
+# Допустимое замедление относительно базовых показателей: во сколько раз
+# и дополнительный запас в миллисекундах на погрешность замера
+LATENCY_TOLERANCE = 1.5
+LATENCY_SLACK_MS = 5
+
+# Файл базовых показателей эндпоинтов по СУБД
+BASELINE_PATH = Path(__file__).resolve().parent / "benchmark_baseline.json"
+
+BENCHMARK_PASSWORD = "benchmark-password"
+
+# Количество задач в ответе бенчмарка JSON и сравниваемые пары рендерера
+# и парсера: (<название>, <рендерер>, <парсер>)
+JSON_BENCHMARK_TASKS = 10000
+JSON_BENCHMARK_CODECS = (
+    ("json", JSONRenderer(), JSONParser()),
+    ("fastjson", FastJSONRenderer(), FastJSONParser()),
+)
+
+
+def get_endpoint_names():
+    """
+    Возвращает имена всех эндпоинтов модулей BENCHMARK_URLCONFS.
+    """
+    names = []
+    for urlconf in BENCHMARK_URLCONFS:
+        module = import_module(urlconf)
+        names.extend(
+            f"{module.app_name}:{pattern.name}" for pattern in module.urlpatterns
+        )
+    return names
+
+
+def get_benchmark_fixture():
+    """
+    Выбирает из заполненной командой seed_perf БД объекты, к которым
+    обращаются запросы бенчмарка, и создает пользователя.
+    """
+    user = User(email="benchmark@example.com")
+    user.set_password(BENCHMARK_PASSWORD)
+    user.save()
+    return {
+        "user": user,
+        "employee": Employee.objects.order_by("pk").first(),
+        "root": Task.objects.filter(depth=0).order_by("pk").first(),
+        "leaves": list(Task.objects.order_by("-depth", "pk")[:10]),
+        "deadline": (timezone.now().date() + timedelta(days=365)).isoformat(),
+    }
+
+
+def create_employee():
+    """
+    Создает сотрудника для запроса удаления.
+    """
+    return Employee.objects.create(name="Удаляемый Сотрудник", position="Должность")
+
+
+def create_task(fixture):
+    """
+    Создает задачу для запроса удаления.
+    """
+    return Task.objects.create(title="Удаляемая задача", deadline=fixture["deadline"])
+
+
+# Запросы бенчмарка по именам эндпоинтов: функция, возвращающая
+# (<метод>, <путь>, <данные>) и подготавливающая данные вне замера
+BENCHMARK_CASES = {
+    "tasks:employee-create": lambda fixture: (
+        "post",
+        reverse("tasks:employee-create"),
+        {"name": "Тестов Тест Тестович", "position": "Разработчик"},
+    ),
+    "tasks:employees": lambda fixture: ("get", reverse("tasks:employees"), None),
+    "tasks:busy-employees": lambda fixture: (
+        "get",
+        reverse("tasks:busy-employees"),
+        None,
+    ),
+    "tasks:employee-search": lambda fixture: (
+        "get",
+        reverse("tasks:employee-search"),
+        {"q": "иван петр"},
+    ),
+    "tasks:employee": lambda fixture: (
+        "get",
+        reverse("tasks:employee", args=(fixture["employee"].pk,)),
+        None,
+    ),
+    "tasks:employee-update": lambda fixture: (
+        "patch",
+        reverse("tasks:employee-update", args=(fixture["employee"].pk,)),
+        {"position": "Аналитик"},
+    ),
+    "tasks:employee-delete": lambda fixture: (
+        "delete",
+        reverse("tasks:employee-delete", args=(create_employee().pk,)),
+        None,
+    ),
+    "tasks:employee-export": lambda fixture: (
+        "get",
+        reverse("tasks:employee-export", args=("csv",)),
+        None,
+    ),
+    "tasks:task-export": lambda fixture: (
+        "get",
+        reverse("tasks:task-export", args=("ndjson",)),
+        None,
+    ),
+    "tasks:task-create": lambda fixture: (
+        "post",
+        reverse("tasks:task-create"),
+        {
+            "title": "Новая задача",
+            "deadline": fixture["deadline"],
+            "executor": fixture["employee"].pk,
+        },
+    ),
+    "tasks:task-bulk-create": lambda fixture: (
+        "post",
+        reverse("tasks:task-bulk-create"),
+        [
+            {
+                "title": f"Пакетная задача{i}",
+                "deadline": fixture["deadline"],
+                "parent_task": fixture["root"].pk,
+                "executor": fixture["employee"].pk,
+            }
+            for i in range(10)
+        ],
+    ),
+    "tasks:task-bulk-update": lambda fixture: (
+        "patch",
+        reverse("tasks:task-bulk-update"),
+        [
+            {"id": task.pk, "title": f"Измененная задача{task.pk}"}
+            for task in fixture["leaves"]
+        ],
+    ),
+    "tasks:tasks": lambda fixture: ("get", reverse("tasks:tasks"), None),
+    "tasks:important-tasks": lambda fixture: (
+        "get",
+        reverse("tasks:important-tasks"),
+        None,
+    ),
+    "tasks:task": lambda fixture: (
+        "get",
+        reverse("tasks:task", args=(fixture["root"].pk,)),
+        None,
+    ),
+    "tasks:task-tree": lambda fixture: (
+        "get",
+        reverse("tasks:task-tree", args=(fixture["root"].pk,)),
+        None,
+    ),
+    "tasks:task-ancestors": lambda fixture: (
+        "get",
+        reverse("tasks:task-ancestors", args=(fixture["leaves"][0].pk,)),
+        None,
+    ),
+    "tasks:task-update": lambda fixture: (
+        "patch",
+        reverse("tasks:task-update", args=(fixture["leaves"][0].pk,)),
+        {"title": "Измененная задача"},
+    ),
+    "tasks:task-delete": lambda fixture: (
+        "delete",
+        reverse("tasks:task-delete", args=(create_task(fixture).pk,)),
+        None,
+    ),
+    "tasks:async-tasks": lambda fixture: (
+        "get",
+        reverse("tasks:async-tasks"),
+        None,
+    ),
+    "tasks:async-task": lambda fixture: (
+        "get",
+        reverse("tasks:async-task", args=(fixture["root"].pk,)),
+        None,
+    ),
+    "tasks:async-employees": lambda fixture: (
+        "get",
+        reverse("tasks:async-employees"),
+        None,
+    ),
+    "tasks:async-employee": lambda fixture: (
+        "get",
+        reverse("tasks:async-employee", args=(fixture["employee"].pk,)),
+        None,
+    ),
+    "users:register": lambda fixture: (
+        "post",
+        reverse("users:register"),
+        {"email": f"{uuid.uuid4().hex}@example.com", "password": BENCHMARK_PASSWORD},
+    ),
+    "users:login": lambda fixture: (
+        "post",
+        reverse("users:login"),
+        {"email": fixture["user"].email, "password": BENCHMARK_PASSWORD},
+    ),
+    "users:token-refresh": lambda fixture: (
+        "post",
+        reverse("users:token-refresh"),
+        {"refresh": str(RefreshToken.for_user(fixture["user"]))},
+    ),
+    "users:logout": lambda fixture: (
+        "post",
+        reverse("users:logout"),
+        {"refresh": str(RefreshToken.for_user(fixture["user"]))},
+    ),
+}
+
+
+def measure_endpoint(client, name, fixture, repeat=BENCHMARK_REPEAT):
+    """
+    Выполняет запрос к эндпоинту repeat раз с очищенным кэшем ответов.
+    Возвращает медиану времени ответа в миллисекундах, наибольшее
+    количество запросов к БД и код ответа последнего запроса.
+    Потоковые ответы вычитываются полностью в пределах замера.
+    """
+    latencies = []
+    queries = 0
+    for _ in range(repeat):
+        method, path, data = BENCHMARK_CASES[name](fixture)
+        cache.clear()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            if method == "get":
+                response = client.get(path, data)
+            else:
+                response = getattr(client, method)(path, data, format="json")
+            if response.streaming:
+                b"".join(response.streaming_content)
+            latencies.append(time.perf_counter() - started)
+        queries = max(queries, len(captured))
+    return {
+        "latency_ms": round(statistics.median(latencies) * 1000, 3),
+        "queries": queries,
+        "status_code": response.status_code,
+    }
+
+
+def load_baseline(vendor):
+    """
+    Возвращает базовые показатели для СУБД или None, если они не записаны.
+    """
+    if not BASELINE_PATH.exists():
+        return None
+    return json.loads(BASELINE_PATH.read_text(encoding="utf-8")).get(vendor)
+
+
+def save_baseline(vendor, results):
+    """
+    Записывает показатели эндпоинтов как базовые для СУБД.
+    """
+    baselines = {}
+    if BASELINE_PATH.exists():
+        baselines = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    baselines[vendor] = {
+        "seed_options": BENCHMARK_SEED_OPTIONS,
+        "endpoints": {
+            name: {"latency_ms": result["latency_ms"], "queries": result["queries"]}
+            for name, result in sorted(results.items())
+        },
+    }
+    BASELINE_PATH.write_text(
+        json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def get_regressions(results, baseline, latency_tolerance=LATENCY_TOLERANCE):
+    """
+    Возвращает описания регрессий показателей эндпоинтов относительно
+    базовых: увеличения количества запросов к БД и замедления ответа
+    сверх допустимого.
+    """
+    regressions = []
+    endpoints = baseline["endpoints"]
+    for name, result in sorted(results.items()):
+        expected = endpoints.get(name)
+        if expected is None:
+            regressions.append(f"{name}: нет базовых показателей.")
+            continue
+        if result["queries"] > expected["queries"]:
+            regressions.append(
+                f"{name}: {result['queries']} запросов к БД "
+                f"вместо {expected['queries']}."
+            )
+        max_latency = expected["latency_ms"] * latency_tolerance + LATENCY_SLACK_MS
+        if result["latency_ms"] > max_latency:
+            regressions.append(
+                f"{name}: {result['latency_ms']:.1f} мс "
+                f"при допустимых {max_latency:.1f} мс."
+            )
+    return regressions
+
+
+def get_json_benchmark_payload(count=JSON_BENCHMARK_TASKS):
+    """
+    Возвращает данные ответа со списком из count задач, сформированные
+    TaskSerializer без обращения к БД.
+    """
+    today = timezone.now().date()
+    statuses = [status for status, label in Task.STATUS_CHOICES]
+    tasks = [
+        Task(
+            id=number,
+            title=f"Тестовая задача номер {number}",
+            parent_task_id=number // 4 or None,
+            executor_id=number % 200 or None,
+            deadline=today + timedelta(days=number % 365),
+            status=statuses[number % len(statuses)],
+        )
+        for number in range(1, count + 1)
+    ]
+    return {
+        "count": count,
+        "next": None,
+        "previous": None,
+        "results": TaskSerializer(tasks, many=True).data,
+    }
+
+
+def measure_json_throughput(payload, repeat=BENCHMARK_REPEAT):
+    """
+    Кодирует данные рендерерами JSON_BENCHMARK_CODECS и разбирает
+    результат парсерами repeat раз. Возвращает для каждой пары медианы
+    времени кодирования и разбора в миллисекундах, количество задач
+    в секунду при кодировании и размер ответа в байтах.
+    """
+    results = {}
+    for name, renderer, parser in JSON_BENCHMARK_CODECS:
+        render_times = []
+        parse_times = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            content = renderer.render(payload)
+            render_times.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            parser.parse(BytesIO(content))
+            parse_times.append(time.perf_counter() - started)
+        render_time = statistics.median(render_times)
+        results[name] = {
+            "render_ms": round(render_time * 1000, 3),
+            "parse_ms": round(statistics.median(parse_times) * 1000, 3),
+            "tasks_per_second": round(len(payload["results"]) / render_time),
+            "size": len(content),
+        }
+    return results
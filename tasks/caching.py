@@ -0,0 +1,157 @@
+from hashlib import md5
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from rest_framework.renderers import JSONRenderer
+
+# Области кэширования ответов: списки и отдельные объекты задач и сотрудников
+TASKS_CACHE_SCOPE = "tasks"
+EMPLOYEES_CACHE_SCOPE = "employees"
+
+
+def get_cache():
+    """
+    Возвращает кэш ответов контроллеров.
+    """
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def get_version_key(scope, pk=None):
+    """
+    Возвращает ключ версии списка объектов области кэширования
+    или версии отдельного объекта при указании pk.
+    """
+    if pk is None:
+        return f"api:{scope}:version"
+    return f"api:{scope}:{pk}:version"
+
+
+def get_versions(version_keys):
+    """
+    Возвращает текущие версии по ключам версий.
+
+    Версия - случайная строка, а не счетчик: если ключ версии будет вытеснен
+    из кэша, новая версия не совпадет ни с одной из прежних, и устаревшие
+    ответы не будут выданы повторно.
+    """
+    cache = get_cache()
+    versions = cache.get_many(version_keys)
+    missing = [key for key in version_keys if key not in versions]
+    if missing:
+        for key in missing:
+            cache.add(key, uuid4().hex, timeout=None)
+        versions.update(cache.get_many(missing))
+    return [versions.get(key, "") for key in version_keys]
+
+
+def invalidate(scope, pks=()):
+    """
+    Делает устаревшими закэшированные ответы со списками объектов области
+    кэширования и с объектами, идентификаторы которых переданы в pks.
+    """
+    version_keys = [get_version_key(scope)]
+    version_keys.extend(get_version_key(scope, pk) for pk in pks)
+    get_cache().set_many({key: uuid4().hex for key in version_keys}, timeout=None)
+
+
+class CachedResponseMixin:
+    """
+    Примесь контроллера, кэширующая ответы на GET-запросы по URL с параметрами
+    запроса и поддерживающая условные запросы с заголовком If-None-Match.
+
+    Ключ ответа включает версию списка (или объекта для контроллеров
+    просмотра объекта), которая меняется при изменении задач и сотрудников,
+    поэтому закэшированные ответы не требуют удаления. Версия читается
+    до обращения к БД: ответ, сформированный одновременно с изменением данных,
+    сохраняется под уже устаревшей версией и не будет выдан. Ответы,
+    прочитанные с реплики (см. config.replicas), не кэшируются: реплика может
+    отставать от основной БД, и ответ с прежними данными сохранился бы
+    под версией, уже измененной записью.
+    """
+
+    cache_scope = None
+
+    def get_cache_version_key(self):
+        """
+        Возвращает ключ версии, от которой зависит ответ контроллера.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return get_version_key(self.cache_scope, self.kwargs.get(lookup_url_kwarg))
+
+    def get_response_cache_key(self, request):
+        """
+        Возвращает ключ ответа по версии, формату ответа и URL запроса.
+        """
+        (version,) = get_versions([self.get_cache_version_key()])
+        digest = md5(
+            f"{request.accepted_media_type}:{request.get_full_path()}".encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return f"api:{self.cache_scope}:response:{version}:{digest}"
+
+    def get(self, request, *args, **kwargs):
+        response = self.get_cached_response(request)
+        if response is None:
+            return super().get(request, *args, **kwargs)
+        return response
+
+    def get_cached_response(self, request):
+        """
+        Возвращает закэшированный ответ (или ответ 304 при совпадении ETag)
+        либо None, если ответ не закэширован. Кэшируются только ответы
+        в JSON: страница BrowsableAPIRenderer содержит данные пользователя
+        запроса (почту и ссылку выхода) и не должна выдаваться другим.
+        """
+        if not isinstance(request.accepted_renderer, JSONRenderer):
+            return None
+        self.response_cache_key = self.get_response_cache_key(request)
+        cached = get_cache().get(self.response_cache_key)
+        if cached is None:
+            return None
+        content, content_type, etag = cached
+        if self.etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type=content_type)
+        response["ETag"] = etag
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        cache_key = getattr(self, "response_cache_key", None)
+        if cache_key is None or response.status_code != 200:
+            return response
+        if response.has_header("ETag"):
+            # Ответ получен из кэша
+            return response
+        response.render()
+        etag = f'"{md5(response.content, usedforsecurity=False).hexdigest()}"'
+        if not self.read_from_replica(request):
+            get_cache().set(
+                cache_key,
+                (response.content, response["Content-Type"], etag),
+                settings.API_CACHE_TIMEOUT,
+            )
+        if self.etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        response["ETag"] = etag
+        return response
+
+    @staticmethod
+    def read_from_replica(request):
+        """
+        Проверяет, читались ли данные ответа с реплики БД.
+        """
+        replica_state = getattr(request, "replica_state", None)
+        return replica_state is not None and replica_state.replica is not None
+
+    @staticmethod
+    def etag_matches(request, etag):
+        """
+        Проверяет, совпадает ли ETag ответа с переданным в If-None-Match.
+        """
+        etags = parse_etags(request.headers.get("If-None-Match", ""))
+        return "*" in etags or etag in etags
@@ -0,0 +1,46 @@
+import csv
+
+from config.fastjson import dumps
+
+# Количество записей, выбираемых из БД за одно обращение к курсору при выгрузке
+EXPORT_CHUNK_SIZE = 2000
+
+# Форматы выгрузки: {<формат>: <тип содержимого>}
+EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+class Echo:
+    """
+    Псевдобуфер для csv.writer, возвращающий записанную строку
+    вместо ее накопления.
+    """
+
+    def write(self, value):
+        return value
+
+
+def stream_ndjson(columns, rows):
+    """
+    Построчно формирует выгрузку в формате NDJSON: по объекту JSON на строку.
+    """
+    for row in rows:
+        yield dumps(dict(zip(columns, row))) + b"\n"
+
+
+def stream_csv(columns, rows):
+    """
+    Построчно формирует выгрузку в формате CSV с заголовком.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+EXPORT_WRITERS = {
+    "ndjson": stream_ndjson,
+    "csv": stream_csv,
+}
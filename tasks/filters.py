@@ -0,0 +1,65 @@
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import (BooleanField, ChoiceField, DateField,
+                                   IntegerField)
+from rest_framework.filters import BaseFilterBackend
+
+from tasks.models import Task
+
+# Значение параметра фильтрации по ссылке, выбирающее записи без ссылки
+NULL_VALUE = "null"
+
+
+def get_query_param(request, name, field):
+    """
+    Возвращает значение параметра запроса, проверенное полем сериализатора,
+    или None, если параметр не передан.
+    """
+    value = request.query_params.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        return field.run_validation(value)
+    except ValidationError as error:
+        raise ValidationError({name: error.detail})
+
+
+class TaskFilterBackend(BaseFilterBackend):
+    """
+    Фильтрация задач по параметрам запроса:
+    status - статус задачи;
+    executor, parent_task - идентификатор исполнителя или родительской задачи,
+    null - задачи без исполнителя или корневые задачи;
+    deadline_after, deadline_before - диапазон сроков исполнения включительно;
+    overdue - true для просроченных незавершенных задач, false для остальных.
+
+    Условия рассчитаны на индексы по исполнителю и статусу, родительской
+    задаче и статусу и по сроку исполнения.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        status = get_query_param(
+            request, "status", ChoiceField(choices=Task.STATUS_CHOICES)
+        )
+        if status is not None:
+            queryset = queryset.filter(status=status)
+
+        for name in ("executor", "parent_task"):
+            if request.query_params.get(name) == NULL_VALUE:
+                queryset = queryset.filter(**{f"{name}__isnull": True})
+                continue
+            pk = get_query_param(request, name, IntegerField(min_value=1))
+            if pk is not None:
+                queryset = queryset.filter(**{f"{name}_id": pk})
+
+        for name, lookup in (("deadline_after", "gte"), ("deadline_before", "lte")):
+            deadline = get_query_param(request, name, DateField())
+            if deadline is not None:
+                queryset = queryset.filter(**{f"deadline__{lookup}": deadline})
+
+        overdue = get_query_param(request, "overdue", BooleanField())
+        if overdue is not None:
+            condition = Q(deadline__lt=timezone.now().date()) & ~Q(status="DONE")
+            queryset = queryset.filter(condition if overdue else ~condition)
+        return queryset
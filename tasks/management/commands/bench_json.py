@@ -0,0 +1,48 @@
+from django.core.management import BaseCommand, CommandError
+
+from tasks import benchmarks
+
+
+class Command(BaseCommand):
+    """
+    Команда сравнения скорости кодирования и разбора JSON стандартными
+    рендерером и парсером DRF и их вариантами на основе orjson
+    (config.fastjson) на ответе со списком задач.
+    """
+
+    help = "Сравнивает скорость рендереров и парсеров JSON на списке задач."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tasks",
+            type=int,
+            default=benchmarks.JSON_BENCHMARK_TASKS,
+            help="Количество задач в ответе. "
+            f"По умолчанию {benchmarks.JSON_BENCHMARK_TASKS}.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=benchmarks.BENCHMARK_REPEAT,
+            help="Количество замеров. "
+            f"По умолчанию {benchmarks.BENCHMARK_REPEAT}.",
+        )
+
+    def handle(self, *args, **options):
+        if options["tasks"] < 1 or options["repeat"] < 1:
+            raise CommandError(
+                "Количество задач и замеров должно быть положительным."
+            )
+        results = benchmarks.measure_json_throughput(
+            benchmarks.get_json_benchmark_payload(options["tasks"]),
+            options["repeat"],
+        )
+        self.stdout.write(
+            f"{'Кодек':<12}{'Кодирование, мс':>18}{'Разбор, мс':>14}"
+            f"{'Задач/с':>12}{'Размер, байт':>16}"
+        )
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<12}{result['render_ms']:>18.1f}{result['parse_ms']:>14.1f}"
+                f"{result['tasks_per_second']:>12}{result['size']:>16}"
+            )
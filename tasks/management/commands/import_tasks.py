@@ -0,0 +1,269 @@
+import csv
+import json
+import time
+from itertools import islice
+from pathlib import Path
+
+from django.core.management import BaseCommand, CommandError
+
+from tasks.caching import EMPLOYEES_CACHE_SCOPE, invalidate
+from tasks.models import Employee
+from tasks.serializers import (BULK_BATCH_SIZE, EmployeeSerializer,
+                               TaskImportSerializer)
+
+# Количество строк файла, проверяемых и записываемых в БД одним пакетом
+IMPORT_BATCH_SIZE = 1000
+
+# Форматы файлов импорта по расширениям файлов
+IMPORT_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+def get_file_format(path):
+    """
+    Возвращает формат файла импорта по его расширению.
+    """
+    try:
+        return IMPORT_FORMATS[Path(path).suffix.lower()]
+    except KeyError:
+        raise CommandError(f"Не удалось определить формат файла {path}.")
+
+
+def read_rows(path, file_format):
+    """
+    Построчно читает записи файла CSV с заголовком или NDJSON в виде словарей,
+    не загружая файл в память целиком.
+    """
+    with open(path, encoding="utf-8", newline="") as file:
+        if file_format == "csv":
+            yield from csv.DictReader(file)
+            return
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                raise CommandError(
+                    f"Строка {line_number} файла {path} не является JSON."
+                )
+
+
+def get_batches(rows, size):
+    """
+    Разбивает последовательность записей на пакеты по size записей.
+    """
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def get_reference(value):
+    """
+    Возвращает внешний идентификатор записи в виде строки
+    или None для пустого значения.
+    """
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+class Command(BaseCommand):
+    """
+    Команда импорта задач и сотрудников из файлов CSV или NDJSON.
+
+    Файлы читаются построчно и обрабатываются пакетами: каждый пакет
+    проверяется сериализаторами с валидаторами NameValidator и DeadlineValidator
+    и записывается в БД запросами bulk_create. Строки, не прошедшие проверку,
+    отклоняются с выводом ошибок, остальные строки пакета загружаются.
+
+    Ссылки на родительские задачи и исполнителей указываются внешними
+    идентификаторами (столбец id) из файлов импорта. Родительская задача должна
+    предшествовать зависимой в файле. Без файла сотрудников исполнитель
+    задачи указывается идентификатором существующего сотрудника.
+    """
+
+    help = "Импортирует задачи и сотрудников из файлов CSV или NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "tasks_file",
+            help="Файл задач со столбцами id, title, parent, executor, deadline "
+            "и status.",
+        )
+        parser.add_argument(
+            "--employees",
+            help="Файл сотрудников со столбцами id, name, position. "
+            "Импортируется до задач.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=sorted(set(IMPORT_FORMATS.values())),
+            help="Формат файлов. По умолчанию определяется по расширению файла.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help=f"Количество строк в пакете. По умолчанию {IMPORT_BATCH_SIZE}.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("Размер пакета должен быть положительным.")
+        self.verbosity = options["verbosity"]
+        self.employee_ids = None
+        self.task_ids = {}
+        if options["employees"]:
+            self.employee_ids = {}
+            self.run_import(
+                "сотрудников",
+                options["employees"],
+                options["format"],
+                options["batch_size"],
+                self.import_employees,
+            )
+        self.run_import(
+            "задач",
+            options["tasks_file"],
+            options["format"],
+            options["batch_size"],
+            self.import_tasks,
+        )
+
+    def run_import(self, name, path, file_format, batch_size, import_batch):
+        """
+        Импортирует записи файла пакетами, выводя отклоненные строки
+        и скорость импорта.
+        """
+        rows = enumerate(read_rows(path, file_format or get_file_format(path)), 1)
+        started = time.monotonic()
+        imported = rejected = 0
+        for batch in get_batches(rows, batch_size):
+            errors = import_batch(batch)
+            for number, row_errors in sorted(errors.items()):
+                self.stderr.write(
+                    f"Строка {number}: {json.dumps(row_errors, ensure_ascii=False)}"
+                )
+            imported += len(batch) - len(errors)
+            rejected += len(errors)
+            if self.verbosity > 1:
+                self.stdout.write(
+                    f"Импорт {name}: загружено {imported}, отклонено {rejected}."
+                )
+        elapsed = max(time.monotonic() - started, 1e-6)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Импорт {name}: загружено {imported}, отклонено {rejected} "
+                f"за {elapsed:.2f} с ({(imported + rejected) / elapsed:.0f} строк/с)."
+            )
+        )
+
+    def import_employees(self, batch):
+        """
+        Проверяет и создает сотрудников пакета.
+        Возвращает ошибки отклоненных строк в виде {<номер строки>: <ошибки>}.
+        """
+        errors = {}
+        employees = []
+        external_ids = []
+        for number, row in batch:
+            serializer = EmployeeSerializer(data=row)
+            if serializer.is_valid():
+                employees.append(Employee(**serializer.validated_data))
+                external_ids.append(get_reference(row.get("id")))
+            else:
+                errors[number] = serializer.errors
+        Employee.objects.bulk_create(employees, batch_size=BULK_BATCH_SIZE)
+        invalidate(EMPLOYEES_CACHE_SCOPE)
+        self.employee_ids.update(
+            (external_id, employee.pk)
+            for external_id, employee in zip(external_ids, employees)
+            if external_id is not None
+        )
+        return errors
+
+    def import_tasks(self, batch):
+        """
+        Проверяет и создает задачи пакета. Строки, не прошедшие проверку,
+        и строки, зависящие от них, исключаются из пакета, после чего
+        оставшиеся строки проверяются повторно.
+        Возвращает ошибки отклоненных строк в виде {<номер строки>: <ошибки>}.
+        """
+        errors = {}
+        items = []
+        numbers = []
+        external_ids = []
+        batch_indexes = {}
+        for number, row in batch:
+            item, item_errors = self.get_task_item(row, batch_indexes)
+            if item_errors:
+                errors[number] = item_errors
+                continue
+            external_id = get_reference(row.get("id"))
+            if external_id is not None:
+                batch_indexes[external_id] = len(items)
+            items.append(item)
+            numbers.append(number)
+            external_ids.append(external_id)
+
+        while items:
+            serializer = TaskImportSerializer(data=items, many=True)
+            if serializer.is_valid():
+                tasks = serializer.save()
+                self.task_ids.update(
+                    (external_id, task.pk)
+                    for external_id, task in zip(external_ids, tasks)
+                    if external_id is not None
+                )
+                break
+
+            rejected = set()
+            for index, item_errors in enumerate(serializer.errors):
+                if not item_errors and items[index].get("parent_index") in rejected:
+                    item_errors = {"parent": ["Родительская задача отклонена."]}
+                if item_errors:
+                    errors[numbers[index]] = item_errors
+                    rejected.add(index)
+            if not rejected:
+                raise CommandError(f"Пакет задач отклонен: {serializer.errors}")
+
+            new_indexes = {}
+            kept = []
+            for index, item in enumerate(items):
+                if index in rejected:
+                    continue
+                if "parent_index" in item:
+                    item["parent_index"] = new_indexes[item["parent_index"]]
+                new_indexes[index] = len(kept)
+                kept.append(index)
+            items = [items[index] for index in kept]
+            numbers = [numbers[index] for index in kept]
+            external_ids = [external_ids[index] for index in kept]
+        return errors
+
+    def get_task_item(self, row, batch_indexes):
+        """
+        Возвращает данные задачи для сериализатора, заменяя внешние
+        идентификаторы родительской задачи и исполнителя, и ошибки ссылок.
+        """
+        item = {
+            field: row[field]
+            for field in ("title", "deadline", "status")
+            if row.get(field) not in (None, "")
+        }
+        parent = get_reference(row.get("parent"))
+        if parent in batch_indexes:
+            item["parent_index"] = batch_indexes[parent]
+        elif parent in self.task_ids:
+            item["parent_task"] = self.task_ids[parent]
+        elif parent is not None:
+            return None, {"parent": [f"Задача {parent} не импортирована ранее."]}
+
+        executor = get_reference(row.get("executor"))
+        if executor is not None and self.employee_ids is None:
+            item["executor"] = executor
+        elif executor is not None:
+            if executor not in self.employee_ids:
+                return None, {"executor": [f"Сотрудник {executor} не импортирован."]}
+            item["executor"] = self.employee_ids[executor]
+        return item, {}
@@ -0,0 +1,151 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import urlopen
+
+from django.core.management import BaseCommand, CommandError
+from django.urls import reverse
+
+from tasks.models import Employee, Task
+
+# Сравниваемые эндпоинты: (<синхронный>, <асинхронный>, <модель объекта>),
+# для эндпоинтов просмотра объекта используется первый объект модели
+LOADTEST_ENDPOINTS = (
+    ("tasks:tasks", "tasks:async-tasks", None),
+    ("tasks:task", "tasks:async-task", Task),
+    ("tasks:employees", "tasks:async-employees", None),
+    ("tasks:employee", "tasks:async-employee", Employee),
+)
+
+
+def get_percentile(values, percent):
+    """
+    Возвращает процентиль значений по методу ближайшего ранга.
+    """
+    values = sorted(values)
+    return values[max(math.ceil(len(values) * percent / 100) - 1, 0)]
+
+
+class Command(BaseCommand):
+    """
+    Команда нагрузочного тестирования запущенного сервера: сравнивает
+    количество запросов в секунду и задержки (p50, p99) синхронных
+    и асинхронных контроллеров чтения.
+
+    Запросы выполняются параллельно в заданном количестве потоков.
+    По умолчанию к каждому запросу добавляется уникальный параметр,
+    чтобы ответы не выдавались из кэша и замерялась работа с БД.
+    Идентификаторы объектов берутся из БД, с которой работает сервер,
+    поэтому команда запускается с теми же настройками БД.
+    """
+
+    help = (
+        "Сравнивает производительность синхронных и асинхронных контроллеров "
+        "чтения запущенного сервера."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            default="http://127.0.0.1:8000",
+            help="Адрес сервера. По умолчанию http://127.0.0.1:8000.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=1000,
+            help="Количество запросов к каждому эндпоинту. По умолчанию 1000.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=20,
+            help="Количество одновременных запросов. По умолчанию 20.",
+        )
+        parser.add_argument(
+            "--cached",
+            action="store_true",
+            help="Не добавлять к запросам уникальный параметр, допуская "
+            "выдачу ответов из кэша.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=10,
+            help="Время ожидания ответа в секундах. По умолчанию 10.",
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError(
+                "Количество запросов и одновременных запросов должно быть "
+                "положительным."
+            )
+        self.timeout = options["timeout"]
+        base_url = options["base_url"].rstrip("/")
+
+        self.stdout.write(
+            f"{'Эндпоинт':<24}{'Запросов/с':>12}{'p50, мс':>10}"
+            f"{'p99, мс':>10}{'Ошибок':>8}"
+        )
+        for sync_name, async_name, model in LOADTEST_ENDPOINTS:
+            args = ()
+            if model is not None:
+                pk = model.objects.order_by("pk").values_list("pk", flat=True).first()
+                if pk is None:
+                    raise CommandError(
+                        f"Нет объектов {model._meta.verbose_name_plural}: "
+                        "заполните БД командой seed_perf."
+                    )
+                args = (pk,)
+            for name in (sync_name, async_name):
+                url = f"{base_url}{reverse(name, args=args)}"
+                result = self.run_load(
+                    url,
+                    options["requests"],
+                    options["concurrency"],
+                    options["cached"],
+                )
+                self.stdout.write(
+                    f"{name:<24}{result['rps']:>12.1f}{result['p50']:>10.1f}"
+                    f"{result['p99']:>10.1f}{result['errors']:>8}"
+                )
+
+    def run_load(self, url, requests, concurrency, cached):
+        """
+        Выполняет запросы к адресу после прогрева и возвращает количество
+        запросов в секунду, задержки p50 и p99 в миллисекундах
+        и количество ошибок.
+        """
+        separator = "&" if "?" in url else "?"
+        urls = [
+            url if cached else f"{url}{separator}nocache={number}"
+            for number in range(requests)
+        ]
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(self.fetch, [url] * concurrency))
+            started = time.perf_counter()
+            results = list(executor.map(self.fetch, urls))
+            elapsed = time.perf_counter() - started
+
+        latencies = [latency for latency, ok in results]
+        return {
+            "rps": requests / elapsed,
+            "p50": get_percentile(latencies, 50) * 1000,
+            "p99": get_percentile(latencies, 99) * 1000,
+            "errors": sum(not ok for latency, ok in results),
+        }
+
+    def fetch(self, url):
+        """
+        Выполняет запрос и возвращает время ответа в секундах и признак
+        успешного ответа.
+        """
+        started = time.perf_counter()
+        try:
+            with urlopen(url, timeout=self.timeout) as response:
+                response.read()
+                ok = response.status == 200
+        except OSError:
+            ok = False
+        return time.perf_counter() - started, ok
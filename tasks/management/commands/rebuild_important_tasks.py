@@ -0,0 +1,36 @@
+from django.core.management import BaseCommand, CommandError
+
+from tasks.services import (get_inconsistent_important_tasks,
+                            refresh_important_tasks)
+
+
+class Command(BaseCommand):
+    """
+    Команда пересчета записей о важных задачах.
+    """
+
+    help = "Пересчитывает записи о важных задачах по таблице задач."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Только проверить записи о важных задачах, не изменяя их.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            inconsistent = get_inconsistent_important_tasks()
+            for pk, recorded, actual in inconsistent:
+                self.stdout.write(f"{pk}: записано {recorded}, фактически {actual}")
+            if inconsistent:
+                raise CommandError(
+                    f"Записи о важных задачах расходятся у {len(inconsistent)} задач."
+                )
+            self.stdout.write(
+                self.style.SUCCESS("Записи о важных задачах согласованы.")
+            )
+            return
+
+        created = refresh_important_tasks()
+        self.stdout.write(self.style.SUCCESS(f"Найдено {created} важных задач."))
@@ -0,0 +1,32 @@
+from django.core.management import BaseCommand, CommandError
+
+from tasks.services import get_inconsistent_paths, rebuild_paths
+
+
+class Command(BaseCommand):
+    """
+    Команда пересчета путей к задачам в дереве задач.
+    """
+
+    help = "Пересчитывает пути к задачам и уровни вложенности задач."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Только проверить пути к задачам, не изменяя их.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            inconsistent = get_inconsistent_paths()
+            for task in inconsistent.iterator(chunk_size=2000):
+                self.stdout.write(f"{task.pk}: {task.path!r}, уровень {task.depth}")
+            count = inconsistent.count()
+            if count:
+                raise CommandError(f"Пути к задачам расходятся у {count} задач.")
+            self.stdout.write(self.style.SUCCESS("Пути к задачам согласованы."))
+            return
+
+        updated = rebuild_paths()
+        self.stdout.write(self.style.SUCCESS(f"Пересчитаны пути к {updated} задачам."))
@@ -0,0 +1,40 @@
+from django.core.management import BaseCommand, CommandError
+
+from tasks.services import get_inconsistent_workload, refresh_workload
+
+
+class Command(BaseCommand):
+    """
+    Команда пересчета счетчиков задач сотрудников.
+    """
+
+    help = "Пересчитывает счетчики задач сотрудников по таблице задач."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Только проверить счетчики, не изменяя их.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            inconsistent = get_inconsistent_workload()
+            for employee in inconsistent:
+                self.stdout.write(
+                    f"{employee}: "
+                    f"новые {employee.new_tasks_count} != {employee.actual_new_tasks_count}, "
+                    f"активные {employee.active_tasks_count} != {employee.actual_active_tasks_count}, "
+                    f"завершенные {employee.done_tasks_count} != {employee.actual_done_tasks_count}"
+                )
+            if inconsistent:
+                raise CommandError(
+                    f"Счетчики задач расходятся у {len(inconsistent)} сотрудников."
+                )
+            self.stdout.write(self.style.SUCCESS("Счетчики задач согласованы."))
+            return
+
+        updated = refresh_workload()
+        self.stdout.write(
+            self.style.SUCCESS(f"Пересчитаны счетчики задач {updated} сотрудников.")
+        )
@@ -0,0 +1,198 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from tasks.caching import EMPLOYEES_CACHE_SCOPE, TASKS_CACHE_SCOPE, invalidate
+from tasks.models import Employee, Task
+from tasks.serializers import BULK_BATCH_SIZE
+from tasks.services import refresh_important_tasks, refresh_workload
+
+LAST_NAMES = (
+    "Иванов",
+    "Петров",
+    "Сидоров",
+    "Кузнецов",
+    "Смирнов",
+    "Попов",
+    "Васильев",
+    "Соколов",
+    "Михайлов",
+    "Новиков",
+    "Федоров",
+    "Морозов",
+)
+FIRST_NAMES = ("Иван", "Петр", "Сергей", "Алексей", "Дмитрий", "Андрей", "Михаил")
+FEMALE_FIRST_NAMES = ("Анна", "Мария", "Елена", "Ольга", "Наталья", "Татьяна")
+PATRONYMICS = (
+    "Иванович",
+    "Петрович",
+    "Сергеевич",
+    "Алексеевич",
+    "Дмитриевич",
+    "Андреевич",
+    "Николаевич",
+    "Михайлович",
+)
+POSITIONS = (
+    "Разработчик",
+    "Ведущий разработчик",
+    "Тестировщик",
+    "Аналитик",
+    "Дизайнер",
+    "Менеджер проекта",
+)
+
+# Доля задач без исполнителя
+UNASSIGNED_SHARE = 0.2
+# Доля завершенных задач среди задач с исполнителем
+DONE_SHARE = 0.3
+# Максимальный запас срока исполнения задачи относительно родительской, в днях
+MAX_DEADLINE_OFFSET = 30
+
+
+def generate_name(rng):
+    """
+    Возвращает случайное ФИО, проходящее проверку NameValidator.
+    """
+    last_name = rng.choice(LAST_NAMES)
+    patronymic = rng.choice(PATRONYMICS)
+    if rng.random() < 0.5:
+        # Женские фамилия и отчество: Иванова, Ивановна
+        first_name = rng.choice(FEMALE_FIRST_NAMES)
+        return f"{last_name}а {first_name} {patronymic[:-2]}на"
+    return f"{last_name} {rng.choice(FIRST_NAMES)} {patronymic}"
+
+
+class Command(BaseCommand):
+    """
+    Команда заполнения БД синтетическими сотрудниками и лесом задач
+    для нагрузочного тестирования.
+
+    Каждая корневая задача образует дерево заданной глубины, в котором
+    у каждой задачи, кроме задач последнего уровня, одинаковое количество
+    зависимых задач. Задачи создаются по уровням дерева запросами bulk_create
+    с вычисленными путями, после чего пересчитываются счетчики задач
+    сотрудников и записи о важных задачах. Данные детерминированы
+    значением --seed.
+    """
+
+    help = "Заполняет БД синтетическими сотрудниками и деревьями задач."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--employees",
+            type=int,
+            default=1000,
+            help="Количество сотрудников. По умолчанию 1000.",
+        )
+        parser.add_argument(
+            "--roots",
+            type=int,
+            default=1000,
+            help="Количество корневых задач. По умолчанию 1000.",
+        )
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=3,
+            help="Уровень вложенности задач последнего уровня. По умолчанию 3.",
+        )
+        parser.add_argument(
+            "--children",
+            type=int,
+            default=3,
+            help="Количество зависимых задач у каждой задачи. По умолчанию 3.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Начальное значение генератора случайных чисел. По умолчанию 0.",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Удалить существующие задачи и сотрудников перед заполнением.",
+        )
+
+    def handle(self, *args, **options):
+        for name in ("employees", "roots", "depth", "children"):
+            if options[name] < 0:
+                raise CommandError(f"Значение --{name} не может быть отрицательным.")
+        if options["depth"] > Task.MAX_DEPTH:
+            raise CommandError(
+                f"Значение --depth не может быть больше {Task.MAX_DEPTH}."
+            )
+        self.verbosity = options["verbosity"]
+        rng = random.Random(options["seed"])
+        started = time.monotonic()
+        with transaction.atomic():
+            if options["clear"]:
+                Task.objects.all().delete()
+                Employee.objects.all().delete()
+            employees = Employee.objects.bulk_create(
+                (
+                    Employee(name=generate_name(rng), position=rng.choice(POSITIONS))
+                    for _ in range(options["employees"])
+                ),
+                batch_size=BULK_BATCH_SIZE,
+            )
+            tasks_count = self.create_tasks(
+                rng,
+                [employee.pk for employee in employees],
+                options["roots"],
+                options["depth"],
+                options["children"],
+            )
+            refresh_workload()
+            refresh_important_tasks()
+        invalidate(TASKS_CACHE_SCOPE)
+        invalidate(EMPLOYEES_CACHE_SCOPE)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Создано сотрудников: {len(employees)}, задач: {tasks_count} "
+                f"за {time.monotonic() - started:.2f} с."
+            )
+        )
+
+    def create_tasks(self, rng, employee_ids, roots, depth, children):
+        """
+        Создает деревья задач по уровням. Возвращает количество задач.
+        """
+        today = timezone.now().date()
+        parents = [None] * roots
+        created = 0
+        for level in range(depth + 1):
+            tasks = Task.objects.bulk_create(
+                (
+                    self.generate_task(rng, employee_ids, parent, today, level, index)
+                    for index, parent in enumerate(parents)
+                ),
+                batch_size=BULK_BATCH_SIZE,
+            )
+            created += len(tasks)
+            if self.verbosity > 1:
+                self.stdout.write(f"Уровень {level}: создано задач {len(tasks)}.")
+            parents = [task for task in tasks for _ in range(children)]
+        return created
+
+    def generate_task(self, rng, employee_ids, parent, today, level, index):
+        """
+        Возвращает новую задачу со случайными исполнителем, статусом
+        и сроком исполнения не раньше срока исполнения родительской задачи.
+        """
+        deadline = parent.deadline if parent else today
+        task = Task(
+            title=f"Задача {level}-{index}",
+            parent_task=parent,
+            deadline=deadline + timedelta(days=rng.randint(1, MAX_DEADLINE_OFFSET)),
+        )
+        if employee_ids and rng.random() >= UNASSIGNED_SHARE:
+            task.executor_id = rng.choice(employee_ids)
+            task.status = "DONE" if rng.random() < DONE_SHARE else "IN_PROGRESS"
+        task.set_path()
+        return task
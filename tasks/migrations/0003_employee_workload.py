@@ -0,0 +1,73 @@
+# Generated by Django 4.2 on 2026-10-18 19:23
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+WORKLOAD_FIELDS = {
+    "NEW": "new_tasks_count",
+    "IN_PROGRESS": "active_tasks_count",
+    "DONE": "done_tasks_count",
+}
+
+
+def fill_workload(apps, schema_editor):
+    """
+    Заполняет счетчики задач существующих сотрудников.
+    """
+    Employee = apps.get_model("tasks", "Employee")
+    Task = apps.get_model("tasks", "Task")
+    Employee.objects.update(
+        **{
+            field: Coalesce(
+                Subquery(
+                    Task.objects.filter(executor=OuterRef("pk"), status=status)
+                    .order_by()
+                    .values("executor")
+                    .annotate(count=Count("pk"))
+                    .values("count"),
+                    output_field=IntegerField(),
+                ),
+                0,
+            )
+            for status, field in WORKLOAD_FIELDS.items()
+        }
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0002_alter_task_executor"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employee",
+            name="active_tasks_count",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="Количество активных задач"
+            ),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="done_tasks_count",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="Количество завершенных задач"
+            ),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="new_tasks_count",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="Количество новых задач"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(
+                fields=["-active_tasks_count", "name"], name="employee_active_tasks_idx"
+            ),
+        ),
+        migrations.RunPython(fill_workload, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2 on 2026-10-18 19:33
+
+from django.db import migrations, models
+from django.db.models import CharField, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Concat
+
+
+def fill_paths(apps, schema_editor):
+    """
+    Заполняет пути к существующим задачам по уровням дерева задач.
+    """
+    Task = apps.get_model("tasks", "Task")
+    parent_task = Task.objects.filter(pk=OuterRef("parent_task"))
+    level_ids = list(
+        Task.objects.filter(parent_task__isnull=True).values_list("pk", flat=True)
+    )
+    while level_ids:
+        next_level_ids = []
+        for start in range(0, len(level_ids), 900):
+            children = Task.objects.filter(parent_task__in=level_ids[start : start + 900])
+            children.update(
+                path=Subquery(
+                    parent_task.annotate(
+                        subtree_path=Concat("path", Cast("pk", CharField()), Value("/"))
+                    ).values("subtree_path")
+                ),
+                depth=Subquery(parent_task.values("depth")) + 1,
+            )
+            next_level_ids.extend(children.values_list("pk", flat=True))
+        level_ids = next_level_ids
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0005_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="depth",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Уровень вложенности"
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="path",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Идентификаторы родительских задач от корневой, разделенные '/'",
+                max_length=1024,
+                verbose_name="Путь к задаче",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["path"], name="task_path_idx", opclasses=["varchar_pattern_ops"]
+            ),
+        ),
+        migrations.RunPython(fill_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2 on 2026-10-18 19:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def fill_important_tasks(apps, schema_editor):
+    """
+    Заполняет записи о важных задачах по существующим задачам.
+    """
+    Task = apps.get_model("tasks", "Task")
+    ImportantTaskSnapshot = apps.get_model("tasks", "ImportantTaskSnapshot")
+    tasks = (
+        Task.objects.filter(status="NEW")
+        .annotate(
+            active_subtasks_count=Count("task", filter=Q(task__status="IN_PROGRESS"))
+        )
+        .filter(active_subtasks_count__gt=0)
+        .values_list("pk", "active_subtasks_count")
+    )
+    ImportantTaskSnapshot.objects.bulk_create(
+        (
+            ImportantTaskSnapshot(task_id=pk, active_subtasks_count=count)
+            for pk, count in tasks.iterator(chunk_size=2000)
+        ),
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0006_task_path"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportantTaskSnapshot",
+            fields=[
+                (
+                    "task",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="important_snapshot",
+                        serialize=False,
+                        to="tasks.task",
+                        verbose_name="Задача",
+                    ),
+                ),
+                (
+                    "active_subtasks_count",
+                    models.PositiveIntegerField(
+                        verbose_name="Количество зависимых задач в работе"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Важная задача",
+                "verbose_name_plural": "Важные задачи",
+            },
+        ),
+        migrations.RunPython(fill_important_tasks, migrations.RunPython.noop),
+    ]
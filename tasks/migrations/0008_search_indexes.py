@@ -0,0 +1,46 @@
+# Generated by Django 4.2 on 2026-10-18 19:52
+
+from django.db import migrations
+
+# Триграммные индексы для поиска по подстроке (icontains): Django сравнивает
+# UPPER("поле"::text) LIKE UPPER(<шаблон>), поэтому индексируется то же выражение
+SEARCH_INDEXES = {
+    "task_title_trgm_idx": ("tasks_task", "title"),
+    "employee_name_trgm_idx": ("tasks_employee", "name"),
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    """
+    Создает триграммные индексы в PostgreSQL. В других СУБД поиск выполняется
+    без индексов.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, (table, column) in SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    """
+    Удаляет триграммные индексы в PostgreSQL.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_important_task_snapshot"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
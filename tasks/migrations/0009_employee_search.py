@@ -0,0 +1,65 @@
+# Generated by Django 4.2 on 2026-10-18 19:58
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Конфигурация полнотекстового поиска по ФИО сотрудников
+SEARCH_CONFIG = "pg_catalog.russian"
+
+
+def create_search_trigger(apps, schema_editor):
+    """
+    Создает в PostgreSQL триггер, поддерживающий поисковый вектор ФИО
+    при любой записи сотрудника (в том числе bulk_create и update),
+    GIN-индекс по вектору и заполняет вектор существующих сотрудников.
+    В других СУБД поиск выполняется без вектора.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE TRIGGER employee_search_vector_update "
+        "BEFORE INSERT OR UPDATE OF name ON tasks_employee "
+        "FOR EACH ROW EXECUTE PROCEDURE "
+        f"tsvector_update_trigger(search_vector, '{SEARCH_CONFIG}', name)"
+    )
+    schema_editor.execute(
+        "UPDATE tasks_employee "
+        f"SET search_vector = to_tsvector('{SEARCH_CONFIG}', name)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS employee_search_idx "
+        "ON tasks_employee USING gin (search_vector)"
+    )
+
+
+def drop_search_trigger(apps, schema_editor):
+    """
+    Удаляет триггер и индекс поискового вектора в PostgreSQL.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS employee_search_idx")
+    schema_editor.execute(
+        "DROP TRIGGER IF EXISTS employee_search_vector_update ON tasks_employee"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0008_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employee",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Поддерживается триггером PostgreSQL при сохранении сотрудника",
+                null=True,
+                verbose_name="Поисковый вектор ФИО",
+            ),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
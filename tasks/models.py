@@ -1,4 +1,10 @@
+from functools import reduce
+from operator import or_
+
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import F, Max, Q, Value
+from django.db.models.functions import Concat, Substr
 
 NULLABLE = {"blank": True, "null": True}
 
@@ -10,15 +16,59 @@ class Employee(models.Model):
 
     name = models.CharField(max_length=255, verbose_name="ФИО")
     position = models.CharField(max_length=255, verbose_name="Должность")
+    new_tasks_count = models.PositiveIntegerField(
+        default=0, verbose_name="Количество новых задач"
+    )
+    active_tasks_count = models.PositiveIntegerField(
+        default=0, verbose_name="Количество активных задач"
+    )
+    done_tasks_count = models.PositiveIntegerField(
+        default=0, verbose_name="Количество завершенных задач"
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        verbose_name="Поисковый вектор ФИО",
+        help_text="Поддерживается триггером PostgreSQL при сохранении сотрудника",
+    )
+
+    # Счетчики задач сотрудника по статусам задач
+    WORKLOAD_FIELDS = {
+        "NEW": "new_tasks_count",
+        "IN_PROGRESS": "active_tasks_count",
+        "DONE": "done_tasks_count",
+    }
 
     class Meta:
         verbose_name = "Сотрудник"
         verbose_name_plural = "Сотрудники"
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["name", "id"], name="employee_name_id_idx"),
+            models.Index(
+                fields=["-active_tasks_count", "name"],
+                name="employee_active_tasks_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.position})"
 
+    def save(self, *args, **kwargs):
+        """
+        Сохраняет сотрудника без счетчиков задач, если поля для сохранения
+        не указаны явно: счетчики изменяются запросами при изменении задач,
+        и значения в загруженном ранее объекте могут быть устаревшими.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.WORKLOAD_FIELDS.values()
+            ]
+        super().save(*args, **kwargs)
+
 
 class Task(models.Model):
     """
@@ -49,11 +99,235 @@ class Task(models.Model):
         default="NEW",
         verbose_name="Статус задачи",
     )
+    path = models.CharField(
+        max_length=1024,
+        default="",
+        blank=True,
+        editable=False,
+        verbose_name="Путь к задаче",
+        help_text="Идентификаторы родительских задач от корневой, разделенные '/'",
+    )
+    depth = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Уровень вложенности"
+    )
+
+    # Поля, значения которых запоминаются при загрузке задачи из БД
+    # для отслеживания их изменения при сохранении
+    TRACKED_FIELDS = ("executor_id", "status", "parent_task_id", "path", "depth")
+    # Максимальный уровень вложенности задачи: каждый уровень добавляет к пути
+    # не более 20 символов (идентификатор до 19 цифр и '/'), поэтому путь задачи
+    # максимального уровня вложенности умещается в поле path
+    MAX_DEPTH = 50
 
     class Meta:
         verbose_name = "Задача"
         verbose_name_plural = "Задачи"
         ordering = ["-deadline"]
+        indexes = [
+            models.Index(fields=["-deadline", "id"], name="task_deadline_id_idx"),
+            models.Index(
+                fields=["executor", "status"], name="task_executor_status_idx"
+            ),
+            models.Index(
+                fields=["parent_task", "status"], name="task_parent_status_idx"
+            ),
+            models.Index(
+                fields=["parent_task", "executor"],
+                condition=models.Q(status="IN_PROGRESS"),
+                name="task_in_progress_idx",
+            ),
+            models.Index(
+                fields=["path"], opclasses=["varchar_pattern_ops"], name="task_path_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} до {self.deadline} ({self.status})"
+
+    def set_status_by_executor(self):
+        """
+        Устанавливает статус "В работе" новой задаче при назначении исполнителя.
+        Возвращает True, если статус изменен.
+        """
+        if self.executor_id and self.status == "NEW":
+            self.status = "IN_PROGRESS"
+            return True
+        return False
+
+    @property
+    def subtree_path(self):
+        """
+        Возвращает префикс пути зависимых задач.
+        """
+        return f"{self.path}{self.pk}/"
+
+    @property
+    def ancestor_ids(self):
+        """
+        Возвращает идентификаторы родительских задач, начиная с корневой.
+        """
+        return [int(pk) for pk in self.path.split("/") if pk]
+
+    def get_descendants(self):
+        """
+        Возвращает все зависимые задачи любой вложенности.
+        """
+        return Task.objects.filter(path__startswith=self.subtree_path)
+
+    def get_subtree_height(self):
+        """
+        Возвращает количество уровней зависимых задач под задачей.
+        """
+        return self.get_subtree_heights([self])[self.pk]
+
+    @staticmethod
+    def get_subtree_heights(tasks):
+        """
+        Возвращает количество уровней зависимых задач под каждой из задач
+        одним запросом.
+        """
+        if not tasks:
+            return {}
+        result = Task.objects.filter(
+            reduce(or_, (Q(path__startswith=task.subtree_path) for task in tasks))
+        ).aggregate(
+            **{
+                f"depth_{task.pk}": Max(
+                    "depth", filter=Q(path__startswith=task.subtree_path)
+                )
+                for task in tasks
+            }
+        )
+        return {
+            task.pk: max((result[f"depth_{task.pk}"] or 0) - task.depth, 0)
+            for task in tasks
+        }
+
+    def get_ancestors(self):
+        """
+        Возвращает все родительские задачи.
+        """
+        return Task.objects.filter(pk__in=self.ancestor_ids)
+
+    def set_path(self):
+        """
+        Вычисляет путь к задаче и уровень вложенности по родительской задаче.
+        """
+        parent_task = self.parent_task
+        if parent_task is None:
+            self.path, self.depth = "", 0
+        else:
+            self.path = parent_task.subtree_path
+            self.depth = parent_task.depth + 1
+
+    def move_descendants(self, old_subtree_path, old_depth):
+        """
+        Переносит зависимые задачи вслед за задачей, сменившей родительскую задачу.
+        """
+        if old_subtree_path == self.subtree_path:
+            return
+        Task.objects.filter(path__startswith=old_subtree_path).update(
+            path=Concat(
+                Value(self.subtree_path), Substr("path", len(old_subtree_path) + 1)
+            ),
+            depth=F("depth") + (self.depth - old_depth),
+        )
+
+    def refresh_path(self):
+        """
+        Пересчитывает путь к задаче по ее текущей родительской задаче в БД
+        и переносит зависимые задачи. Используется после пакетного изменения
+        родительских задач, выполняемого без вызова save().
+        """
+        self.refresh_from_db(fields=["parent_task", "path", "depth"])
+        old_subtree_path, old_depth = self.subtree_path, self.depth
+        self.set_path()
+        Task.objects.filter(pk=self.pk).update(path=self.path, depth=self.depth)
+        self.move_descendants(old_subtree_path, old_depth)
+        self._loaded_state = self.get_current_state()
+
+    def get_current_state(self):
+        """
+        Возвращает текущие значения отслеживаемых полей задачи.
+        """
+        return {field: getattr(self, field) for field in self.TRACKED_FIELDS}
+
+    def get_loaded_state(self):
+        """
+        Возвращает значения отслеживаемых полей задачи на момент загрузки из БД
+        или None для новой задачи.
+        """
+        if self._state.adding:
+            return None
+        if not hasattr(self, "_loaded_state"):
+            self._loaded_state = (
+                Task.objects.filter(pk=self.pk).values(*self.TRACKED_FIELDS).first()
+            )
+        return self._loaded_state
+
+    def save(self, *args, **kwargs):
+        """
+        Сохраняет задачу, поддерживая путь к задаче и к ее зависимым задачам
+        при создании задачи и смене родительской задачи.
+        """
+        loaded_state = self.get_loaded_state()
+        moved = (
+            loaded_state is None
+            or loaded_state["parent_task_id"] != self.parent_task_id
+        )
+        if moved:
+            self.set_path()
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "path", "depth"}
+        super().save(*args, **kwargs)
+        if moved and loaded_state is not None:
+            self.move_descendants(
+                f"{loaded_state['path']}{self.pk}/", loaded_state["depth"]
+            )
+        self._loaded_state = self.get_current_state()
+
+    def refresh_from_db(self, *args, **kwargs):
+        """
+        Перезагружает задачу из БД, сбрасывая запомненные значения
+        отслеживаемых полей.
+        """
+        super().refresh_from_db(*args, **kwargs)
+        self.__dict__.pop("_loaded_state", None)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Запоминает значения отслеживаемых полей задачи на момент загрузки из БД.
+        """
+        instance = super().from_db(db, field_names, values)
+        if all(field in instance.__dict__ for field in cls.TRACKED_FIELDS):
+            instance._loaded_state = instance.get_current_state()
+        return instance
+
+
+class ImportantTaskSnapshot(models.Model):
+    """
+    Модель записи о важной задаче: новой задаче, от которой зависят
+    задачи, взятые в работу.
+
+    Записи поддерживаются при изменении статуса и родительской задачи задач,
+    поэтому список важных задач выбирается без подсчета зависимых задач.
+    """
+
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="important_snapshot",
+        verbose_name="Задача",
+    )
+    active_subtasks_count = models.PositiveIntegerField(
+        verbose_name="Количество зависимых задач в работе"
+    )
+
+    class Meta:
+        verbose_name = "Важная задача"
+        verbose_name_plural = "Важные задачи"
+
+    def __str__(self):
+        return f"{self.task_id}: {self.active_subtasks_count}"
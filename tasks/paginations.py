@@ -1,7 +1,237 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import b64decode, b64encode
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class CustomPagination(PageNumberPagination):
     page_size = 5
     page_size_query_param = "page_size"
     max_page_size = 10
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Асинхронный вариант paginate_queryset на асинхронном API ORM.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number, message=str(exc)
+                )
+            )
+        self.page.object_list = [item async for item in self.page.object_list]
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return list(self.page)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Постраничный вывод с оценкой количества записей по плану запроса
+    PostgreSQL вместо COUNT(*), требующего чтения всех отобранных записей.
+    Точный подсчет выполняется, если оценка меньше EXACT_COUNT_LIMIT
+    или СУБД отлична от PostgreSQL.
+    """
+
+    EXACT_COUNT_LIMIT = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if connections[queryset.db].vendor == "postgresql":
+            plan = queryset.order_by().explain(format="json")
+            estimate = json.loads(plan)[0]["Plan"]["Plan Rows"]
+            if estimate >= self.EXACT_COUNT_LIMIT:
+                return int(estimate)
+        return super().count
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Постраничный вывод по ключу (keyset pagination).
+
+    Курсор хранит значения всех полей сортировки последней записи страницы,
+    поэтому следующая страница выбирается условием по индексу без OFFSET
+    и без подсчета общего количества записей.
+    """
+
+    page_size = 5
+    page_size_query_param = "page_size"
+    max_page_size = 10
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request)
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Асинхронный вариант paginate_queryset на асинхронном API ORM.
+        """
+        queryset = self.get_page_queryset(queryset, request)
+        return self.set_page([item async for item in queryset])
+
+    def get_page_queryset(self, queryset, request):
+        """
+        Возвращает запрос записей страницы с одной лишней записью,
+        показывающей наличие следующих записей.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.model = queryset.model
+
+        self.cursor = self.decode_cursor(request)
+        self.reverse = bool(self.cursor and self.cursor["reverse"])
+        ordering = self.get_directed_ordering()
+
+        queryset = queryset.order_by(*ordering)
+        if self.cursor:
+            queryset = queryset.filter(
+                self.get_keyset_filter(ordering, self.cursor["key"])
+            )
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, results):
+        """
+        Запоминает записи страницы и наличие соседних страниц.
+        """
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if self.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+        return self.page
+
+    def get_directed_ordering(self):
+        """
+        Возвращает сортировку с учетом направления обхода страниц.
+        """
+        if not self.reverse:
+            return self.ordering
+        return tuple(
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        )
+
+    def get_keyset_filter(self, ordering, key):
+        """
+        Возвращает условие выбора записей, следующих за ключом, в виде
+        f1 <= v1 AND (f1 < v1 OR (f1 = v1 AND <условие по остальным полям>)),
+        позволяющем использовать составной индекс для поиска по диапазону.
+        """
+        field, *rest = ordering
+        value, *rest_key = key
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        if not rest:
+            return Q(**{f"{name}__{lookup}": value})
+        return Q(**{f"{name}__{lookup}e": value}) & (
+            Q(**{f"{name}__{lookup}": value})
+            | Q(**{name: value}) & self.get_keyset_filter(rest, rest_key)
+        )
+
+    def get_key(self, instance):
+        """
+        Возвращает значения полей сортировки записи.
+        """
+        return [
+            self.model._meta.get_field(field.lstrip("-")).value_to_string(instance)
+            for field in self.ordering
+        ]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(
+            {"reverse": False, "key": self.get_key(self.page[-1])}
+        )
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(
+            {"reverse": True, "key": self.get_key(self.page[0])}
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            cursor = json.loads(b64decode(encoded.encode("ascii")).decode("utf-8"))
+            key = [
+                self.model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, cursor["key"], strict=True)
+            ]
+            return {"reverse": bool(cursor["reverse"]), "key": key}
+        except (TypeError, ValueError, KeyError, UnicodeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, cursor):
+        encoded = b64encode(
+            json.dumps(cursor, separators=(",", ":")).encode("utf-8")
+        ).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+
+class TaskKeysetPagination(KeysetPagination):
+    ordering = ("-deadline", "id")
+
+
+class EmployeeKeysetPagination(KeysetPagination):
+    ordering = ("name", "id")
+
+
+class BusyEmployeeKeysetPagination(KeysetPagination):
+    ordering = ("-active_tasks_count", "name", "id")
+
+
+class KeysetPaginationMixin:
+    """
+    Примесь контроллера, позволяющая выбрать постраничный вывод по ключу
+    параметром запроса pagination=cursor (или передачей курсора).
+    """
+
+    keyset_pagination_class = None
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and self.keyset_pagination_requested():
+            self._paginator = self.keyset_pagination_class()
+        return super().paginator
+
+    def keyset_pagination_requested(self):
+        """
+        Проверяет, запрошен ли постраничный вывод по ключу.
+        """
+        if self.keyset_pagination_class is None:
+            return False
+        query_params = self.request.query_params
+        return (
+            query_params.get("pagination") == "cursor"
+            or self.keyset_pagination_class.cursor_query_param in query_params
+        )
@@ -1,8 +1,92 @@
-from rest_framework.fields import SerializerMethodField
-from rest_framework.serializers import ModelSerializer
+from django.db import transaction
+from django.db.models import Q
+from rest_framework.fields import IntegerField, SerializerMethodField
+from rest_framework.serializers import (ListSerializer, ModelSerializer,
+                                        ValidationError)
 
+from tasks.caching import TASKS_CACHE_SCOPE, invalidate
 from tasks.models import Employee, Task
-from tasks.validators import DeadlineValidator, NameValidator
+from tasks.services import (ExecutorRecommender, refresh_important_tasks,
+                            refresh_workload)
+from tasks.validators import (DEADLINE_AFTER_DESCENDANTS_MESSAGE,
+                              DEADLINE_BEFORE_PARENT_MESSAGE,
+                              PARENT_TASK_CYCLE_MESSAGE, TASK_DEPTH_MESSAGE,
+                              DeadlineValidator, NameValidator)
+
+# Количество задач, записываемых в БД одним запросом при пакетных операциях
+BULK_BATCH_SIZE = 500
+
+
+def get_existing_executor_ids(items):
+    """
+    Возвращает идентификаторы существующих сотрудников,
+    указанных исполнителями задач пакета.
+    """
+    return set(
+        Employee.objects.filter(
+            pk__in={item["executor_id"] for item in items if item.get("executor_id")}
+        ).values_list("pk", flat=True)
+    )
+
+
+def get_moved_ancestors(task_id, new_parents, tasks):
+    """
+    Возвращает задачи пакета, меняющие родительскую задачу, среди будущих
+    родительских задач задачи или None, если пакет образует цикл зависимостей.
+    Родительские задачи неизменяемых задач определяются по их путям.
+    """
+    moved_ancestors = []
+    ancestor_id = new_parents[task_id]
+    while ancestor_id is not None:
+        if ancestor_id == task_id or ancestor_id in moved_ancestors:
+            return None
+        if ancestor_id in new_parents:
+            moved_ancestors.append(ancestor_id)
+            ancestor_id = new_parents[ancestor_id]
+            continue
+        next_ancestor_id = None
+        for pk in reversed(tasks[ancestor_id].ancestor_ids):
+            if pk == task_id:
+                return None
+            if pk in new_parents:
+                next_ancestor_id = pk
+                break
+        ancestor_id = next_ancestor_id
+    return moved_ancestors
+
+
+def get_new_depth(task_id, new_parents, tasks):
+    """
+    Возвращает уровень вложенности задачи после смены родительских задач
+    задачами пакета. Пакет не должен образовывать цикл зависимостей
+    (см. get_moved_ancestors).
+    """
+    depth = 0
+    while True:
+        if task_id in new_parents:
+            task_id = new_parents[task_id]
+            if task_id is None:
+                return depth
+            depth += 1
+            continue
+        ancestor_ids = tasks[task_id].ancestor_ids
+        for level in reversed(range(len(ancestor_ids))):
+            if ancestor_ids[level] in new_parents:
+                depth += len(ancestor_ids) - level
+                task_id = ancestor_ids[level]
+                break
+        else:
+            return depth + len(ancestor_ids)
+
+
+def get_executor_errors(item, executor_ids):
+    """
+    Возвращает ошибку ссылки задачи пакета на несуществующего исполнителя.
+    """
+    executor_id = item.get("executor_id")
+    if executor_id is not None and executor_id not in executor_ids:
+        return {"executor": [f"Сотрудник {executor_id} не найден."]}
+    return {}
 
 
 class EmployeeSerializer(ModelSerializer):
@@ -12,7 +96,7 @@ class EmployeeSerializer(ModelSerializer):
 
     class Meta:
         model = Employee
-        fields = "__all__"
+        fields = ("id", "name", "position")
         validators = [
             NameValidator(
                 field="name",
@@ -26,11 +110,11 @@ class BusyEmployeeListSerializer(ModelSerializer):
     """
 
     tasks = SerializerMethodField()
-    task_count = SerializerMethodField()
+    task_count = IntegerField(source="active_tasks_count", read_only=True)
 
     class Meta:
         model = Employee
-        fields = "__all__"
+        fields = ("id", "name", "position", "tasks", "task_count")
         validators = [
             NameValidator(
                 field="name",
@@ -41,16 +125,7 @@ class BusyEmployeeListSerializer(ModelSerializer):
         """
         Возвращает список активных заданий сотрудника.
         """
-        return [
-            task.title
-            for task in Task.objects.filter(executor=employee, status="IN_PROGRESS")
-        ]
-
-    def get_task_count(self, employee):
-        """
-        Возвращает количество активных заданий сотрудника.
-        """
-        return Task.objects.filter(executor=employee, status="IN_PROGRESS").count()
+        return [task.title for task in employee.active_tasks]
 
 
 class TaskSerializer(ModelSerializer):
@@ -60,12 +135,22 @@ class TaskSerializer(ModelSerializer):
 
     class Meta:
         model = Task
-        fields = "__all__"
+        exclude = ("path", "depth")
         validators = [
             DeadlineValidator(field="deadline"),
         ]
         read_only_fields = ("status",)
 
+    def create(self, validated_data):
+        """
+        Создает задачу одним запросом INSERT,
+        устанавливая статус "В работе" при назначении исполнителя.
+        """
+        task = Task(**validated_data)
+        task.set_status_by_executor()
+        task.save()
+        return task
+
 
 class TaskUpdateSerializer(ModelSerializer):
     """
@@ -74,52 +159,366 @@ class TaskUpdateSerializer(ModelSerializer):
 
     class Meta:
         model = Task
-        fields = "__all__"
+        exclude = ("path", "depth")
         validators = [
             DeadlineValidator(field="deadline"),
         ]
 
+    def update(self, instance, validated_data):
+        """
+        Сохраняет только изменившиеся поля задачи одним запросом UPDATE.
+        Если при изменении задачи назначается исполнитель,
+        устанавливает статус "В работе".
+        """
+        update_fields = set()
+        for attr, value in validated_data.items():
+            if getattr(instance, attr) != value:
+                setattr(instance, attr, value)
+                update_fields.add(attr)
+        if instance.set_status_by_executor():
+            update_fields.add("status")
+        if update_fields:
+            instance.save(update_fields=update_fields)
+        return instance
 
-class ImportantTaskSerializer(ModelSerializer):
+
+class BulkTaskCreateListSerializer(ListSerializer):
     """
-    Сериализатор важной задачи.
+    Сериализатор пакетного создания задач.
     """
 
-    possible_executors = SerializerMethodField()
+    def to_internal_value(self, data):
+        """
+        Проверяет родительские задачи, уровни вложенности и исполнителей
+        всего пакета двумя запросами к БД.
+        """
+        items = super().to_internal_value(data)
+        parents = Task.objects.only("deadline", "path", "depth").in_bulk(
+            {item["parent_task_id"] for item in items if item.get("parent_task_id")}
+        )
+        executor_ids = get_existing_executor_ids(items)
+
+        errors = []
+        depths = []
+        for index, item in enumerate(items):
+            item_errors = get_executor_errors(item, executor_ids)
+            parent_task_id = item.get("parent_task_id")
+            parent_index = item.get("parent_index")
+            parent_deadline = None
+            depth = 0
+            if parent_task_id is not None and parent_index is not None:
+                item_errors["parent_index"] = [
+                    "Нельзя одновременно указывать parent_task и parent_index."
+                ]
+            elif parent_task_id is not None:
+                if parent_task_id in parents:
+                    parent_deadline = parents[parent_task_id].deadline
+                    depth = parents[parent_task_id].depth + 1
+                else:
+                    item_errors["parent_task"] = [
+                        f"Задача {parent_task_id} не найдена."
+                    ]
+            elif parent_index is not None:
+                if parent_index < index:
+                    parent_deadline = items[parent_index]["deadline"]
+                    depth = depths[parent_index] + 1
+                else:
+                    item_errors["parent_index"] = [
+                        "Родительская задача должна предшествовать зависимой в пакете."
+                    ]
+            if depth > Task.MAX_DEPTH:
+                field = "parent_task" if parent_task_id is not None else "parent_index"
+                item_errors[field] = [TASK_DEPTH_MESSAGE]
+            if parent_deadline and item["deadline"] < parent_deadline:
+                item_errors["deadline"] = [DEADLINE_BEFORE_PARENT_MESSAGE]
+            errors.append(item_errors)
+            depths.append(depth)
+
+        if any(errors):
+            raise ValidationError(errors)
+        self.parent_tasks = parents
+        return items
+
+    def create(self, validated_data):
+        """
+        Создает задачи пакета по уровням вложенности, чтобы задачи пакета
+        получили идентификаторы и пути до создания зависимых от них задач.
+        Задачам с исполнителем устанавливается статус "В работе".
+        """
+        tasks = []
+        parent_indexes = []
+        levels = []
+        for item in validated_data:
+            parent_index = item.pop("parent_index", None)
+            task = Task(**item)
+            task.set_status_by_executor()
+            tasks.append(task)
+            parent_indexes.append(parent_index)
+            levels.append(0 if parent_index is None else levels[parent_index] + 1)
+
+        with transaction.atomic():
+            for level in range(max(levels, default=-1) + 1):
+                level_tasks = []
+                for task, parent_index, task_level in zip(tasks, parent_indexes, levels):
+                    if task_level == level:
+                        if parent_index is not None:
+                            task.parent_task = tasks[parent_index]
+                        elif task.parent_task_id is not None:
+                            task.parent_task = self.parent_tasks[task.parent_task_id]
+                        task.set_path()
+                        level_tasks.append(task)
+                Task.objects.bulk_create(level_tasks, batch_size=BULK_BATCH_SIZE)
+            refresh_workload({task.executor_id for task in tasks if task.executor_id})
+            refresh_important_tasks(
+                {task.parent_task_id for task in tasks if task.status == "IN_PROGRESS"}
+            )
+        invalidate(TASKS_CACHE_SCOPE)
+        return tasks
+
+
+class BulkTaskCreateSerializer(ModelSerializer):
+    """
+    Сериализатор задачи для пакетного создания.
+    Родительская задача указывается идентификатором (parent_task)
+    или номером задачи в пакете, начиная с нуля (parent_index).
+    """
+
+    parent_task = IntegerField(source="parent_task_id", required=False, allow_null=True)
+    executor = IntegerField(source="executor_id", required=False, allow_null=True)
+    parent_index = IntegerField(
+        required=False, allow_null=True, min_value=0, write_only=True
+    )
 
     class Meta:
         model = Task
-        fields = ("title", "deadline", "possible_executors")
+        fields = (
+            "id",
+            "title",
+            "parent_task",
+            "parent_index",
+            "executor",
+            "deadline",
+            "status",
+        )
+        read_only_fields = ("status",)
+        validators = [
+            DeadlineValidator(field="deadline"),
+        ]
+        list_serializer_class = BulkTaskCreateListSerializer
 
-    def get_possible_executors(self, task):
+
+class TaskImportSerializer(BulkTaskCreateSerializer):
+    """
+    Сериализатор задачи для импорта из файла.
+    В отличие от пакетного создания, статус задачи принимается из файла.
+    """
+
+    class Meta(BulkTaskCreateSerializer.Meta):
+        read_only_fields = ()
+
+
+class BulkTaskUpdateListSerializer(ListSerializer):
+    """
+    Сериализатор пакетного изменения задач.
+    """
+
+    def to_internal_value(self, data):
         """
-        Возвращает имена сотрудников, кому можно назначить
-        задачу, не взятую в работу.
+        Загружает изменяемые задачи с текущими и новыми родительскими задачами
+        одним запросом, исполнителей - вторым, задачи, зависящие от задач
+        с увеличенным сроком исполнения, - третьим, и проверяет сроки
+        исполнения и отсутствие циклов с учетом изменений остальных задач пакета.
+        Для задач, опускаемых ниже по дереву, четвертым запросом проверяется
+        уровень вложенности их зависимых задач.
         """
+        items = super().to_internal_value(data)
+        task_ids = [item.get("id") for item in items]
+        tasks = Task.objects.filter(
+            Q(
+                pk__in=set(task_ids)
+                | {
+                    item["parent_task_id"]
+                    for item in items
+                    if item.get("parent_task_id")
+                }
+            )
+            | Q(task__pk__in=[task_id for task_id in task_ids if task_id])
+        ).in_bulk()
+        executor_ids = get_existing_executor_ids(items)
+        deadlines = {
+            item["id"]: item["deadline"]
+            for item in items
+            if item.get("id") in tasks and "deadline" in item
+        }
+        new_parents = {
+            item["id"]: item["parent_task_id"]
+            for item in items
+            if item.get("id") in tasks
+            and "parent_task_id" in item
+            and item["parent_task_id"] != tasks[item["id"]].parent_task_id
+        }
+        children_deadlines = {}
+        for parent_task_id, deadline in (
+            Task.objects.filter(
+                parent_task__in=[
+                    task_id
+                    for task_id, deadline in deadlines.items()
+                    if deadline > tasks[task_id].deadline
+                ]
+            )
+            .exclude(pk__in=[task_id for task_id in task_ids if task_id in tasks])
+            .values_list("parent_task_id", "deadline")
+        ):
+            children_deadlines[parent_task_id] = min(
+                deadline, children_deadlines.get(parent_task_id, deadline)
+            )
 
-        # Получаем сотрудников с наименьшим количеством задач на исполнении
-        employees = Employee.objects.all()
-        employees_task_count = {}
-        for employee in employees:
-            employees_task_count[employee.name] = employee.tasks.count()
+        errors = []
+        new_depths = {}
+        self.moved_ancestors = {}
+        for item in items:
+            item_errors = get_executor_errors(item, executor_ids)
+            task_id = item.get("id")
+            if task_id is None:
+                item_errors["id"] = ["Обязательное поле."]
+            elif task_id not in tasks:
+                item_errors["id"] = [f"Задача {task_id} не найдена."]
+            elif task_ids.count(task_id) > 1:
+                item_errors["id"] = ["Задача указана в пакете несколько раз."]
+            else:
+                task = tasks[task_id]
+                parent_task_id = item.get("parent_task_id", task.parent_task_id)
+                deadline = deadlines.get(task_id, task.deadline)
+                if parent_task_id is not None and parent_task_id not in tasks:
+                    item_errors["parent_task"] = [
+                        f"Задача {parent_task_id} не найдена."
+                    ]
+                elif task_id in new_parents:
+                    moved_ancestors = get_moved_ancestors(task_id, new_parents, tasks)
+                    if moved_ancestors is None:
+                        item_errors["parent_task"] = [PARENT_TASK_CYCLE_MESSAGE]
+                    else:
+                        new_depth = get_new_depth(task_id, new_parents, tasks)
+                        if new_depth > task.depth:
+                            new_depths[task_id] = new_depth
+                    self.moved_ancestors[task_id] = moved_ancestors
+                parent_deadline = None
+                if parent_task_id in tasks:
+                    parent_deadline = deadlines.get(
+                        parent_task_id, tasks[parent_task_id].deadline
+                    )
+                if parent_deadline and deadline < parent_deadline:
+                    item_errors["deadline"] = [DEADLINE_BEFORE_PARENT_MESSAGE]
+                elif deadline > children_deadlines.get(task_id, deadline):
+                    item_errors["deadline"] = [DEADLINE_AFTER_DESCENDANTS_MESSAGE]
+            errors.append(item_errors)
 
-        min_task_count = min(employees_task_count.values())
-        possible_executors = [
-            employee
-            for employee in employees_task_count
-            if employees_task_count[employee] == min_task_count
+        # Высота поддерева задачи, опускаемой ниже по дереву, берется по текущим
+        # путям и не учитывает зависимые задачи, уходящие из поддерева в пакете
+        heights = Task.get_subtree_heights([tasks[pk] for pk in new_depths])
+        for item, item_errors in zip(items, errors):
+            task_id = item.get("id")
+            if (
+                task_id in new_depths
+                and new_depths[task_id] + heights[task_id] > Task.MAX_DEPTH
+            ):
+                item_errors["parent_task"] = [TASK_DEPTH_MESSAGE]
+
+        if any(errors):
+            raise ValidationError(errors)
+        self.instance = [tasks[item["id"]] for item in items]
+        return items
+
+    def update(self, instance, validated_data):
+        """
+        Применяет изменения ко всем задачам пакета одним набором запросов UPDATE.
+        Задачам с исполнителем в статусе "Новая" устанавливается статус "В работе".
+        Пути задач, сменивших родительскую задачу, пересчитываются от верхних
+        уровней дерева к нижним.
+        """
+        fields = set()
+        executor_ids = set()
+        parent_task_ids = set()
+        for task, item in zip(instance, validated_data):
+            executor_ids.add(task.executor_id)
+            parent_task_ids.add(task.parent_task_id)
+            for attr, value in item.items():
+                if attr != "id":
+                    setattr(task, attr, value)
+                    fields.add(Task._meta.get_field(attr).name)
+            if task.set_status_by_executor():
+                fields.add("status")
+            executor_ids.add(task.executor_id)
+            parent_task_ids.add(task.parent_task_id)
+
+        moved_tasks = sorted(
+            (task for task in instance if task.pk in self.moved_ancestors),
+            key=lambda task: len(self.moved_ancestors[task.pk]),
+        )
+        with transaction.atomic():
+            if fields:
+                Task.objects.bulk_update(instance, fields, batch_size=BULK_BATCH_SIZE)
+            for task in moved_tasks:
+                task.refresh_path()
+            refresh_workload(executor_ids - {None})
+            if fields & {"status", "parent_task"}:
+                refresh_important_tasks(
+                    parent_task_ids | {task.pk for task in instance}
+                )
+        invalidate(TASKS_CACHE_SCOPE, [task.pk for task in instance])
+        return instance
+
+
+class BulkTaskUpdateSerializer(ModelSerializer):
+    """
+    Сериализатор задачи для пакетного изменения.
+    """
+
+    id = IntegerField()
+    parent_task = IntegerField(source="parent_task_id", required=False, allow_null=True)
+    executor = IntegerField(source="executor_id", required=False, allow_null=True)
+
+    class Meta:
+        model = Task
+        fields = ("id", "title", "parent_task", "executor", "deadline", "status")
+        validators = [
+            DeadlineValidator(field="deadline"),
         ]
+        list_serializer_class = BulkTaskUpdateListSerializer
+
+
+class ImportantTaskListSerializer(ListSerializer):
+    """
+    Сериализатор списка важных задач.
+    """
+
+    def to_representation(self, data):
+        """
+        Подбирает исполнителей сразу для всех важных задач списка.
+        """
+        tasks = list(data.all() if hasattr(data, "all") else data)
+        self.context["recommender"] = ExecutorRecommender(tasks)
+        return super().to_representation(tasks)
+
 
-        # Получаем количество задач исполнителя зависимой задачи
-        dependent_task = Task.objects.get(parent_task=task)
-        current_executor = dependent_task.executor
-        current_task_count = current_executor.tasks.count()
+class ImportantTaskSerializer(ModelSerializer):
+    """
+    Сериализатор важной задачи.
+    """
 
-        # Добавляем к списку исполнителя зависимой задачи, если его нет в списке,
-        # и ему назначено максимум на 2 задачи больше, чем у наименее загруженного сотрудника
+    possible_executors = SerializerMethodField()
 
-        if current_executor not in possible_executors:
-            if current_task_count <= min_task_count + 2:
-                possible_executors.append(current_executor.name)
+    class Meta:
+        model = Task
+        fields = ("title", "deadline", "possible_executors")
+        list_serializer_class = ImportantTaskListSerializer
 
-        return possible_executors
+    def get_possible_executors(self, task):
+        """
+        Возвращает имена сотрудников, кому можно назначить
+        задачу, не взятую в работу.
+        """
+        recommender = self.context.get("recommender")
+        if recommender is None:
+            recommender = ExecutorRecommender([task])
+        return recommender.get_possible_executors(task)
@@ -0,0 +1,369 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection, transaction
+from django.db.models import (CharField, Count, F, IntegerField, OuterRef, Q,
+                              Subquery, Value)
+from django.db.models.functions import Cast, Coalesce, Concat
+
+from tasks.models import Employee, ImportantTaskSnapshot, Task
+
+# Количество записей о важных задачах, записываемых в БД одним запросом
+IMPORTANT_TASKS_BATCH_SIZE = 2000
+
+# Конфигурация полнотекстового поиска по ФИО сотрудников
+# (совпадает с конфигурацией триггера поискового вектора)
+EMPLOYEE_SEARCH_CONFIG = "russian"
+
+# Слово поискового запроса: буквы и цифры
+SEARCH_TERM_PATTERN = re.compile(r"\w+")
+
+
+def get_workload_expressions():
+    """
+    Возвращает выражения для подсчета задач сотрудника по статусам
+    в виде {<счетчик сотрудника>: <подзапрос к задачам>}.
+    """
+    return {
+        field: Coalesce(
+            Subquery(
+                Task.objects.filter(executor=OuterRef("pk"), status=status)
+                .order_by()
+                .values("executor")
+                .annotate(count=Count("pk"))
+                .values("count"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+        for status, field in Employee.WORKLOAD_FIELDS.items()
+    }
+
+
+def refresh_workload(employee_ids=None):
+    """
+    Пересчитывает счетчики задач сотрудников одним запросом.
+    Если идентификаторы сотрудников не переданы, пересчитывает счетчики всех сотрудников.
+    Возвращает количество обновленных сотрудников.
+    """
+    employees = Employee.objects.all()
+    if employee_ids is not None:
+        employees = employees.filter(pk__in=employee_ids)
+    return employees.update(**get_workload_expressions())
+
+
+def get_inconsistent_workload():
+    """
+    Возвращает сотрудников, счетчики задач которых расходятся с таблицей задач.
+    """
+    expressions = get_workload_expressions()
+    employees = Employee.objects.annotate(
+        **{f"actual_{field}": expression for field, expression in expressions.items()}
+    )
+    return [
+        employee
+        for employee in employees.iterator(chunk_size=2000)
+        if any(
+            getattr(employee, field) != getattr(employee, f"actual_{field}")
+            for field in expressions
+        )
+    ]
+
+
+def get_important_tasks(task_ids=None):
+    """
+    Возвращает важные задачи с количеством зависимых задач в работе
+    в виде [(<id задачи>, <количество зависимых задач>)].
+    Если идентификаторы задач переданы, проверяются только эти задачи.
+    """
+    tasks = Task.objects.filter(status="NEW")
+    if task_ids is not None:
+        tasks = tasks.filter(pk__in=task_ids)
+    return (
+        tasks.annotate(
+            active_subtasks_count=Count("task", filter=Q(task__status="IN_PROGRESS"))
+        )
+        .filter(active_subtasks_count__gt=0)
+        .order_by()
+        .values_list("pk", "active_subtasks_count")
+    )
+
+
+def refresh_important_tasks(task_ids=None):
+    """
+    Пересчитывает записи о важных задачах для переданных задач: создает
+    или обновляет записи задач, остающихся важными, и удаляет записи
+    остальных задач. Записи обновляются вставкой с разрешением конфликтов,
+    поэтому одновременный пересчет одних и тех же задач не нарушает
+    уникальность записей.
+    Если идентификаторы задач не переданы, пересчитывает все записи.
+    Возвращает количество важных задач среди пересчитанных.
+    """
+    snapshots = ImportantTaskSnapshot.objects.all()
+    if task_ids is not None:
+        task_ids = set(task_ids) - {None}
+        if not task_ids:
+            return 0
+        snapshots = snapshots.filter(pk__in=task_ids)
+    important_tasks = get_important_tasks(task_ids)
+    with transaction.atomic():
+        saved = ImportantTaskSnapshot.objects.bulk_create(
+            (
+                ImportantTaskSnapshot(task_id=pk, active_subtasks_count=count)
+                for pk, count in important_tasks.iterator(
+                    chunk_size=IMPORTANT_TASKS_BATCH_SIZE
+                )
+            ),
+            batch_size=IMPORTANT_TASKS_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["task"],
+            update_fields=["active_subtasks_count"],
+        )
+        snapshots.exclude(pk__in=important_tasks.values("pk")).delete()
+    return len(saved)
+
+
+def get_inconsistent_important_tasks():
+    """
+    Возвращает расхождения записей о важных задачах с таблицей задач в виде
+    [(<id задачи>, <записанное количество>, <фактическое количество>)],
+    где отсутствие записи или важности задачи обозначается None.
+    """
+    expected = dict(get_important_tasks().iterator(chunk_size=2000))
+    actual = dict(
+        ImportantTaskSnapshot.objects.values_list(
+            "pk", "active_subtasks_count"
+        ).iterator(chunk_size=2000)
+    )
+    return [
+        (pk, actual.get(pk), expected.get(pk))
+        for pk in sorted(expected.keys() | actual.keys())
+        if actual.get(pk) != expected.get(pk)
+    ]
+
+
+class ExecutorRecommender:
+    """
+    Подбор исполнителей для важных задач.
+
+    Наименее загруженные сотрудники выбираются по счетчику активных задач
+    одним запросом, исполнители зависимых задач - еще одним, после чего
+    кандидаты для всех переданных задач определяются за один проход
+    без обращений к БД.
+    """
+
+    # Допустимое превышение количества активных задач исполнителя зависимой задачи
+    # над количеством задач наименее загруженного сотрудника
+    MAX_EXTRA_TASKS = 2
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+        self.recommendations = self._get_recommendations()
+
+    def _get_least_loaded(self):
+        """
+        Возвращает наименее загруженных сотрудников
+        в виде [(<id>, <ФИО>, <количество задач>)].
+        """
+        return list(
+            Employee.objects.filter(
+                active_tasks_count=Subquery(
+                    Employee.objects.order_by("active_tasks_count").values(
+                        "active_tasks_count"
+                    )[:1]
+                )
+            ).values_list("pk", "name", "active_tasks_count")
+        )
+
+    def _get_dependent_executors_queryset(self, max_task_count):
+        """
+        Возвращает запрос исполнителей зависимых задач, взятых в работу,
+        количество активных задач которых не превышает max_task_count,
+        в виде (<id важной задачи>, <id>, <ФИО>) с группировкой
+        по важной задаче и исполнителю.
+        """
+        return (
+            Task.objects.filter(
+                parent_task__in=[task.pk for task in self.tasks],
+                status="IN_PROGRESS",
+                executor__active_tasks_count__lte=max_task_count,
+            )
+            .order_by("parent_task_id", "executor_id")
+            .values_list("parent_task_id", "executor_id", "executor__name")
+            .distinct()
+        )
+
+    def _get_dependent_executors(self, max_task_count):
+        """
+        Возвращает исполнителей зависимых задач, взятых в работу, количество
+        активных задач которых не превышает max_task_count,
+        в виде {<id важной задачи>: [(<id>, <ФИО>), ...]}.
+        Исполнители всех зависимых задач выбираются одним запросом.
+        """
+        dependent_executors = {}
+        for parent_task_id, *executor in self._get_dependent_executors_queryset(
+            max_task_count
+        ):
+            dependent_executors.setdefault(parent_task_id, []).append(tuple(executor))
+        return dependent_executors
+
+    def _get_recommendations(self):
+        """
+        Возвращает имена рекомендованных исполнителей
+        в виде {<id важной задачи>: [<ФИО>, ...]}: сначала наименее загруженные
+        сотрудники, затем исполнители зависимых задач, не превышающие их
+        загрузку более чем на MAX_EXTRA_TASKS задач.
+        """
+        if not self.tasks:
+            return {}
+        least_loaded = self._get_least_loaded()
+        if not least_loaded:
+            return {task.pk: [] for task in self.tasks}
+
+        min_task_count = least_loaded[0][2]
+        least_loaded_ids = {pk for pk, _, _ in least_loaded}
+        least_loaded_names = [name for _, name, _ in least_loaded]
+        dependent_executors = self._get_dependent_executors(
+            min_task_count + self.MAX_EXTRA_TASKS
+        )
+
+        return {
+            task.pk: least_loaded_names
+            + [
+                name
+                for pk, name in dependent_executors.get(task.pk, [])
+                if pk not in least_loaded_ids
+            ]
+            for task in self.tasks
+        }
+
+    def get_possible_executors(self, task):
+        """
+        Возвращает имена сотрудников, кому можно назначить задачу.
+        """
+        return self.recommendations.get(task.pk, [])
+
+
+def get_subtree(task_id, max_depth):
+    """
+    Возвращает задачу и ее зависимые задачи до глубины max_depth
+    в порядке возрастания глубины. Глубина задачи относительно
+    переданной задачи доступна в атрибуте relative_depth.
+    """
+    task = Task.objects.filter(pk=task_id).first()
+    if task is None:
+        return []
+    tasks = [
+        task,
+        *task.get_descendants()
+        .filter(depth__lte=task.depth + max_depth)
+        .order_by("depth", "pk"),
+    ]
+    for subtask in tasks:
+        subtask.relative_depth = subtask.depth - task.depth
+    return tasks
+
+
+def get_ancestors(task_id, max_depth):
+    """
+    Возвращает задачу и цепочку ее родительских задач до глубины max_depth,
+    начиная с самой задачи. Глубина задачи относительно переданной задачи
+    доступна в атрибуте relative_depth.
+    """
+    task = Task.objects.filter(pk=task_id).first()
+    if task is None:
+        return []
+    tasks = [
+        task,
+        *task.get_ancestors()
+        .filter(depth__gte=task.depth - max_depth)
+        .order_by("-depth"),
+    ]
+    for ancestor in tasks:
+        ancestor.relative_depth = task.depth - ancestor.depth
+    return tasks
+
+
+def rebuild_paths(chunk_size=900):
+    """
+    Пересчитывает пути к задачам и уровни вложенности по уровням дерева задач,
+    начиная с корневых задач. Возвращает количество обновленных задач.
+    """
+    updated = Task.objects.filter(parent_task__isnull=True).update(path="", depth=0)
+    parent_task = Task.objects.filter(pk=OuterRef("parent_task"))
+    level_ids = list(
+        Task.objects.filter(parent_task__isnull=True).values_list("pk", flat=True)
+    )
+    while level_ids:
+        next_level_ids = []
+        for start in range(0, len(level_ids), chunk_size):
+            children = Task.objects.filter(
+                parent_task__in=level_ids[start : start + chunk_size]
+            )
+            updated += children.update(
+                path=Subquery(
+                    parent_task.annotate(
+                        subtree_path=Concat(
+                            "path", Cast("pk", CharField()), Value("/")
+                        )
+                    ).values("subtree_path")
+                ),
+                depth=Subquery(parent_task.values("depth")) + 1,
+            )
+            next_level_ids.extend(children.values_list("pk", flat=True))
+        level_ids = next_level_ids
+    return updated
+
+
+def get_inconsistent_paths():
+    """
+    Возвращает задачи, путь к которым расходится с их родительской задачей.
+    """
+    return Task.objects.filter(
+        Q(parent_task__isnull=True) & (~Q(path="") | ~Q(depth=0))
+        | Q(parent_task__isnull=False)
+        & (
+            ~Q(
+                path=Concat(
+                    "parent_task__path",
+                    Cast("parent_task_id", CharField()),
+                    Value("/"),
+                )
+            )
+            | ~Q(depth=F("parent_task__depth") + 1)
+        )
+    )
+
+
+def search_employees(queryset, query):
+    """
+    Отбирает сотрудников, у которых каждое слово запроса является началом
+    одного из слов ФИО (фамилии, имени или отчества).
+
+    В PostgreSQL поиск выполняется по поисковому вектору ФИО с GIN-индексом
+    запросом вида "слово1:* & слово2:*". В других СУБД используется поиск
+    по началу слова ФИО с учетом того, что слова ФИО начинаются с заглавной
+    (NameValidator) или строчной буквы: сравнение кириллицы в SQLite
+    чувствительно к регистру.
+    """
+    terms = SEARCH_TERM_PATTERN.findall(query.lower())
+    if not terms:
+        return queryset.none()
+    if connection.vendor == "postgresql":
+        return queryset.filter(
+            search_vector=SearchQuery(
+                " & ".join(f"{term}:*" for term in terms),
+                search_type="raw",
+                config=EMPLOYEE_SEARCH_CONFIG,
+            )
+        )
+    for term in terms:
+        condition = Q()
+        for variant in {term, term.capitalize()}:
+            condition |= (
+                Q(name__startswith=variant)
+                | Q(name__contains=f" {variant}")
+                | Q(name__contains=f"-{variant}")
+            )
+        queryset = queryset.filter(condition)
+    return queryset
@@ -0,0 +1,121 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from tasks.caching import (EMPLOYEES_CACHE_SCOPE, TASKS_CACHE_SCOPE,
+                           invalidate)
+from tasks.models import Employee, Task
+from tasks.services import refresh_important_tasks
+
+
+def change_workload(executor_id, status, delta):
+    """
+    Изменяет счетчик задач исполнителя с указанным статусом на delta.
+    """
+    if executor_id is None:
+        return
+    field = Employee.WORKLOAD_FIELDS[status]
+    Employee.objects.filter(pk=executor_id).update(**{field: F(field) + delta})
+
+
+@receiver(post_save, sender=Task)
+def update_workload_on_save(sender, instance, created, raw, **kwargs):
+    """
+    Переносит задачу между счетчиками исполнителей
+    при изменении ее исполнителя или статуса.
+    """
+    if raw:
+        return
+    loaded_state = None if created else instance.get_loaded_state()
+    previous = loaded_state and (loaded_state["executor_id"], loaded_state["status"])
+    current = (instance.executor_id, instance.status)
+    if previous != current:
+        if previous:
+            change_workload(*previous, delta=-1)
+        change_workload(*current, delta=1)
+
+
+@receiver(post_delete, sender=Task)
+def update_workload_on_delete(sender, instance, **kwargs):
+    """
+    Уменьшает счетчик задач исполнителя удаленной задачи.
+
+    Удаление сотрудника не требует обработки: счетчики удаляются вместе с ним,
+    а его задачи получают пустого исполнителя (on_delete=SET_NULL).
+    """
+    state = getattr(instance, "_loaded_state", None) or instance.get_current_state()
+    change_workload(state["executor_id"], state["status"], delta=-1)
+
+
+@receiver(post_save, sender=Task)
+def update_important_tasks_on_save(sender, instance, created, raw, **kwargs):
+    """
+    Пересчитывает записи о важных задачах для задачи и ее прежней и новой
+    родительских задач при изменении статуса или родительской задачи.
+    """
+    if raw:
+        return
+    if created:
+        if instance.status == "IN_PROGRESS":
+            refresh_important_tasks([instance.parent_task_id])
+        return
+    loaded_state = instance.get_loaded_state()
+    if (
+        loaded_state["status"] != instance.status
+        or loaded_state["parent_task_id"] != instance.parent_task_id
+    ):
+        refresh_important_tasks(
+            [instance.pk, instance.parent_task_id, loaded_state["parent_task_id"]]
+        )
+
+
+@receiver(post_delete, sender=Task)
+def update_important_tasks_on_delete(sender, instance, **kwargs):
+    """
+    Пересчитывает запись о важной задаче для родительской задачи удаленной задачи.
+    Запись об удаленной задаче удаляется вместе с ней.
+    """
+    refresh_important_tasks([instance.parent_task_id])
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_cache(sender, instance, using, **kwargs):
+    """
+    Делает устаревшими закэшированные списки задач и ответы с задачей
+    после фиксации транзакции: иначе ответ, сформированный до фиксации,
+    был бы закэширован под новой версией с прежними данными.
+    """
+    transaction.on_commit(
+        partial(invalidate, TASKS_CACHE_SCOPE, [instance.pk]), using=using
+    )
+
+
+@receiver(pre_delete, sender=Employee)
+def remember_executed_tasks(sender, instance, **kwargs):
+    """
+    Запоминает задачи удаляемого сотрудника: они получат пустого исполнителя
+    (on_delete=SET_NULL) без отправки сигналов сохранения.
+    """
+    instance._executed_task_ids = list(instance.tasks.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def invalidate_employee_cache(sender, instance, using, **kwargs):
+    """
+    Делает устаревшими закэшированные списки сотрудников и ответы с сотрудником,
+    а при удалении сотрудника - и ответы с его задачами, после фиксации
+    транзакции.
+    """
+    transaction.on_commit(
+        partial(invalidate, EMPLOYEES_CACHE_SCOPE, [instance.pk]), using=using
+    )
+    task_ids = getattr(instance, "_executed_task_ids", None)
+    if task_ids:
+        transaction.on_commit(
+            partial(invalidate, TASKS_CACHE_SCOPE, task_ids), using=using
+        )
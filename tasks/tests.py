@@ -1,8 +1,56 @@
+import json
+import os
+import threading
+import time
+from base64 import b64encode
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import F, Q
+from django.test import (LiveServerTestCase, SimpleTestCase, modify_settings,
+                         override_settings)
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from psycopg2.extensions import (TRANSACTION_STATUS_IDLE,
+                                  TRANSACTION_STATUS_INERROR)
 from rest_framework import status
-from rest_framework.test import APITestCase
-
-from tasks.models import Employee, Task
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from config import fastjson
+from config.fastjson import FastJSONParser, FastJSONRenderer
+from config.metrics import registry
+from config.postgresql_pool.creation import DatabaseCreation
+from config.postgresql_pool.pool import (ConnectionPool, PoolTimeout,
+                                         close_pools, get_pool, get_pool_key,
+                                         get_pool_stats, pools)
+from config.replicas import (ReplicaRouter, check_replica, get_replica,
+                             unavailable_replicas, use_replicas)
+from tasks import benchmarks
+from tasks.models import Employee, ImportantTaskSnapshot, Task
+from tasks.serializers import TaskSerializer
+from tasks.services import (ExecutorRecommender,
+                            get_inconsistent_important_tasks,
+                            get_inconsistent_paths, get_inconsistent_workload,
+                            refresh_important_tasks, refresh_workload,
+                            search_employees)
+from tasks.validators import DeadlineValidator, NameValidator
+from tasks.views import (BusyEmployeeListAPIView, ImportantTaskListAPIView,
+                         TaskListAPIView)
 from users.models import User
 
 
@@ -12,6 +60,7 @@ class EmployeeTestCase(APITestCase):
     """
 
     def setUp(self):
+        cache.clear()
         self.user1 = User.objects.create(email="user1@example.com")
         self.employee1 = Employee.objects.create(
             name="Первый Тестовый Сотрудник", position="Тестовая1"
@@ -344,6 +393,7 @@ class TaskTestCase(APITestCase):
     """
 
     def setUp(self):
+        cache.clear()
         self.user1 = User.objects.create(email="user1@example.com")
         self.employee1 = Employee.objects.create(
             name="Первый тестовый сотрудник", position="Должность"
@@ -661,3 +711,2828 @@ class TaskTestCase(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data, result)
+
+
+class ImportantTaskTestCase(APITestCase):
+    """
+    Класс тестов списка важных задач.
+    """
+
+    def setUp(self):
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        self.employee2 = Employee.objects.create(
+            name="Второй тестовый сотрудник", position="Должность"
+        )
+        self.employee3 = Employee.objects.create(
+            name="Третий тестовый сотрудник", position="Должность"
+        )
+        self.task1 = Task.objects.create(
+            title="Тестовая задача1", deadline="2025-01-01"
+        )
+        self.task2 = Task.objects.create(
+            title="Тестовая задача2", deadline="2025-01-01"
+        )
+        self.task3 = Task.objects.create(
+            title="Тестовая задача3",
+            deadline="2025-01-01",
+            parent_task=self.task1,
+            executor=self.employee1,
+            status="IN_PROGRESS",
+        )
+        self.task4 = Task.objects.create(
+            title="Тестовая задача4",
+            deadline="2025-01-01",
+            parent_task=self.task1,
+            executor=self.employee2,
+            status="IN_PROGRESS",
+        )
+        self.task5 = Task.objects.create(
+            title="Тестовая задача5",
+            deadline="2025-01-01",
+            parent_task=self.task2,
+            executor=self.employee1,
+        )
+        self.url = reverse("tasks:important-tasks")
+
+    def create_employees_with_tasks(self, count):
+        """
+        Создает сотрудников, каждый из которых исполняет зависимую задачу
+        новой важной задачи.
+        """
+        for i in range(count):
+            employee = Employee.objects.create(
+                name=f"Дополнительный сотрудник{i}", position="Должность"
+            )
+            parent_task = Task.objects.create(
+                title=f"Важная задача{i}", deadline="2025-01-01"
+            )
+            Task.objects.create(
+                title=f"Зависимая задача{i}",
+                deadline="2025-01-01",
+                parent_task=parent_task,
+                executor=employee,
+                status="IN_PROGRESS",
+            )
+
+    def test_important_task_list_unauthenticated_user(self):
+        """
+        Тестирует получение списка важных задач без аутентификации.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_important_task_list_authenticated_user(self):
+        """
+        Тестирует получение списка важных задач аутентифицированным пользователем.
+        """
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.get(self.url)
+        result = [
+            {
+                "title": self.task1.title,
+                "deadline": self.task1.deadline,
+                "possible_executors": [
+                    self.employee3.name,
+                    self.employee1.name,
+                    self.employee2.name,
+                ],
+            },
+        ]
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), result)
+
+    def test_important_task_list_overloaded_executor(self):
+        """
+        Тестирует исключение перегруженного исполнителя зависимой задачи
+        из списка рекомендованных.
+        """
+        for i in range(2):
+            Task.objects.create(
+                title=f"Дополнительная задача{i}",
+                deadline="2025-01-01",
+                executor=self.employee1,
+                status="IN_PROGRESS",
+            )
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()[0]["possible_executors"],
+            [self.employee3.name, self.employee2.name],
+        )
+
+    def test_important_task_list_query_count(self):
+        """
+        Тестирует независимость количества запросов к БД от объема данных.
+        """
+        self.client.force_authenticate(user=self.user1)
+
+        with CaptureQueriesContext(connection) as small_dataset_queries:
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()), 1)
+
+        self.create_employees_with_tasks(20)
+        with self.assertNumQueries(len(small_dataset_queries)):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()), 21)
+
+    def create_fan_out(self, count):
+        """
+        Создает важную задачу с count зависимыми задачами в работе,
+        исполнители которых различны. Возвращает исполнителей.
+        """
+        parent_task = Task.objects.create(title="Важная задача", deadline="2025-01-02")
+        employees = Employee.objects.bulk_create(
+            Employee(name=f"Исполнитель{i:04}", position="Должность")
+            for i in range(count)
+        )
+        Task.objects.bulk_create(
+            Task(
+                title=f"Зависимая задача{i}",
+                deadline="2025-01-02",
+                parent_task=parent_task,
+                executor=employee,
+                status="IN_PROGRESS",
+            )
+            for i, employee in enumerate(employees)
+        )
+        refresh_workload()
+        refresh_important_tasks([parent_task.pk])
+        return employees
+
+    def test_important_task_list_fan_out(self):
+        """
+        Тестирует рекомендацию исполнителей всех зависимых задач важной задачи
+        при разном количестве зависимых задач без роста количества запросов.
+        """
+        self.client.force_authenticate(user=self.user1)
+        query_count = None
+        for count in (1, 10, 1000):
+            with self.subTest(count=count):
+                Task.objects.filter(title="Важная задача").delete()
+                Employee.objects.filter(name__startswith="Исполнитель").delete()
+                employees = self.create_fan_out(count)
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(self.url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    response.json()[0]["possible_executors"],
+                    [self.employee3.name, *(employee.name for employee in employees)],
+                )
+                if query_count is None:
+                    query_count = len(queries)
+                self.assertEqual(len(queries), query_count)
+
+    def test_important_task_list_shared_executor(self):
+        """
+        Тестирует однократную рекомендацию исполнителя нескольких зависимых задач.
+        """
+        Task.objects.create(
+            title="Тестовая задача6",
+            deadline="2025-01-01",
+            parent_task=self.task1,
+            executor=self.employee2,
+            status="IN_PROGRESS",
+        )
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response.json()[0]["possible_executors"],
+            [self.employee3.name, self.employee1.name, self.employee2.name],
+        )
+
+    def assertSnapshots(self, expected):
+        """
+        Проверяет записи о важных задачах и их согласованность с задачами.
+        """
+        self.assertEqual(
+            dict(
+                ImportantTaskSnapshot.objects.values_list("pk", "active_subtasks_count")
+            ),
+            {task.pk: count for task, count in expected.items()},
+        )
+        call_command("rebuild_important_tasks", check=True, stdout=StringIO())
+
+    def test_important_task_snapshots(self):
+        """
+        Тестирует поддержку записей о важных задачах при изменении задач.
+        """
+        self.assertSnapshots({self.task1: 2})
+
+        self.task5.status = "IN_PROGRESS"
+        self.task5.save()
+        self.assertSnapshots({self.task1: 2, self.task2: 1})
+
+        self.task4.parent_task = self.task2
+        self.task4.save()
+        self.assertSnapshots({self.task1: 1, self.task2: 2})
+
+        self.task2.status = "DONE"
+        self.task2.save()
+        self.assertSnapshots({self.task1: 1})
+
+        self.task3.delete()
+        self.assertSnapshots({})
+
+    def test_important_task_snapshots_bulk(self):
+        """
+        Тестирует поддержку записей о важных задачах при пакетных операциях.
+        """
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.patch(
+            reverse("tasks:task-bulk-update"),
+            data=[
+                {"id": self.task3.pk, "parent_task": self.task2.pk},
+                {"id": self.task5.pk, "status": "DONE"},
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertSnapshots({self.task1: 1, self.task2: 1})
+
+        response = self.client.post(
+            reverse("tasks:task-bulk-create"),
+            data=[
+                {
+                    "title": "Пакетная задача",
+                    "deadline": timezone.now().date() + timedelta(days=30),
+                    "parent_task": self.task2.pk,
+                    "executor": self.employee3.pk,
+                }
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertSnapshots({self.task1: 1, self.task2: 2})
+
+    def test_refresh_important_tasks_existing_snapshots(self):
+        """
+        Тестирует обновление существующих записей о важных задачах
+        и удаление записей о задачах, переставших быть важными.
+        """
+        ImportantTaskSnapshot.objects.filter(pk=self.task1.pk).update(
+            active_subtasks_count=5
+        )
+        ImportantTaskSnapshot.objects.create(task=self.task2, active_subtasks_count=1)
+        self.assertEqual(refresh_important_tasks([self.task1.pk, self.task2.pk]), 1)
+        self.assertSnapshots({self.task1: 2})
+        self.assertEqual(refresh_important_tasks(), 1)
+        self.assertSnapshots({self.task1: 2})
+
+    def test_rebuild_important_tasks_command(self):
+        """
+        Тестирует проверку и пересчет записей о важных задачах командой
+        rebuild_important_tasks.
+        """
+        ImportantTaskSnapshot.objects.all().delete()
+        ImportantTaskSnapshot.objects.create(task=self.task2, active_subtasks_count=1)
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("rebuild_important_tasks", check=True, stdout=out)
+        self.assertIn(f"{self.task1.pk}: записано None, фактически 2", out.getvalue())
+
+        call_command("rebuild_important_tasks", stdout=StringIO())
+        self.assertSnapshots({self.task1: 2})
+
+
+def create_benchmark_data(employees_count, tasks_per_employee):
+    """
+    Создает синтетический набор сотрудников и задач для нагрузочных тестов.
+    Каждая третья задача сотрудника находится в работе, остальные - новые.
+    """
+    employees = Employee.objects.bulk_create(
+        Employee(name=f"Сотрудник Номер{i}", position="Должность")
+        for i in range(employees_count)
+    )
+    Task.objects.bulk_create(
+        (
+            Task(
+                title=f"Задача{employee.pk}-{i}",
+                deadline="2025-01-01",
+                executor=employee,
+                status="IN_PROGRESS" if i % 3 == 0 else "NEW",
+            )
+            for employee in employees
+            for i in range(tasks_per_employee)
+        ),
+        batch_size=5000,
+    )
+    refresh_workload()
+    return employees
+
+
+class BusyEmployeeTestCase(APITestCase):
+    """
+    Класс тестов списка занятых сотрудников.
+    """
+
+    def setUp(self):
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        self.employee2 = Employee.objects.create(
+            name="Второй тестовый сотрудник", position="Должность"
+        )
+        Task.objects.create(
+            title="Тестовая задача1",
+            deadline="2025-01-01",
+            executor=self.employee1,
+            status="IN_PROGRESS",
+        )
+        for i in range(3):
+            Task.objects.create(
+                title=f"Завершенная задача{i}",
+                deadline="2025-01-01",
+                executor=self.employee2,
+                status="DONE",
+            )
+        self.url = reverse("tasks:busy-employees")
+        self.client.force_authenticate(user=self.user1)
+
+    def test_busy_employee_list_ordering(self):
+        """
+        Тестирует сортировку сотрудников по количеству активных задач,
+        а не по общему количеству задач.
+        """
+        response = self.client.get(self.url)
+        results = response.json()["results"]
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(item["id"], item["task_count"], item["tasks"]) for item in results],
+            [
+                (self.employee1.pk, 1, ["Тестовая задача1"]),
+                (self.employee2.pk, 0, []),
+            ],
+        )
+
+    def test_busy_employee_list_query_count(self):
+        """
+        Тестирует независимость количества запросов к БД от объема данных
+        (10 000 сотрудников, 100 000 задач).
+        """
+        with CaptureQueriesContext(connection) as small_dataset_queries:
+            self.client.get(self.url)
+
+        create_benchmark_data(employees_count=10000, tasks_per_employee=10)
+        with self.assertNumQueries(len(small_dataset_queries)):
+            response = self.client.get(self.url)
+        data = response.json()
+        self.assertEqual(data["count"], 10002)
+        self.assertEqual(data["results"][0]["task_count"], 4)
+        self.assertEqual(len(data["results"][0]["tasks"]), 4)
+
+
+class WorkloadTestCase(APITestCase):
+    """
+    Класс тестов счетчиков задач сотрудников.
+    """
+
+    def setUp(self):
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        self.employee2 = Employee.objects.create(
+            name="Второй тестовый сотрудник", position="Должность"
+        )
+        self.deadline = timezone.now().date() + timedelta(days=30)
+        self.client.force_authenticate(user=self.user1)
+
+    def assertWorkload(self, employee, new, active, done):
+        """
+        Проверяет счетчики задач сотрудника.
+        """
+        employee.refresh_from_db()
+        self.assertEqual(
+            (
+                employee.new_tasks_count,
+                employee.active_tasks_count,
+                employee.done_tasks_count,
+            ),
+            (new, active, done),
+        )
+
+    def test_workload_on_create_update_delete(self):
+        """
+        Тестирует изменение счетчиков при создании, изменении и удалении задачи.
+        """
+        response = self.client.post(
+            reverse("tasks:task-create"),
+            data={
+                "title": "Тестовая задача1",
+                "deadline": self.deadline,
+                "executor": self.employee1.pk,
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        task_pk = response.json()["id"]
+        self.assertWorkload(self.employee1, 0, 1, 0)
+
+        response = self.client.patch(
+            reverse("tasks:task-update", args=(task_pk,)),
+            data={"executor": self.employee2.pk},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertWorkload(self.employee1, 0, 0, 0)
+        self.assertWorkload(self.employee2, 0, 1, 0)
+
+        response = self.client.patch(
+            reverse("tasks:task-update", args=(task_pk,)), data={"status": "DONE"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertWorkload(self.employee2, 0, 0, 1)
+
+        response = self.client.delete(reverse("tasks:task-delete", args=(task_pk,)))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertWorkload(self.employee2, 0, 0, 0)
+
+    def test_workload_on_cascade_delete(self):
+        """
+        Тестирует изменение счетчиков при каскадном удалении зависимых задач.
+        """
+        parent_task = Task.objects.create(
+            title="Тестовая задача1", deadline=self.deadline, executor=self.employee1
+        )
+        Task.objects.create(
+            title="Тестовая задача2",
+            deadline=self.deadline,
+            parent_task=parent_task,
+            executor=self.employee2,
+            status="IN_PROGRESS",
+        )
+        self.assertWorkload(self.employee1, 1, 0, 0)
+        self.assertWorkload(self.employee2, 0, 1, 0)
+
+        parent_task.delete()
+        self.assertWorkload(self.employee1, 0, 0, 0)
+        self.assertWorkload(self.employee2, 0, 0, 0)
+
+    def test_workload_on_stale_employee_save(self):
+        """
+        Тестирует сохранение счетчиков при сохранении загруженного ранее сотрудника.
+        """
+        employee = Employee.objects.get(pk=self.employee1.pk)
+        Task.objects.create(
+            title="Тестовая задача1",
+            deadline=self.deadline,
+            executor=self.employee1,
+            status="IN_PROGRESS",
+        )
+        self.assertWorkload(self.employee1, 0, 1, 0)
+
+        employee.position = "Новая должность"
+        employee.save()
+        self.assertWorkload(self.employee1, 0, 1, 0)
+        self.assertEqual(self.employee1.position, "Новая должность")
+
+    def test_rebuild_workload_command(self):
+        """
+        Тестирует проверку и пересчет счетчиков задач командой rebuild_workload.
+        """
+        Task.objects.bulk_create(
+            [
+                Task(
+                    title="Тестовая задача1",
+                    deadline=self.deadline,
+                    executor=self.employee1,
+                    status="IN_PROGRESS",
+                ),
+                Task(
+                    title="Тестовая задача2",
+                    deadline=self.deadline,
+                    executor=self.employee1,
+                    status="DONE",
+                ),
+            ]
+        )
+        with self.assertRaises(CommandError):
+            call_command("rebuild_workload", check=True, stdout=StringIO())
+
+        call_command("rebuild_workload", stdout=StringIO())
+        self.assertWorkload(self.employee1, 0, 1, 1)
+        call_command("rebuild_workload", check=True, stdout=StringIO())
+
+
+@skipUnless(
+    connection.vendor == "postgresql", "EXPLAIN проверяется только на PostgreSQL"
+)
+class TaskIndexTestCase(APITestCase):
+    """
+    Класс тестов использования индексов запросами специальных эндпоинтов.
+    """
+
+    def setUp(self):
+        self.employees = create_benchmark_data(employees_count=50, tasks_per_employee=4)
+        parent_task = Task.objects.create(title="Важная задача", deadline="2025-01-01")
+        Task.objects.create(
+            title="Зависимая задача",
+            deadline="2025-01-01",
+            parent_task=parent_task,
+            executor=self.employees[0],
+            status="IN_PROGRESS",
+        )
+        self.parent_task = parent_task
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE tasks_task")
+            cursor.execute("ANALYZE tasks_employee")
+            # Исключаем последовательное сканирование, чтобы проверить
+            # применимость индексов на небольшом тестовом наборе данных
+            cursor.execute("SET enable_seqscan = off")
+
+    def tearDown(self):
+        with connection.cursor() as cursor:
+            cursor.execute("RESET enable_seqscan")
+
+    def assertUsesIndex(self, queryset, *index_names):
+        """
+        Проверяет, что план выполнения запроса использует один из индексов.
+        """
+        plan = queryset.explain()
+        self.assertTrue(
+            any(index_name in plan for index_name in index_names),
+            f"Ни один из индексов {index_names} не используется:\n{plan}",
+        )
+
+    def test_task_list_uses_deadline_index(self):
+        """
+        Тестирует использование индекса по сроку исполнения списком задач,
+        в том числе при постраничном выводе по ключу.
+        """
+        self.assertUsesIndex(
+            TaskListAPIView.queryset.all()[:5], "task_deadline_id_idx"
+        )
+        self.assertUsesIndex(
+            Task.objects.filter(
+                Q(deadline__lte="2025-01-01")
+                & (Q(deadline__lt="2025-01-01") | Q(deadline="2025-01-01", id__gt=100))
+            ).order_by("-deadline", "id")[:6],
+            "task_deadline_id_idx",
+        )
+
+    def test_task_list_filters_use_indexes(self):
+        """
+        Тестирует использование индексов фильтрами и поиском списка задач.
+        """
+        request = APIRequestFactory().get(
+            "/", {"search": "задача", "executor": self.employees[0].pk}
+        )
+        view = TaskListAPIView(request=Request(request), format_kwarg=None)
+        queryset = view.filter_queryset(view.get_queryset())
+        self.assertUsesIndex(
+            queryset, "task_title_trgm_idx", "task_executor_status_idx"
+        )
+        self.assertUsesIndex(
+            Employee.objects.filter(name__icontains="номер"), "employee_name_trgm_idx"
+        )
+
+    def test_busy_employee_list_uses_indexes(self):
+        """
+        Тестирует использование индексов списком занятых сотрудников.
+        """
+        self.assertUsesIndex(
+            BusyEmployeeListAPIView().get_queryset()[:5], "employee_active_tasks_idx"
+        )
+        self.assertUsesIndex(
+            Task.objects.filter(
+                status="IN_PROGRESS", executor__in=self.employees[:5]
+            ).only("title", "executor"),
+            "task_executor_status_idx",
+        )
+
+    def test_important_task_list_uses_indexes(self):
+        """
+        Тестирует использование индексов списком важных задач.
+        """
+        self.assertUsesIndex(
+            ImportantTaskListAPIView().get_queryset(),
+            "tasks_importanttasksnapshot_pkey",
+        )
+        recommender = ExecutorRecommender([self.parent_task])
+        self.assertUsesIndex(
+            recommender._get_dependent_executors_queryset(max_task_count=10),
+            "task_parent_status_idx",
+            "task_in_progress_idx",
+        )
+
+
+class KeysetPaginationTestCase(APITestCase):
+    """
+    Класс тестов постраничного вывода по ключу.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.employees = [
+            Employee.objects.create(name=f"Сотрудник Номер{i}", position="Должность")
+            for i in range(7)
+        ]
+        self.tasks = [
+            Task.objects.create(
+                title=f"Тестовая задача{i}", deadline=f"2025-01-0{i % 3 + 1}"
+            )
+            for i in range(12)
+        ]
+
+    def collect_pages(self, url, direction="next"):
+        """
+        Обходит страницы по ссылкам next или previous, возвращая идентификаторы записей.
+        """
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertNotIn("count", data)
+            pages.append([item["id"] for item in data["results"]])
+            last_url, url = url, data[direction]
+        return pages, last_url
+
+    def test_task_list_keyset_pagination(self):
+        """
+        Тестирует обход списка задач по курсору в прямом и обратном направлениях.
+        """
+        expected = [
+            task.pk
+            for task in sorted(
+                self.tasks, key=lambda task: (-int(task.deadline[-1]), task.pk)
+            )
+        ]
+        pages, last_url = self.collect_pages(
+            reverse("tasks:tasks") + "?pagination=cursor"
+        )
+        self.assertEqual([len(page) for page in pages], [5, 5, 2])
+        self.assertEqual(sum(pages, []), expected)
+
+        response = self.client.get(last_url)
+        pages, _ = self.collect_pages(response.json()["previous"], direction="previous")
+        self.assertEqual(sum(reversed(pages), []), expected[:10])
+
+    def test_employee_list_keyset_pagination(self):
+        """
+        Тестирует обход списка сотрудников по курсору.
+        """
+        expected = [
+            employee.pk
+            for employee in sorted(
+                self.employees, key=lambda employee: (employee.name, employee.pk)
+            )
+        ]
+        pages, _ = self.collect_pages(
+            reverse("tasks:employees") + "?pagination=cursor&page_size=3"
+        )
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_keyset_pagination_query_count(self):
+        """
+        Тестирует, что последующие страницы запрашиваются одним запросом
+        без подсчета записей.
+        """
+        response = self.client.get(reverse("tasks:tasks") + "?pagination=cursor")
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(response.json()["next"])
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("COUNT", queries[0]["sql"].upper())
+
+    def test_keyset_pagination_invalid_cursor(self):
+        """
+        Тестирует обработку некорректного курсора.
+        """
+        response = self.client.get(reverse("tasks:tasks") + "?cursor=invalid")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        cursor = b64encode(b'{"reverse":false,"key":["garbage",1]}').decode("ascii")
+        response = self.client.get(reverse("tasks:tasks") + f"?cursor={cursor}")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_pagination_by_default(self):
+        """
+        Тестирует сохранение постраничного вывода по номеру страницы по умолчанию.
+        """
+        response = self.client.get(reverse("tasks:tasks"))
+        self.assertEqual(response.json()["count"], 12)
+
+
+class TaskBulkTestCase(APITestCase):
+    """
+    Класс тестов пакетного создания и изменения задач.
+    """
+
+    def setUp(self):
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        self.deadline = timezone.now().date() + timedelta(days=30)
+        self.task1 = Task.objects.create(
+            title="Тестовая задача1", deadline=self.deadline
+        )
+        self.task2 = Task.objects.create(
+            title="Тестовая задача2", deadline=self.deadline
+        )
+        self.create_url = reverse("tasks:task-bulk-create")
+        self.update_url = reverse("tasks:task-bulk-update")
+
+    def test_bulk_create_unauthenticated_user(self):
+        """
+        Тестирует пакетное создание задач без аутентификации.
+        """
+        data = [{"title": "Тестовая задача3", "deadline": self.deadline}]
+        response = self.client.post(self.create_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_bulk_create(self):
+        """
+        Тестирует пакетное создание задач со ссылками на задачи пакета.
+        """
+        self.client.force_authenticate(user=self.user1)
+        data = [
+            {"title": "Пакетная задача0", "deadline": self.deadline},
+            {
+                "title": "Пакетная задача1",
+                "deadline": self.deadline + timedelta(days=1),
+                "parent_index": 0,
+                "executor": self.employee1.pk,
+            },
+            {
+                "title": "Пакетная задача2",
+                "deadline": self.deadline + timedelta(days=2),
+                "parent_index": 1,
+            },
+            {
+                "title": "Пакетная задача3",
+                "deadline": self.deadline,
+                "parent_task": self.task1.pk,
+                "executor": self.employee1.pk,
+            },
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.create_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertLessEqual(len(queries), 13)
+
+        tasks = [Task.objects.get(pk=item["id"]) for item in response.json()]
+        self.assertEqual(
+            [(task.parent_task_id, task.status) for task in tasks],
+            [
+                (None, "NEW"),
+                (tasks[0].pk, "IN_PROGRESS"),
+                (tasks[1].pk, "NEW"),
+                (self.task1.pk, "IN_PROGRESS"),
+            ],
+        )
+        self.employee1.refresh_from_db()
+        self.assertEqual(self.employee1.active_tasks_count, 2)
+
+    def test_bulk_create_computes_today_once(self):
+        """
+        Тестирует вычисление текущей даты при проверке сроков исполнения
+        один раз на пакет задач.
+        """
+        self.client.force_authenticate(user=self.user1)
+        data = [
+            {"title": f"Пакетная задача{i}", "deadline": self.deadline}
+            for i in range(10)
+        ]
+        with patch("tasks.validators.timezone.now", wraps=timezone.now) as now:
+            response = self.client.post(self.create_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(now.call_count, 1)
+
+    def test_bulk_create_invalid_data(self):
+        """
+        Тестирует отклонение пакета с некорректными задачами целиком.
+        """
+        self.client.force_authenticate(user=self.user1)
+        data = [
+            {"title": "Пакетная задача0", "deadline": self.deadline},
+            {
+                "title": "Пакетная задача1",
+                "deadline": self.deadline,
+                "parent_index": 2,
+            },
+            {
+                "title": "Пакетная задача2",
+                "deadline": self.deadline - timedelta(days=1),
+                "parent_task": self.task1.pk,
+            },
+            {"title": "Пакетная задача3", "deadline": self.deadline, "executor": 0},
+        ]
+        response = self.client.post(self.create_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()
+        self.assertEqual(errors[0], {})
+        self.assertIn("parent_index", errors[1])
+        self.assertIn("deadline", errors[2])
+        self.assertIn("executor", errors[3])
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_bulk_update(self):
+        """
+        Тестирует пакетное изменение задач.
+        """
+        self.client.force_authenticate(user=self.user1)
+        new_deadline = self.deadline + timedelta(days=5)
+        data = [
+            {"id": self.task1.pk, "deadline": new_deadline},
+            {
+                "id": self.task2.pk,
+                "deadline": new_deadline,
+                "parent_task": self.task1.pk,
+                "executor": self.employee1.pk,
+            },
+        ]
+        response = self.client.patch(self.update_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.task1.refresh_from_db()
+        self.task2.refresh_from_db()
+        self.assertEqual(self.task1.deadline, new_deadline)
+        self.assertEqual(self.task2.parent_task_id, self.task1.pk)
+        self.assertEqual(self.task2.status, "IN_PROGRESS")
+        self.employee1.refresh_from_db()
+        self.assertEqual(self.employee1.active_tasks_count, 1)
+
+    def test_bulk_update_keeps_parent_task(self):
+        """
+        Тестирует изменение задачи, родительская задача которой не входит в пакет.
+        """
+        self.client.force_authenticate(user=self.user1)
+        subtask = Task.objects.create(
+            title="Тестовая задача3", deadline=self.deadline, parent_task=self.task1
+        )
+        data = [
+            {"id": subtask.pk, "deadline": self.deadline - timedelta(days=1)},
+        ]
+        response = self.client.patch(self.update_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("deadline", response.json()[0])
+
+        data = [{"id": subtask.pk, "title": "Измененная задача3"}]
+        response = self.client.patch(self.update_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        subtask.refresh_from_db()
+        self.assertEqual(subtask.title, "Измененная задача3")
+        self.assertEqual(subtask.parent_task_id, self.task1.pk)
+
+    def test_bulk_update_invalid_data(self):
+        """
+        Тестирует отклонение пакета изменений, нарушающего сроки исполнения.
+        """
+        self.client.force_authenticate(user=self.user1)
+        data = [
+            {"id": self.task1.pk, "deadline": self.deadline + timedelta(days=5)},
+            {"id": self.task2.pk, "parent_task": self.task1.pk},
+            {"id": 0, "title": "Несуществующая задача"},
+        ]
+        response = self.client.patch(self.update_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()
+        self.assertEqual(errors[0], {})
+        self.assertIn("deadline", errors[1])
+        self.assertIn("id", errors[2])
+        self.task1.refresh_from_db()
+        self.assertEqual(self.task1.deadline, self.deadline)
+
+
+class TaskWriteQueryTestCase(APITestCase):
+    """
+    Класс тестов количества запросов записи задач.
+    """
+
+    def setUp(self):
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        self.deadline = timezone.now().date() + timedelta(days=30)
+        self.task1 = Task.objects.create(
+            title="Тестовая задача1", deadline=self.deadline
+        )
+        self.client.force_authenticate(user=self.user1)
+
+    def get_task_writes(self, queries):
+        """
+        Возвращает запросы INSERT и UPDATE к таблице задач.
+        """
+        return [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith(
+                ('INSERT INTO "tasks_task"', 'UPDATE "tasks_task"')
+            )
+        ]
+
+    def test_task_create_single_write(self):
+        """
+        Тестирует создание задачи с исполнителем одним запросом INSERT.
+        """
+        data = {
+            "title": "Тестовая задача2",
+            "deadline": self.deadline,
+            "executor": self.employee1.pk,
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse("tasks:task-create"), data=data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["status"], "IN_PROGRESS")
+        writes = self.get_task_writes(queries)
+        self.assertEqual(len(writes), 1)
+        self.assertTrue(writes[0].startswith("INSERT"))
+
+    def test_task_update_single_write(self):
+        """
+        Тестирует изменение задачи одним запросом UPDATE только измененных полей.
+        """
+        url = reverse("tasks:task-update", args=(self.task1.pk,))
+        data = {"title": self.task1.title, "executor": self.employee1.pk}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(url, data=data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], "IN_PROGRESS")
+        writes = self.get_task_writes(queries)
+        self.assertEqual(len(writes), 1)
+        self.assertIn('"executor_id"', writes[0])
+        self.assertIn('"status"', writes[0])
+        self.assertNotIn('"title"', writes[0])
+
+    def test_task_update_without_changes(self):
+        """
+        Тестирует отсутствие записи в БД при изменении задачи без изменений.
+        """
+        url = reverse("tasks:task-update", args=(self.task1.pk,))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(url, data={"title": self.task1.title})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_task_writes(queries), [])
+
+
+class TaskTreeTestCase(APITestCase):
+    """
+    Класс тестов получения дерева и цепочки родительских задач.
+    """
+
+    def setUp(self):
+        self.root = Task.objects.create(
+            title="Корневая задача", deadline="2025-01-01"
+        )
+        self.child1 = Task.objects.create(
+            title="Зависимая задача1", deadline="2025-01-02", parent_task=self.root
+        )
+        self.child2 = Task.objects.create(
+            title="Зависимая задача2", deadline="2025-01-02", parent_task=self.root
+        )
+        self.grandchild = Task.objects.create(
+            title="Зависимая задача3", deadline="2025-01-03", parent_task=self.child1
+        )
+        self.leaf = Task.objects.create(
+            title="Зависимая задача4",
+            deadline="2025-01-04",
+            parent_task=self.grandchild,
+        )
+
+    def get_tree_ids(self, node):
+        """
+        Возвращает идентификаторы дерева задач в виде (<id>, [<поддеревья>]).
+        """
+        return node["id"], [
+            self.get_tree_ids(subtask) for subtask in node["subtasks"]
+        ]
+
+    def test_task_tree(self):
+        """
+        Тестирует получение дерева задач двумя запросами без рекурсии.
+        """
+        url = reverse("tasks:task-tree", args=(self.root.pk,))
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+            data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(data["title"], self.root.title)
+        self.assertEqual(
+            self.get_tree_ids(data),
+            (
+                self.root.pk,
+                [
+                    (
+                        self.child1.pk,
+                        [(self.grandchild.pk, [(self.leaf.pk, [])])],
+                    ),
+                    (self.child2.pk, []),
+                ],
+            ),
+        )
+
+    def test_task_tree_depth(self):
+        """
+        Тестирует ограничение глубины дерева задач.
+        """
+        url = reverse("tasks:task-tree", args=(self.root.pk,))
+        response = self.client.get(url, {"depth": 1})
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            self.get_tree_ids(data),
+            (self.root.pk, [(self.child1.pk, []), (self.child2.pk, [])]),
+        )
+
+        response = self.client.get(url, {"depth": 1000})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_task_tree_not_found(self):
+        """
+        Тестирует получение дерева несуществующей задачи.
+        """
+        response = self.client.get(reverse("tasks:task-tree", args=(0,)))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_task_ancestors(self):
+        """
+        Тестирует получение цепочки родительских задач.
+        """
+        url = reverse("tasks:task-ancestors", args=(self.leaf.pk,))
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [task["id"] for task in response.json()],
+            [self.grandchild.pk, self.child1.pk, self.root.pk],
+        )
+
+        response = self.client.get(url, {"depth": 2})
+        self.assertEqual(
+            [task["id"] for task in response.json()],
+            [self.grandchild.pk, self.child1.pk],
+        )
+
+
+class TaskPathTestCase(APITestCase):
+    """
+    Класс тестов путей к задачам в дереве задач.
+    """
+
+    def setUp(self):
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.deadline = timezone.now().date() + timedelta(days=30)
+        self.root1 = Task.objects.create(
+            title="Корневая задача1", deadline=self.deadline
+        )
+        self.root2 = Task.objects.create(
+            title="Корневая задача2", deadline=self.deadline
+        )
+        self.child = Task.objects.create(
+            title="Зависимая задача1", deadline=self.deadline, parent_task=self.root1
+        )
+        self.grandchild = Task.objects.create(
+            title="Зависимая задача2", deadline=self.deadline, parent_task=self.child
+        )
+        self.client.force_authenticate(user=self.user1)
+
+    def assertPath(self, task, ancestors):
+        """
+        Проверяет путь к задаче и уровень вложенности задачи.
+        """
+        task.refresh_from_db()
+        self.assertEqual(task.ancestor_ids, [ancestor.pk for ancestor in ancestors])
+        self.assertEqual(task.depth, len(ancestors))
+
+    def test_path_on_create(self):
+        """
+        Тестирует вычисление пути при создании задачи.
+        """
+        self.assertPath(self.root1, [])
+        self.assertPath(self.child, [self.root1])
+        self.assertPath(self.grandchild, [self.root1, self.child])
+        self.assertEqual(
+            list(self.root1.get_descendants().filter(status="NEW")),
+            [self.child, self.grandchild],
+        )
+
+    def test_path_on_reparent(self):
+        """
+        Тестирует перенос зависимых задач при смене родительской задачи.
+        """
+        response = self.client.patch(
+            reverse("tasks:task-update", args=(self.child.pk,)),
+            data={"parent_task": self.root2.pk},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertPath(self.child, [self.root2])
+        self.assertPath(self.grandchild, [self.root2, self.child])
+
+        self.child.parent_task = None
+        self.child.save()
+        self.assertPath(self.child, [])
+        self.assertPath(self.grandchild, [self.child])
+
+    def test_parent_task_cycle(self):
+        """
+        Тестирует запрет циклических зависимостей задач.
+        """
+        url = reverse("tasks:task-update", args=(self.root1.pk,))
+        for parent_task in (self.root1, self.grandchild):
+            response = self.client.patch(url, data={"parent_task": parent_task.pk})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertPath(self.root1, [])
+
+    def test_deadline_after_descendants(self):
+        """
+        Тестирует запрет переноса срока задачи позже сроков зависимых задач.
+        """
+        response = self.client.patch(
+            reverse("tasks:task-update", args=(self.root1.pk,)),
+            data={"deadline": self.deadline + timedelta(days=1)},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_reparent(self):
+        """
+        Тестирует пересчет путей и запрет циклов при пакетном изменении задач.
+        """
+        url = reverse("tasks:task-bulk-update")
+        data = [
+            {"id": self.root2.pk, "parent_task": self.grandchild.pk},
+            {"id": self.child.pk, "parent_task": None},
+        ]
+        response = self.client.patch(url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertPath(self.child, [])
+        self.assertPath(self.grandchild, [self.child])
+        self.assertPath(self.root2, [self.child, self.grandchild])
+
+        data = [
+            {"id": self.child.pk, "parent_task": self.root1.pk},
+            {"id": self.root1.pk, "parent_task": self.root2.pk},
+        ]
+        response = self.client.patch(url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("parent_task", response.json()[1])
+
+    def test_depth_limit(self):
+        """
+        Тестирует ограничение уровня вложенности задач при создании
+        и смене родительской задачи.
+        """
+        leaf = self.root1
+        for index in range(Task.MAX_DEPTH - 1):
+            leaf = Task.objects.create(
+                title=f"Вложенная задача{index}",
+                deadline=self.deadline,
+                parent_task=leaf,
+            )
+        self.assertEqual(leaf.depth, Task.MAX_DEPTH - 1)
+
+        create_url = reverse("tasks:task-bulk-create")
+        data = [
+            {"title": "Задача0", "deadline": self.deadline, "parent_task": leaf.pk},
+            {"title": "Задача1", "deadline": self.deadline, "parent_index": 0},
+        ]
+        response = self.client.post(create_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()[0], {})
+        self.assertIn("parent_index", response.json()[1])
+        response = self.client.post(create_url, data=data[:1], format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        deepest = Task.objects.get(pk=response.json()[0]["id"])
+        self.assertEqual(deepest.depth, Task.MAX_DEPTH)
+        data = [
+            {"title": "Задача2", "deadline": self.deadline, "parent_task": deepest.pk}
+        ]
+        response = self.client.post(create_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("parent_task", response.json()[0])
+
+        update_url = reverse("tasks:task-update", args=(self.child.pk,))
+        response = self.client.patch(update_url, data={"parent_task": leaf.pk})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertPath(self.child, [self.root1])
+
+        bulk_update_url = reverse("tasks:task-bulk-update")
+        data = [
+            {"id": self.root2.pk, "parent_task": leaf.pk},
+            {"id": self.child.pk, "parent_task": self.root2.pk},
+        ]
+        response = self.client.patch(bulk_update_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()[0], {})
+        self.assertIn("parent_task", response.json()[1])
+
+        data = [{"id": self.child.pk, "parent_task": leaf.parent_task_id}]
+        response = self.client.patch(bulk_update_url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.grandchild.refresh_from_db()
+        self.assertEqual(self.grandchild.depth, Task.MAX_DEPTH)
+
+    def test_rebuild_task_paths_command(self):
+        """
+        Тестирует проверку и пересчет путей к задачам командой rebuild_task_paths.
+        """
+        Task.objects.filter(pk=self.grandchild.pk).update(path="", depth=0)
+        with self.assertRaises(CommandError):
+            call_command("rebuild_task_paths", check=True, stdout=StringIO())
+
+        call_command("rebuild_task_paths", stdout=StringIO())
+        self.assertPath(self.grandchild, [self.root1, self.child])
+        call_command("rebuild_task_paths", check=True, stdout=StringIO())
+
+
+class ResponseCacheTestCase(APITestCase):
+    """
+    Класс тестов кэширования ответов контроллеров чтения.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        self.deadline = timezone.now().date() + timedelta(days=30)
+        self.task1 = Task.objects.create(
+            title="Тестовая задача1", deadline=self.deadline, executor=self.employee1
+        )
+        self.task2 = Task.objects.create(
+            title="Тестовая задача2", deadline=self.deadline
+        )
+
+    def test_cached_responses(self):
+        """
+        Тестирует выдачу закэшированных ответов без запросов к БД.
+        """
+        urls = (
+            reverse("tasks:tasks"),
+            reverse("tasks:task", args=(self.task1.pk,)),
+            reverse("tasks:employees"),
+            reverse("tasks:employee", args=(self.employee1.pk,)),
+        )
+        for url in urls:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            with self.assertNumQueries(0):
+                cached_response = self.client.get(url)
+            self.assertEqual(cached_response.status_code, status.HTTP_200_OK)
+            self.assertEqual(cached_response.content, response.content)
+            self.assertEqual(cached_response["ETag"], response["ETag"])
+
+    def test_browsable_api_not_cached(self):
+        """
+        Тестирует отказ от кэширования HTML-страниц BrowsableAPIRenderer,
+        содержащих данные пользователя запроса.
+        """
+        url = reverse("tasks:employees")
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(url, HTTP_ACCEPT="text/html")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, self.user1.email)
+        self.assertNotIn("ETag", response)
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get(url, HTTP_ACCEPT="text/html")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotContains(response, self.user1.email)
+
+    def test_cache_key_query_params(self):
+        """
+        Тестирует кэширование ответов с учетом параметров запроса.
+        """
+        url = reverse("tasks:tasks")
+        response = self.client.get(url, {"page_size": 1})
+        other_response = self.client.get(url, {"page_size": 2})
+        self.assertEqual(len(response.json()["results"]), 1)
+        self.assertEqual(len(other_response.json()["results"]), 2)
+
+    def test_not_modified(self):
+        """
+        Тестирует ответ 304 на условный запрос с актуальным ETag.
+        """
+        url = reverse("tasks:task", args=(self.task1.pk,))
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+        cache.clear()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='"outdated"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalidation_on_task_change(self):
+        """
+        Тестирует обновление закэшированных ответов при изменении задач.
+        """
+        list_url = reverse("tasks:tasks")
+        task_url = reverse("tasks:task", args=(self.task2.pk,))
+        other_task_url = reverse("tasks:task", args=(self.task1.pk,))
+        for url in (list_url, task_url, other_task_url):
+            self.client.get(url)
+
+        self.client.force_authenticate(user=self.user1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                reverse("tasks:task-update", args=(self.task2.pk,)),
+                data={"title": "Измененная задача"},
+            )
+        self.assertEqual(self.client.get(task_url).json()["title"], "Измененная задача")
+        titles = [task["title"] for task in self.client.get(list_url).json()["results"]]
+        self.assertIn("Измененная задача", titles)
+        with self.assertNumQueries(0):
+            self.client.get(other_task_url)
+
+        self.client.patch(
+            reverse("tasks:task-bulk-update"),
+            data=[{"id": self.task2.pk, "title": "Пакетно измененная задача"}],
+            format="json",
+        )
+        self.assertEqual(
+            self.client.get(task_url).json()["title"], "Пакетно измененная задача"
+        )
+
+        self.client.post(
+            reverse("tasks:task-bulk-create"),
+            data=[{"title": "Новая задача", "deadline": self.deadline}],
+            format="json",
+        )
+        self.assertEqual(self.client.get(list_url).json()["count"], 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task2.delete()
+        response = self.client.get(task_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalidation_on_commit(self):
+        """
+        Тестирует обновление закэшированных ответов только после фиксации
+        транзакции, изменившей задачу.
+        """
+        task_url = reverse("tasks:task", args=(self.task1.pk,))
+        self.client.get(task_url)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.task1.title = "Измененная задача"
+            self.task1.save()
+            with self.assertNumQueries(0):
+                self.client.get(task_url)
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertEqual(self.client.get(task_url).json()["title"], "Измененная задача")
+
+    def test_invalidation_on_employee_delete(self):
+        """
+        Тестирует обновление закэшированных ответов с задачами удаленного сотрудника.
+        """
+        task_url = reverse("tasks:task", args=(self.task1.pk,))
+        employee_url = reverse("tasks:employee", args=(self.employee1.pk,))
+        response = self.client.get(task_url)
+        self.assertEqual(response.json()["executor"], self.employee1.pk)
+        self.client.get(employee_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employee1.delete()
+        self.assertIsNone(self.client.get(task_url).json()["executor"])
+        response = self.client.get(employee_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ExportTestCase(APITestCase):
+    """
+    Класс тестов потоковой выгрузки задач и сотрудников.
+    """
+
+    def setUp(self):
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность, старшая"
+        )
+        self.task1 = Task.objects.create(
+            title="Тестовая задача1", deadline="2025-01-01"
+        )
+        self.task2 = Task.objects.create(
+            title="Тестовая задача2",
+            deadline="2025-01-02",
+            parent_task=self.task1,
+            executor=self.employee1,
+            status="IN_PROGRESS",
+        )
+
+    def get_export(self, url):
+        """
+        Выполняет запрос выгрузки, возвращая ответ и его содержимое.
+        """
+        response = self.client.get(url)
+        content = b"".join(response.streaming_content).decode()
+        return response, content
+
+    def test_export_unauthenticated_user(self):
+        """
+        Тестирует выгрузку без аутентификации.
+        """
+        response = self.client.get(reverse("tasks:task-export", args=("csv",)))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_task_export_ndjson(self):
+        """
+        Тестирует выгрузку задач в формате NDJSON одним запросом к БД.
+        """
+        self.client.force_authenticate(user=self.user1)
+        url = reverse("tasks:task-export", args=("ndjson",))
+        self.assertEqual(url, "/export/tasks.ndjson")
+        with self.assertNumQueries(1):
+            response, content = self.get_export(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            [json.loads(line) for line in content.splitlines()],
+            [
+                {
+                    "id": self.task1.pk,
+                    "title": "Тестовая задача1",
+                    "parent_task": None,
+                    "executor": None,
+                    "deadline": "2025-01-01",
+                    "status": "NEW",
+                },
+                {
+                    "id": self.task2.pk,
+                    "title": "Тестовая задача2",
+                    "parent_task": self.task1.pk,
+                    "executor": self.employee1.pk,
+                    "deadline": "2025-01-02",
+                    "status": "IN_PROGRESS",
+                },
+            ],
+        )
+
+    def test_employee_export_csv(self):
+        """
+        Тестирует выгрузку сотрудников в формате CSV.
+        """
+        self.client.force_authenticate(user=self.user1)
+        response, content = self.get_export(
+            reverse("tasks:employee-export", args=("csv",))
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="employees.csv"'
+        )
+        self.assertEqual(
+            content.splitlines(),
+            [
+                "id,name,position",
+                f'{self.employee1.pk},Первый тестовый сотрудник,"Должность, старшая"',
+            ],
+        )
+
+
+class ImportTasksTestCase(APITestCase):
+    """
+    Класс тестов импорта задач и сотрудников командой import_tasks.
+    """
+
+    def setUp(self):
+        self.deadline = timezone.now().date() + timedelta(days=30)
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_file(self, name, content):
+        """
+        Записывает файл импорта во временный каталог, возвращая путь к файлу.
+        """
+        path = Path(self.directory.name) / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def test_import_tasks(self):
+        """
+        Тестирует импорт сотрудников и задач пакетами со ссылками
+        по внешним идентификаторам и отклонением некорректных строк.
+        """
+        employees_file = self.write_file(
+            "employees.csv",
+            "id,name,position\n"
+            "e1,Первый Тестовый Сотрудник,Должность\n"
+            "e2,invalid name,Должность\n",
+        )
+        rows = [
+            {"id": 10, "title": "Корневая задача", "deadline": str(self.deadline)},
+            {"id": 11, "title": "Просроченная задача", "deadline": "2020-01-01"},
+            {
+                "id": 12,
+                "title": "Зависимая задача",
+                "deadline": str(self.deadline),
+                "parent": 10,
+                "executor": "e1",
+            },
+            {
+                "id": 13,
+                "title": "Задача отклоненной задачи",
+                "deadline": str(self.deadline),
+                "parent": 11,
+            },
+            {
+                "id": 14,
+                "title": "Задача отклоненного сотрудника",
+                "deadline": str(self.deadline),
+                "executor": "e2",
+            },
+            {
+                "id": 15,
+                "title": "Вложенная задача",
+                "deadline": str(self.deadline),
+                "parent": 12,
+                "status": "DONE",
+            },
+        ]
+        tasks_file = self.write_file(
+            "tasks.ndjson",
+            "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows),
+        )
+        out, err = StringIO(), StringIO()
+        call_command(
+            "import_tasks",
+            tasks_file,
+            employees=employees_file,
+            batch_size=2,
+            stdout=out,
+            stderr=err,
+        )
+
+        self.assertIn("Импорт сотрудников: загружено 1, отклонено 1", out.getvalue())
+        self.assertIn("Импорт задач: загружено 3, отклонено 3", out.getvalue())
+        self.assertIn("строк/с", out.getvalue())
+        self.assertEqual(
+            [line.split(":")[0] for line in err.getvalue().splitlines()],
+            ["Строка 2", "Строка 2", "Строка 4", "Строка 5"],
+        )
+
+        employee = Employee.objects.get()
+        root, child, grandchild = Task.objects.order_by("pk")
+        self.assertEqual(root.title, "Корневая задача")
+        self.assertEqual(
+            (child.parent_task_id, child.executor_id, child.status),
+            (root.pk, employee.pk, "IN_PROGRESS"),
+        )
+        self.assertEqual(
+            (grandchild.parent_task_id, grandchild.status), (child.pk, "DONE")
+        )
+        self.assertEqual(grandchild.ancestor_ids, [root.pk, child.pk])
+        employee.refresh_from_db()
+        self.assertEqual(employee.active_tasks_count, 1)
+
+    def test_import_tasks_csv_existing_executor(self):
+        """
+        Тестирует импорт задач из CSV с исполнителями из существующих сотрудников.
+        """
+        employee = Employee.objects.create(
+            name="Первый Тестовый Сотрудник", position="Должность"
+        )
+        tasks_file = self.write_file(
+            "tasks.csv",
+            "id,title,parent,executor,deadline,status\n"
+            f"1,Задача1,,{employee.pk},{self.deadline},\n"
+            f"2,Задача2,1,{employee.pk + 1},{self.deadline},\n",
+        )
+        err = StringIO()
+        call_command("import_tasks", tasks_file, stdout=StringIO(), stderr=err)
+        self.assertEqual(Task.objects.get().executor, employee)
+        self.assertIn("Строка 2", err.getvalue())
+
+    def test_import_tasks_unknown_format(self):
+        """
+        Тестирует импорт из файла неизвестного формата.
+        """
+        tasks_file = self.write_file("tasks.txt", "")
+        with self.assertRaises(CommandError):
+            call_command("import_tasks", tasks_file, stdout=StringIO())
+
+
+@skipUnless(
+    os.getenv("RUN_BENCHMARKS"),
+    "Бенчмарк выполняется при заданной переменной RUN_BENCHMARKS",
+)
+class ValidatorBenchmarkTestCase(SimpleTestCase):
+    """
+    Класс микробенчмарков валидаторов: проверяет, что скорость проверки
+    не опускается ниже VALIDATIONS_PER_SECOND проверок в секунду.
+    Скорость зависит от машины, поэтому бенчмарк запускается только
+    при заданной переменной RUN_BENCHMARKS.
+    """
+
+    VALIDATIONS_PER_SECOND = 20000
+    ITERATIONS = 20000
+
+    def get_rate(self, validate):
+        """
+        Возвращает количество вызовов validate в секунду.
+        """
+        started = time.perf_counter()
+        for _ in range(self.ITERATIONS):
+            validate()
+        return self.ITERATIONS / (time.perf_counter() - started)
+
+    def assertRate(self, name, validate):
+        """
+        Проверяет скорость проверки валидатором.
+        """
+        rate = self.get_rate(validate)
+        self.assertGreater(
+            rate, self.VALIDATIONS_PER_SECOND, f"{name}: {rate:.0f} проверок/с"
+        )
+
+    def test_name_validator_rate(self):
+        """
+        Тестирует скорость проверки имени сотрудника.
+        """
+        validator = NameValidator(field="name")
+        value = {"name": "Первый Тестовый Сотрудник", "position": "Должность"}
+        self.assertRate("NameValidator", lambda: validator(value))
+
+    def test_deadline_validator_rate(self):
+        """
+        Тестирует скорость проверки срока исполнения новой задачи.
+        """
+        validator = DeadlineValidator(field="deadline")
+        serializer = TaskSerializer()
+        value = {
+            "title": "Задача",
+            "deadline": timezone.now().date() + timedelta(days=30),
+        }
+        self.assertRate("DeadlineValidator", lambda: validator(value, serializer))
+
+
+class TaskFilterTestCase(APITestCase):
+    """
+    Класс тестов фильтрации и поиска в списках задач и сотрудников.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        self.employee2 = Employee.objects.create(
+            name="Второй тестовый сотрудник", position="Должность"
+        )
+        today = timezone.now().date()
+        self.task1 = Task.objects.create(
+            title="Подготовить отчет", deadline=today - timedelta(days=1)
+        )
+        self.task2 = Task.objects.create(
+            title="Проверить отчет",
+            deadline=today + timedelta(days=1),
+            parent_task=self.task1,
+            executor=self.employee1,
+            status="IN_PROGRESS",
+        )
+        self.task3 = Task.objects.create(
+            title="Согласовать бюджет",
+            deadline=today - timedelta(days=2),
+            executor=self.employee2,
+            status="DONE",
+        )
+        self.url = reverse("tasks:tasks")
+
+    def get_ids(self, params, url=None):
+        """
+        Возвращает идентификаторы записей списка, отфильтрованного по параметрам.
+        """
+        response = self.client.get(url or self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(item["id"] for item in response.json()["results"])
+
+    def test_task_list_filters(self):
+        """
+        Тестирует фильтрацию списка задач.
+        """
+        today = timezone.now().date()
+        cases = (
+            ({"status": "IN_PROGRESS"}, [self.task2]),
+            ({"executor": self.employee2.pk}, [self.task3]),
+            ({"executor": "null"}, [self.task1]),
+            ({"parent_task": self.task1.pk}, [self.task2]),
+            ({"parent_task": "null"}, [self.task1, self.task3]),
+            ({"deadline_after": today - timedelta(days=1)}, [self.task1, self.task2]),
+            ({"deadline_before": today - timedelta(days=1)}, [self.task1, self.task3]),
+            ({"overdue": "true"}, [self.task1]),
+            ({"overdue": "false"}, [self.task2, self.task3]),
+            ({"search": "отчет"}, [self.task1, self.task2]),
+            ({"search": "отчет Провер"}, [self.task2]),
+            ({"status": "NEW", "search": "бюджет"}, []),
+        )
+        for params, tasks in cases:
+            with self.subTest(params=params):
+                self.assertEqual(self.get_ids(params), [task.pk for task in tasks])
+
+    def test_task_list_invalid_filters(self):
+        """
+        Тестирует отклонение некорректных значений параметров фильтрации.
+        """
+        for params in (
+            {"status": "UNKNOWN"},
+            {"executor": "first"},
+            {"deadline_after": "01.01.2025"},
+            {"overdue": "maybe"},
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn(next(iter(params)), response.json())
+
+    def test_employee_list_search(self):
+        """
+        Тестирует поиск в списке сотрудников по ФИО.
+        """
+        self.assertEqual(
+            self.get_ids({"search": "Второй"}, reverse("tasks:employees")),
+            [self.employee2.pk],
+        )
+
+    def test_task_export_filters(self):
+        """
+        Тестирует применение фильтров списка задач к выгрузке задач.
+        """
+        self.client.force_authenticate(user=User.objects.create(email="a@b.c"))
+        response = self.client.get(
+            reverse("tasks:task-export", args=("ndjson",)), {"search": "отчет"}
+        )
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line)["id"] for line in lines], [self.task1.pk, self.task2.pk]
+        )
+
+
+@skipUnless(
+    connection.vendor == "postgresql" and os.getenv("RUN_BENCHMARKS"),
+    "Бенчмарк выполняется на PostgreSQL при заданной переменной RUN_BENCHMARKS",
+)
+class TaskFilterBenchmarkTestCase(APITestCase):
+    """
+    Бенчмарк фильтрации списка задач на таблице из миллиона задач.
+    """
+
+    TASKS_COUNT = 1_000_000
+    MAX_RESPONSE_TIME = 0.01
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employees = create_benchmark_data(
+            employees_count=1000, tasks_per_employee=0
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO tasks_task
+                    (title, deadline, status, executor_id, path, depth)
+                SELECT
+                    'Задача номер ' || i,
+                    DATE '2025-01-01' + (i %% 730),
+                    (ARRAY['NEW', 'IN_PROGRESS', 'DONE'])[i %% 3 + 1],
+                    %s + i %% 1000,
+                    '',
+                    0
+                FROM generate_series(1, %s) AS i
+                """,
+                [cls.employees[0].pk, cls.TASKS_COUNT],
+            )
+            cursor.execute("ANALYZE tasks_task")
+
+    def test_filtered_response_time(self):
+        """
+        Тестирует время ответа списка задач с фильтрами и поиском.
+        """
+        url = reverse("tasks:tasks")
+        for params in (
+            {"status": "IN_PROGRESS", "executor": self.employees[10].pk},
+            {"deadline_after": "2025-06-01", "deadline_before": "2025-06-02"},
+            {"overdue": "true", "pagination": "cursor"},
+            {"search": "номер 123456"},
+        ):
+            with self.subTest(params=params):
+                timings = []
+                for _ in range(11):
+                    cache.clear()
+                    started = time.perf_counter()
+                    response = self.client.get(url, params)
+                    timings.append(time.perf_counter() - started)
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                median = sorted(timings)[len(timings) // 2]
+                self.assertLess(median, self.MAX_RESPONSE_TIME, f"{median:.4f} с")
+
+
+class EmployeeSearchTestCase(APITestCase):
+    """
+    Класс тестов поиска сотрудников по ФИО.
+    """
+
+    def setUp(self):
+        names = (
+            "Иванов Петр Сергеевич",
+            "Петрова Анна Ивановна",
+            "Салтыков-Щедрин Михаил Евграфович",
+            "Алиев Рашид оглы",
+        )
+        self.employees = [
+            Employee.objects.create(name=name, position="Должность") for name in names
+        ]
+        self.url = reverse("tasks:employee-search")
+
+    def search(self, query):
+        """
+        Возвращает ФИО найденных сотрудников.
+        """
+        response = self.client.get(self.url, {"q": query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(item["name"] for item in response.json()["results"])
+
+    def test_employee_search(self):
+        """
+        Тестирует поиск сотрудников по началу слов ФИО без учета регистра.
+        """
+        cases = (
+            ("иван", ["Иванов Петр Сергеевич", "Петрова Анна Ивановна"]),
+            ("Петр", ["Иванов Петр Сергеевич", "Петрова Анна Ивановна"]),
+            ("иванов петр", ["Иванов Петр Сергеевич", "Петрова Анна Ивановна"]),
+            ("иванов сер", ["Иванов Петр Сергеевич"]),
+            ("ПЕТРОВА ан", ["Петрова Анна Ивановна"]),
+            ("щедрин", ["Салтыков-Щедрин Михаил Евграфович"]),
+            ("оглы", ["Алиев Рашид оглы"]),
+            ("ванов", []),
+            ("", []),
+        )
+        for query, names in cases:
+            with self.subTest(query=query):
+                self.assertEqual(self.search(query), names)
+
+
+@skipUnless(
+    connection.vendor == "postgresql" and os.getenv("RUN_BENCHMARKS"),
+    "Бенчмарк выполняется на PostgreSQL при заданной переменной RUN_BENCHMARKS",
+)
+class EmployeeSearchBenchmarkTestCase(APITestCase):
+    """
+    Бенчмарк поиска сотрудников на таблице из миллиона сотрудников.
+    """
+
+    EMPLOYEES_COUNT = 1_000_000
+    MAX_RESPONSE_TIME = 0.01
+
+    @classmethod
+    def setUpTestData(cls):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO tasks_employee
+                    (name, position, new_tasks_count, active_tasks_count,
+                     done_tasks_count)
+                SELECT
+                    (ARRAY['Иванов', 'Петров', 'Сидоров', 'Кузнецов'])[i %% 4 + 1]
+                    || 'ский' || i || ' '
+                    || (ARRAY['Петр', 'Иван', 'Анна', 'Мария'])[i %% 7 %% 4 + 1]
+                    || ' Сергеевич',
+                    'Должность', 0, 0, 0
+                FROM generate_series(1, %s) AS i
+                """,
+                [cls.EMPLOYEES_COUNT],
+            )
+            cursor.execute("ANALYZE tasks_employee")
+
+    def test_search_response_time(self):
+        """
+        Тестирует время ответа поиска сотрудников и использование GIN-индекса.
+        """
+        self.assertIn(
+            "employee_search_idx",
+            search_employees(Employee.objects.all(), "петровский12345").explain(),
+        )
+        for query in ("петровский12345", "сидоровский123 анна"):
+            with self.subTest(query=query):
+                timings = []
+                for _ in range(11):
+                    started = time.perf_counter()
+                    response = self.client.get(
+                        reverse("tasks:employee-search"), {"q": query}
+                    )
+                    timings.append(time.perf_counter() - started)
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                median = sorted(timings)[len(timings) // 2]
+                self.assertLess(median, self.MAX_RESPONSE_TIME, f"{median:.4f} с")
+
+
+class AdminTestCase(APITestCase):
+    """
+    Класс тестов административной панели задач и сотрудников.
+    """
+
+    def setUp(self):
+        self.admin = User.objects.create(
+            email="admin@example.com", is_staff=True, is_superuser=True
+        )
+        self.client.force_login(self.admin)
+        self.employee1 = Employee.objects.create(
+            name="Иванов Петр Сергеевич", position="Разработчик"
+        )
+        self.employee2 = Employee.objects.create(
+            name="Петрова Анна Ивановна", position="Аналитик"
+        )
+        self.root_task = Task.objects.create(
+            title="Корневая задача", deadline="2025-01-01"
+        )
+        self.url = reverse("admin:tasks_task_changelist")
+
+    def create_tasks(self, count):
+        """
+        Создает задачи с исполнителями и родительской задачей.
+        """
+        Task.objects.bulk_create(
+            Task(
+                title=f"Задача{i}",
+                deadline="2025-01-01",
+                parent_task=self.root_task,
+                executor=(self.employee1, self.employee2)[i % 2],
+            )
+            for i in range(count)
+        )
+
+    def get_result_ids(self, params):
+        """
+        Возвращает идентификаторы записей списка административной панели.
+        """
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(obj.pk for obj in response.context["cl"].result_list)
+
+    def test_task_changelist_query_count(self):
+        """
+        Тестирует независимость количества запросов списка задач
+        от количества задач и исполнителей на странице.
+        """
+        self.create_tasks(2)
+        with CaptureQueriesContext(connection) as small_page_queries:
+            self.client.get(self.url)
+
+        self.create_tasks(100)
+        Employee.objects.bulk_create(
+            Employee(name=f"Сотрудник Номер{i}", position="Должность")
+            for i in range(50)
+        )
+        with self.assertNumQueries(len(small_page_queries)):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.context["cl"].result_list), 100)
+
+    def test_task_changelist_filters(self):
+        """
+        Тестирует фильтры списка задач с вводом значения.
+        """
+        self.create_tasks(4)
+        tasks = Task.objects.filter(executor=self.employee2).order_by("pk")
+        cases = (
+            ({"executor": self.employee2.pk}, list(tasks)),
+            ({"executor": "Петрова"}, list(tasks)),
+            ({"executor": "null"}, [self.root_task]),
+            ({"parent_task": "null"}, [self.root_task]),
+            ({"parent_task": "999", "q": "Задача"}, []),
+        )
+        for params, expected in cases:
+            with self.subTest(params=params):
+                self.assertEqual(
+                    self.get_result_ids(params), [task.pk for task in expected]
+                )
+
+    def test_employee_autocomplete(self):
+        """
+        Тестирует автодополнение исполнителя задачи по началу слов ФИО.
+        """
+        response = self.client.get(
+            reverse("admin:autocomplete"),
+            {
+                "app_label": "tasks",
+                "model_name": "task",
+                "field_name": "executor",
+                "term": "анна",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.json()["results"]],
+            [str(self.employee2.pk)],
+        )
+
+    def test_employee_changelist(self):
+        """
+        Тестирует список сотрудников с фильтром по должности и поиском.
+        """
+        url = reverse("admin:tasks_employee_changelist")
+        response = self.client.get(url, {"position": "Разраб", "q": "петр"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.context["cl"].result_list), [self.employee1])
+
+
+@override_settings(METRICS_ENABLED=True)
+@modify_settings(MIDDLEWARE={"prepend": "config.metrics.MetricsMiddleware"})
+class MetricsTestCase(APITestCase):
+    """
+    Класс тестов сбора показателей запросов.
+    """
+
+    def setUp(self):
+        cache.clear()
+        registry.clear()
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.client.force_authenticate(user=self.user1)
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        Task.objects.create(
+            title="Тестовая задача1",
+            deadline=timezone.now().date() + timedelta(days=30),
+            executor=self.employee1,
+        )
+
+    def test_server_timing(self):
+        """
+        Тестирует заголовок Server-Timing с количеством запросов к БД.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("tasks:important-tasks"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        server_timing = response["Server-Timing"]
+        self.assertIn(f'desc="{len(queries)} queries"', server_timing)
+        for metric in ("db;dur=", "render;dur=", "total;dur="):
+            self.assertIn(metric, server_timing)
+
+    def test_metrics_endpoint(self):
+        """
+        Тестирует выдачу показателей по именам представлений.
+        """
+        for _ in range(2):
+            self.client.get(reverse("tasks:important-tasks"))
+        self.client.get(reverse("tasks:employees"))
+
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        content = response.content.decode()
+        self.assertIn("# TYPE http_request_duration_seconds summary", content)
+        self.assertIn(
+            'http_request_duration_seconds_count{view="tasks:important-tasks"} 2',
+            content,
+        )
+        self.assertIn(
+            'http_request_db_queries_count{view="tasks:employees"} 1', content
+        )
+
+    async def test_async_server_timing(self):
+        """
+        Тестирует учет запросов к БД асинхронного контроллера в режиме ASGI.
+        """
+        response = await self.async_client.get(reverse("tasks:async-tasks"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('desc="2 queries"', response["Server-Timing"])
+        self.assertIn(
+            'http_request_db_queries_sum{view="tasks:async-tasks"} 2',
+            registry.render(),
+        )
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_metrics_disabled(self):
+        """
+        Тестирует недоступность показателей при отключенном сборе.
+        """
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class SeedPerfTestCase(APITestCase):
+    """
+    Класс тестов заполнения БД синтетическими данными.
+    """
+
+    def test_seed_perf(self):
+        """
+        Тестирует создание леса задач с согласованными путями,
+        счетчиками задач сотрудников и записями о важных задачах.
+        """
+        call_command(
+            "seed_perf",
+            employees=5,
+            roots=2,
+            depth=2,
+            children=3,
+            stdout=StringIO(),
+        )
+        self.assertEqual(Employee.objects.count(), 5)
+        self.assertEqual(Task.objects.count(), 2 + 6 + 18)
+        self.assertEqual(Task.objects.filter(depth=2).count(), 18)
+        self.assertFalse(get_inconsistent_paths().exists())
+        self.assertEqual(get_inconsistent_workload(), [])
+        self.assertEqual(get_inconsistent_important_tasks(), [])
+        self.assertFalse(
+            Task.objects.filter(deadline__lt=F("parent_task__deadline")).exists()
+        )
+        for name in Employee.objects.values_list("name", flat=True):
+            NameValidator(field="name")({"name": name})
+
+    def test_seed_perf_clear(self):
+        """
+        Тестирует повторяемость данных и удаление прежних данных.
+        """
+        options = {"employees": 3, "roots": 2, "depth": 1, "children": 2}
+        call_command("seed_perf", **options, stdout=StringIO())
+        names = list(Employee.objects.order_by("pk").values_list("name", flat=True))
+        call_command("seed_perf", **options, clear=True, stdout=StringIO())
+        self.assertEqual(
+            list(Employee.objects.order_by("pk").values_list("name", flat=True)),
+            names,
+        )
+        self.assertEqual(Task.objects.count(), 6)
+
+    def test_seed_perf_depth_limit(self):
+        """
+        Тестирует ограничение уровня вложенности задач.
+        """
+        with self.assertRaises(CommandError):
+            call_command("seed_perf", depth=Task.MAX_DEPTH + 1, stdout=StringIO())
+
+
+class EndpointBenchmarkCoverageTestCase(SimpleTestCase):
+    """
+    Класс тестов полноты бенчмарка эндпоинтов.
+    """
+
+    def test_all_endpoints_covered(self):
+        """
+        Тестирует наличие запроса бенчмарка для каждого эндпоинта.
+        """
+        self.assertCountEqual(
+            benchmarks.get_endpoint_names(), benchmarks.BENCHMARK_CASES
+        )
+
+
+@skipUnless(
+    os.getenv("RUN_BENCHMARKS"),
+    "Бенчмарк выполняется при заданной переменной RUN_BENCHMARKS",
+)
+class EndpointBenchmarkTestCase(APITestCase):
+    """
+    Бенчмарк всех эндпоинтов tasks.urls и users.urls на данных seed_perf.
+
+    Время ответа и количество запросов к БД сравниваются с базовыми
+    показателями для СУБД из benchmark_baseline.json. Переменная
+    BENCHMARK_UPDATE_BASELINE записывает полученные показатели как базовые,
+    BENCHMARK_LATENCY_TOLERANCE задает допустимое замедление в разах.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            "seed_perf", **benchmarks.BENCHMARK_SEED_OPTIONS, stdout=StringIO()
+        )
+        cls.fixture = benchmarks.get_benchmark_fixture()
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.fixture["user"])
+
+    def test_endpoints(self):
+        """
+        Тестирует отсутствие регрессий времени ответа и количества запросов.
+        """
+        results = {}
+        for name in benchmarks.BENCHMARK_CASES:
+            result = benchmarks.measure_endpoint(self.client, name, self.fixture)
+            self.assertLess(result["status_code"], 400, name)
+            results[name] = result
+
+        if os.getenv("BENCHMARK_UPDATE_BASELINE"):
+            benchmarks.save_baseline(connection.vendor, results)
+            return
+        baseline = benchmarks.load_baseline(connection.vendor)
+        if baseline is None:
+            self.skipTest(
+                f"Нет базовых показателей для {connection.vendor}: запишите их "
+                "с переменной BENCHMARK_UPDATE_BASELINE"
+            )
+        self.assertEqual(baseline["seed_options"], benchmarks.BENCHMARK_SEED_OPTIONS)
+        regressions = benchmarks.get_regressions(
+            results,
+            baseline,
+            float(
+                os.getenv(
+                    "BENCHMARK_LATENCY_TOLERANCE", benchmarks.LATENCY_TOLERANCE
+                )
+            ),
+        )
+        self.assertEqual(regressions, [], "\n".join(regressions))
+
+
+class AsyncViewTestCase(APITestCase):
+    """
+    Класс тестов асинхронных контроллеров чтения.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.deadline = timezone.now().date() + timedelta(days=30)
+        self.employees = Employee.objects.bulk_create(
+            Employee(name=f"Сотрудник Номер{i}", position="Должность")
+            for i in range(7)
+        )
+        self.tasks = Task.objects.bulk_create(
+            Task(
+                title=f"Тестовая задача{i}",
+                deadline=self.deadline + timedelta(days=i),
+                executor=self.employees[i % 2],
+                status="IN_PROGRESS" if i % 2 else "NEW",
+            )
+            for i in range(8)
+        )
+
+    def assertSameResponses(self, sync_url, async_url, params=None):
+        """
+        Проверяет совпадение ответов синхронного и асинхронного контроллеров
+        с точностью до адресов ссылок на страницы.
+        """
+        with CaptureQueriesContext(connection) as sync_queries:
+            sync_response = self.client.get(sync_url, params)
+        cache.clear()
+        with self.assertNumQueries(len(sync_queries)):
+            async_response = self.client.get(async_url, params)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(
+            async_response.content.decode(),
+            sync_response.content.decode().replace(
+                f"testserver{sync_url}", f"testserver{async_url}"
+            ),
+        )
+        return async_response
+
+    def test_lists(self):
+        """
+        Тестирует списки задач и сотрудников с фильтрацией и постраничным
+        выводом.
+        """
+        cases = (
+            ("tasks:tasks", "tasks:async-tasks", None),
+            ("tasks:tasks", "tasks:async-tasks", {"page": 2}),
+            ("tasks:tasks", "tasks:async-tasks", {"page": "last"}),
+            ("tasks:tasks", "tasks:async-tasks", {"page": 9}),
+            ("tasks:tasks", "tasks:async-tasks", {"status": "NEW", "search": "1"}),
+            ("tasks:tasks", "tasks:async-tasks", {"status": "UNKNOWN"}),
+            ("tasks:tasks", "tasks:async-tasks", {"pagination": "cursor"}),
+            ("tasks:employees", "tasks:async-employees", None),
+            ("tasks:employees", "tasks:async-employees", {"search": "Номер6"}),
+            ("tasks:employees", "tasks:async-employees", {"pagination": "cursor"}),
+        )
+        for sync_name, async_name, params in cases:
+            with self.subTest(name=async_name, params=params):
+                cache.clear()
+                self.assertSameResponses(
+                    reverse(sync_name), reverse(async_name), params
+                )
+
+    def test_cursor_pagination(self):
+        """
+        Тестирует переход по страницам постраничного вывода по ключу.
+        """
+        url = reverse("tasks:async-tasks")
+        response = self.client.get(url, {"pagination": "cursor"})
+        ids = [item["id"] for item in response.json()["results"]]
+        response = self.client.get(response.json()["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids.extend(item["id"] for item in response.json()["results"])
+        self.assertIsNone(response.json()["next"])
+        self.assertEqual(
+            ids,
+            list(Task.objects.order_by("-deadline", "id").values_list("pk", flat=True)),
+        )
+
+    def test_retrieve(self):
+        """
+        Тестирует просмотр задачи и сотрудника, в том числе отсутствующих.
+        """
+        cases = (
+            ("tasks:task", "tasks:async-task", self.tasks[0].pk),
+            ("tasks:task", "tasks:async-task", 0),
+            ("tasks:employee", "tasks:async-employee", self.employees[0].pk),
+            ("tasks:employee", "tasks:async-employee", 0),
+        )
+        for sync_name, async_name, pk in cases:
+            with self.subTest(name=async_name, pk=pk):
+                cache.clear()
+                self.assertSameResponses(
+                    reverse(sync_name, args=(pk,)), reverse(async_name, args=(pk,))
+                )
+
+    def test_cached_responses(self):
+        """
+        Тестирует кэширование ответов и условные запросы.
+        """
+        url = reverse("tasks:async-task", args=(self.tasks[0].pk,))
+        response = self.client.get(url)
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(url)
+        self.assertEqual(cached_response.content, response.content)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.tasks[0].title = "Измененная задача"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tasks[0].save()
+        response = self.client.get(url)
+        self.assertEqual(response.json()["title"], "Измененная задача")
+
+    def test_read_only(self):
+        """
+        Тестирует отклонение изменяющих запросов.
+        """
+        response = self.client.post(reverse("tasks:async-tasks"), {})
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+
+class LoadTestCommandTestCase(LiveServerTestCase):
+    """
+    Класс тестов команды нагрузочного тестирования.
+    """
+
+    def test_loadtest(self):
+        """
+        Тестирует сравнение синхронных и асинхронных контроллеров
+        на запущенном сервере.
+        """
+        employee = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        Task.objects.create(
+            title="Тестовая задача1",
+            deadline=timezone.now().date() + timedelta(days=30),
+            executor=employee,
+        )
+        out = StringIO()
+        call_command(
+            "loadtest",
+            base_url=self.live_server_url,
+            requests=4,
+            concurrency=2,
+            stdout=out,
+        )
+        rows = out.getvalue().splitlines()[1:]
+        self.assertEqual(
+            [row.split()[0] for row in rows],
+            [
+                "tasks:tasks",
+                "tasks:async-tasks",
+                "tasks:task",
+                "tasks:async-task",
+                "tasks:employees",
+                "tasks:async-employees",
+                "tasks:employee",
+                "tasks:async-employee",
+            ],
+        )
+        self.assertEqual({row.split()[-1] for row in rows}, {"0"})
+
+    def test_loadtest_without_data(self):
+        """
+        Тестирует ошибку при отсутствии объектов для просмотра.
+        """
+        with self.assertRaises(CommandError):
+            call_command(
+                "loadtest",
+                base_url=self.live_server_url,
+                requests=1,
+                stdout=StringIO(),
+            )
+
+
+class FakeConnection:
+    """
+    Соединение с БД для тестов пула соединений.
+    """
+
+    def __init__(self, transaction_status=TRANSACTION_STATUS_IDLE):
+        self.closed = 0
+        self.info = SimpleNamespace(transaction_status=transaction_status)
+        self.rollbacks = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    """
+    Класс тестов пула соединений с БД.
+    """
+
+    def setUp(self):
+        self.pool = ConnectionPool(max_size=2, timeout=0.05)
+
+    def test_reuse_connection(self):
+        """
+        Тестирует повторную выдачу соединения, возвращенного в пул.
+        """
+        connection = self.pool.getconn(FakeConnection)
+        self.pool.putconn(connection)
+        self.assertIs(self.pool.getconn(FakeConnection), connection)
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["checkouts"], 2)
+        self.assertEqual(stats["checked_out"], 1)
+        self.assertEqual(stats["idle"], 0)
+
+    def test_timeout(self):
+        """
+        Тестирует ошибку при исчерпании пула.
+        """
+        self.pool.getconn(FakeConnection)
+        self.pool.getconn(FakeConnection)
+        with self.assertRaises(PoolTimeout):
+            self.pool.getconn(FakeConnection)
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["waits"], 1)
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertGreater(stats["wait_time"], 0)
+
+    def test_wait_for_connection(self):
+        """
+        Тестирует выдачу соединения, освободившегося во время ожидания.
+        """
+        self.pool.timeout = 5
+        first = self.pool.getconn(FakeConnection)
+        self.pool.getconn(FakeConnection)
+        timer = threading.Timer(0.05, self.pool.putconn, (first,))
+        timer.start()
+        self.assertIs(self.pool.getconn(FakeConnection), first)
+        timer.join()
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["waits"], 1)
+        self.assertEqual(stats["timeouts"], 0)
+
+    def test_rollback_on_put(self):
+        """
+        Тестирует откат незавершенной транзакции при возврате соединения.
+        """
+        connection = self.pool.getconn(
+            lambda: FakeConnection(TRANSACTION_STATUS_INERROR)
+        )
+        self.pool.putconn(connection)
+        self.assertEqual(connection.rollbacks, 1)
+        self.assertEqual(self.pool.get_stats()["idle"], 1)
+
+    def test_discard_unusable_connections(self):
+        """
+        Тестирует отбрасывание закрытых и не прошедших проверку соединений.
+        """
+        closed = self.pool.getconn(FakeConnection)
+        broken = self.pool.getconn(FakeConnection)
+        self.pool.putconn(broken)
+        closed.close()
+        self.pool.putconn(closed)
+        self.assertEqual(self.pool.get_stats()["idle"], 1)
+
+        connection = self.pool.getconn(FakeConnection, check=lambda conn: False)
+        self.assertIsNot(connection, broken)
+        self.assertTrue(broken.closed)
+        self.assertEqual(self.pool.get_stats()["created"], 3)
+
+    def test_failed_connect_releases_slot(self):
+        """
+        Тестирует освобождение места в пуле при ошибке подключения.
+        """
+
+        def connect():
+            raise OSError
+
+        for _ in range(3):
+            with self.assertRaises(OSError):
+                self.pool.getconn(connect)
+        self.assertEqual(self.pool.get_stats()["checked_out"], 0)
+
+    def test_expired_connections(self):
+        """
+        Тестирует закрытие соединений, превысивших время жизни или простоя.
+        """
+        self.pool.max_lifetime = 100
+        self.pool.max_idle = 10
+        with patch("config.postgresql_pool.pool.time.monotonic") as monotonic:
+            monotonic.return_value = 0
+            old = self.pool.getconn(FakeConnection)
+            monotonic.return_value = 95
+            self.pool.putconn(old)
+            monotonic.return_value = 101
+            connection = self.pool.getconn(FakeConnection)
+            self.assertIsNot(connection, old)
+            self.assertTrue(old.closed)
+
+            self.pool.putconn(connection)
+            monotonic.return_value = 105
+            self.assertIs(self.pool.getconn(FakeConnection), connection)
+            self.pool.putconn(connection)
+            monotonic.return_value = 116
+            self.assertIsNot(self.pool.getconn(FakeConnection), connection)
+            self.assertTrue(connection.closed)
+        self.assertEqual(self.pool.get_stats()["expired"], 2)
+
+    def test_close_idle(self):
+        """
+        Тестирует закрытие свободных соединений пулов процесса.
+        """
+        conn_params = {"database": "pool_test"}
+        self.addCleanup(pools.pop, get_pool_key("pool_test", conn_params), None)
+        pool = get_pool("pool_test", conn_params, 2, 1)
+        idle = pool.getconn(FakeConnection)
+        checked_out = pool.getconn(FakeConnection)
+        pool.putconn(idle)
+
+        self.assertEqual(close_pools("other"), 0)
+        self.assertEqual(close_pools("pool_test"), 1)
+        self.assertTrue(idle.closed)
+        self.assertFalse(checked_out.closed)
+        self.assertEqual(pool.get_stats()["idle"], 0)
+
+    def test_close_idle_before_destroy_test_db(self):
+        """
+        Тестирует закрытие свободных соединений пула перед удалением тестовой БД.
+        """
+        creation = DatabaseCreation(SimpleNamespace(alias="pool_test"))
+        base_class = DatabaseCreation.__bases__[0]
+        with patch("config.postgresql_pool.creation.close_pools") as close:
+            with patch.object(base_class, "_destroy_test_db") as destroy:
+                creation._destroy_test_db("test_pool_test", verbosity=0)
+        close.assert_called_once_with("pool_test")
+        destroy.assert_called_once_with("test_pool_test", 0)
+
+    def test_get_pool(self):
+        """
+        Тестирует выдачу пулов процесса по БД и показателей пула.
+        """
+        conn_params = {"database": "pool_test"}
+        self.addCleanup(pools.pop, get_pool_key("pool_test", conn_params), None)
+        self.assertIsNone(get_pool_stats("pool_test", conn_params))
+
+        pool = get_pool("pool_test", conn_params, 3, 1)
+        self.assertIs(get_pool("pool_test", conn_params, 3, 1), pool)
+        self.assertIsNot(get_pool("pool_test", {"database": "other"}, 3, 1), pool)
+        self.addCleanup(
+            pools.pop, get_pool_key("pool_test", {"database": "other"}), None
+        )
+        self.assertEqual(get_pool_stats("pool_test", conn_params)["max_size"], 3)
+
+        with patch("config.postgresql_pool.pool.os.getpid", return_value=-1):
+            self.assertIsNot(get_pool("pool_test", conn_params, 3, 1), pool)
+
+
+class DatabaseDiagnosticsTestCase(APITestCase):
+    """
+    Класс тестов эндпоинта диагностики соединений с БД.
+    """
+
+    def test_diagnostics_admin(self):
+        """
+        Тестирует вывод параметров соединений администратору.
+        """
+        admin = User.objects.create(email="admin@example.com", is_staff=True)
+        self.client.force_authenticate(user=admin)
+        response = self.client.get(reverse("diagnostics-db"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["default"],
+            {
+                "vendor": connection.vendor,
+                "engine": connection.settings_dict["ENGINE"],
+                "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+                "conn_health_checks": connection.settings_dict[
+                    "CONN_HEALTH_CHECKS"
+                ],
+                "pool": None,
+            },
+        )
+
+    def test_diagnostics_forbidden(self):
+        """
+        Тестирует запрет доступа пользователю без прав администратора.
+        """
+        response = self.client.get(reverse("diagnostics-db"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        user = User.objects.create(email="user1@example.com")
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse("diagnostics-db"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(
+    DATABASE_REPLICAS=["default"],
+    DATABASE_ROUTERS=["config.replicas.ReplicaRouter"],
+)
+@modify_settings(MIDDLEWARE={"append": "config.replicas.ReplicaMiddleware"})
+class ReplicaRoutingTestCase(APITestCase):
+    """
+    Класс тестов маршрутизации чтения на реплики БД. Роль реплики
+    в тестах выполняет основная БД.
+    """
+
+    def setUp(self):
+        cache.clear()
+        unavailable_replicas.clear()
+        self.addCleanup(unavailable_replicas.clear)
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.employee1 = Employee.objects.create(
+            name="Первый тестовый сотрудник", position="Должность"
+        )
+        self.task1 = Task.objects.create(
+            title="Тестовая задача1",
+            deadline=timezone.now().date() + timedelta(days=30),
+            executor=self.employee1,
+        )
+
+    def test_public_read_uses_replica(self):
+        """
+        Тестирует чтение с реплики в общедоступных контроллерах.
+        """
+        for url in (
+            reverse("tasks:tasks"),
+            reverse("tasks:task", args=(self.task1.pk,)),
+            reverse("tasks:employees"),
+            reverse("tasks:async-tasks"),
+        ):
+            with self.subTest(url=url):
+                with patch("config.replicas.get_replica", wraps=get_replica) as mock:
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                mock.assert_called_once_with()
+                self.assertNotIn(settings.REPLICA_PIN_COOKIE, response.cookies)
+
+    def test_private_read_uses_primary(self):
+        """
+        Тестирует чтение из основной БД в контроллерах, требующих
+        аутентификации.
+        """
+        self.client.force_authenticate(user=self.user1)
+        with patch("config.replicas.get_replica") as mock:
+            response = self.client.get(reverse("tasks:important-tasks"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock.assert_not_called()
+
+    def test_read_after_write_uses_primary(self):
+        """
+        Тестирует чтение из основной БД после записи клиента.
+        """
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.patch(
+            reverse("tasks:employee-update", args=(self.employee1.pk,)),
+            {"position": "Новая должность"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(settings.REPLICA_PIN_COOKIE, response.cookies)
+
+        with patch("config.replicas.get_replica") as mock:
+            response = self.client.get(reverse("tasks:employees"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock.assert_not_called()
+
+    def test_replica_read_not_cached(self):
+        """
+        Тестирует отказ от кэширования ответов, прочитанных с реплики
+        после записи: реплика может еще не содержать изменений.
+        """
+        url = reverse("tasks:task", args=(self.task1.pk,))
+        self.client.force_authenticate(user=self.user1)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse("tasks:task-update", args=(self.task1.pk,)),
+                {"title": "Измененная задача"},
+            )
+        self.assertIn(settings.REPLICA_PIN_COOKIE, response.cookies)
+
+        anonymous_client = self.client_class()
+        with patch("config.replicas.get_replica", wraps=get_replica) as mock:
+            for _ in range(2):
+                response = anonymous_client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertIn("ETag", response)
+        self.assertEqual(mock.call_count, 2)
+
+        self.client.get(url)
+        with patch("config.replicas.get_replica") as mock:
+            with self.assertNumQueries(0):
+                response = anonymous_client.get(url)
+        self.assertEqual(response.json()["title"], "Измененная задача")
+        mock.assert_not_called()
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_router(self):
+        """
+        Тестирует выбор реплики один раз на запрос и чтение из основной БД
+        после записи.
+        """
+        router = ReplicaRouter()
+        self.assertIsNone(router.db_for_read(Task))
+        with patch("config.replicas.check_replica", return_value=True) as check:
+            with use_replicas():
+                self.assertEqual(router.db_for_read(Task), "replica")
+                self.assertEqual(router.db_for_read(Employee), "replica")
+                self.assertEqual(router.db_for_write(Task), "default")
+                self.assertIsNone(router.db_for_read(Task))
+        check.assert_called_once_with("replica")
+
+    @override_settings(DATABASE_REPLICAS=["missing"])
+    def test_missing_replica(self):
+        """
+        Тестирует чтение из основной БД при отсутствии реплики и исключение
+        недоступной реплики из выбора.
+        """
+        with patch("config.replicas.check_replica", wraps=check_replica) as check:
+            for _ in range(2):
+                response = self.client.get(
+                    reverse("tasks:task", args=(self.task1.pk,)),
+                    {"nocache": time.monotonic()},
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json()["title"], self.task1.title)
+        check.assert_called_once_with("missing")
+        self.assertIn("missing", unavailable_replicas)
+
+
+class FastJSONTestCase(SimpleTestCase):
+    """
+    Класс тестов рендерера и парсера JSON на основе orjson.
+    """
+
+    def get_data(self):
+        return {
+            **benchmarks.get_json_benchmark_payload(100),
+            "detail": gettext_lazy("Not found."),
+            "amount": Decimal("1.5"),
+            "separators": "строка\u2028абзац\u2029",
+            1: [None, True, 2.5],
+        }
+
+    def test_renderer_matches_json_renderer(self):
+        """
+        Тестирует совпадение ответа с ответом стандартного рендерера,
+        в том числе без orjson.
+        """
+        data = self.get_data()
+        expected = JSONRenderer().render(data)
+        self.assertEqual(FastJSONRenderer().render(data), expected)
+        with patch("config.fastjson.orjson", None):
+            self.assertEqual(FastJSONRenderer().render(data), expected)
+        self.assertIn(b'"deadline":"', expected)
+
+    def test_renderer_indent(self):
+        """
+        Тестирует вывод с отступами, запрошенными в типе содержимого.
+        """
+        data = self.get_data()
+        media_type = "application/json; indent=2"
+        self.assertEqual(
+            FastJSONRenderer().render(data, media_type),
+            JSONRenderer().render(data, media_type),
+        )
+
+    def test_parser(self):
+        """
+        Тестирует разбор JSON и ошибку разбора, в том числе без orjson.
+        """
+        content = '{"title": "Задача", "deadline": "2025-01-01"}'.encode()
+        for orjson_module in (fastjson.orjson, None):
+            with self.subTest(orjson=orjson_module is not None):
+                with patch("config.fastjson.orjson", orjson_module):
+                    parser = FastJSONParser()
+                    self.assertEqual(
+                        parser.parse(BytesIO(content)),
+                        {"title": "Задача", "deadline": "2025-01-01"},
+                    )
+                    with self.assertRaises(ParseError):
+                        parser.parse(BytesIO(b'{"title": '))
+
+    @skipUnless(fastjson.orjson, "Требуется orjson")
+    def test_renderer_throughput(self):
+        """
+        Тестирует ускорение кодирования ответа со списком задач.
+        """
+        results = benchmarks.measure_json_throughput(
+            benchmarks.get_json_benchmark_payload(), repeat=3
+        )
+        self.assertEqual(results["fastjson"]["size"], results["json"]["size"])
+        self.assertLess(results["fastjson"]["render_ms"], results["json"]["render_ms"])
+
+    def test_bench_json_command(self):
+        """
+        Тестирует вывод команды сравнения рендереров.
+        """
+        out = StringIO()
+        call_command("bench_json", tasks=10, repeat=1, stdout=out)
+        rows = out.getvalue().splitlines()[1:]
+        self.assertEqual([row.split()[0] for row in rows], ["json", "fastjson"])
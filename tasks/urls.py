@@ -1,12 +1,19 @@
-from django.urls import path
+from django.urls import path, re_path
 
 from tasks.apps import TasksConfig
+from tasks.async_views import (AsyncEmployeeListAPIView,
+                               AsyncEmployeeRetrieveAPIView,
+                               AsyncTaskListAPIView, AsyncTaskRetrieveAPIView)
 from tasks.views import (BusyEmployeeListAPIView, EmployeeCreateAPIView,
-                         EmployeeDestroyAPIView, EmployeeListAPIView,
-                         EmployeeRetrieveAPIView, EmployeeUpdateAPIView,
-                         ImportantTaskListAPIView, TaskCreateAPIView,
-                         TaskDestroyAPIView, TaskListAPIView,
-                         TaskRetrieveAPIView, TaskUpdateAPIView)
+                         EmployeeDestroyAPIView, EmployeeExportAPIView,
+                         EmployeeListAPIView, EmployeeRetrieveAPIView,
+                         EmployeeSearchAPIView, EmployeeUpdateAPIView,
+                         ImportantTaskListAPIView, TaskAncestorsAPIView,
+                         TaskBulkCreateAPIView, TaskBulkUpdateAPIView,
+                         TaskCreateAPIView, TaskDestroyAPIView,
+                         TaskExportAPIView, TaskListAPIView,
+                         TaskRetrieveAPIView, TaskTreeAPIView,
+                         TaskUpdateAPIView)
 
 app_name = TasksConfig.name
 
@@ -14,6 +21,9 @@ urlpatterns = [
     path("employees/create", EmployeeCreateAPIView.as_view(), name="employee-create"),
     path("employees/", EmployeeListAPIView.as_view(), name="employees"),
     path("employees/busy/", BusyEmployeeListAPIView.as_view(), name="busy-employees"),
+    path(
+        "employees/search/", EmployeeSearchAPIView.as_view(), name="employee-search"
+    ),
     path("employees/<int:pk>/", EmployeeRetrieveAPIView.as_view(), name="employee"),
     path(
         "employees/<int:pk>/update/",
@@ -25,10 +35,38 @@ urlpatterns = [
         EmployeeDestroyAPIView.as_view(),
         name="employee-delete",
     ),
+    re_path(
+        r"^export/employees\.(?P<export_format>ndjson|csv)$",
+        EmployeeExportAPIView.as_view(),
+        name="employee-export",
+    ),
+    re_path(
+        r"^export/tasks\.(?P<export_format>ndjson|csv)$",
+        TaskExportAPIView.as_view(),
+        name="task-export",
+    ),
     path("create/", TaskCreateAPIView.as_view(), name="task-create"),
+    path("bulk/create/", TaskBulkCreateAPIView.as_view(), name="task-bulk-create"),
+    path("bulk/update/", TaskBulkUpdateAPIView.as_view(), name="task-bulk-update"),
     path("", TaskListAPIView.as_view(), name="tasks"),
     path("important/", ImportantTaskListAPIView.as_view(), name="important-tasks"),
     path("<int:pk>/", TaskRetrieveAPIView.as_view(), name="task"),
+    path("<int:pk>/tree/", TaskTreeAPIView.as_view(), name="task-tree"),
+    path(
+        "<int:pk>/ancestors/", TaskAncestorsAPIView.as_view(), name="task-ancestors"
+    ),
     path("<int:pk>/update/", TaskUpdateAPIView.as_view(), name="task-update"),
     path("<int:pk>/delete/", TaskDestroyAPIView.as_view(), name="task-delete"),
+    path("async/", AsyncTaskListAPIView.as_view(), name="async-tasks"),
+    path("async/<int:pk>/", AsyncTaskRetrieveAPIView.as_view(), name="async-task"),
+    path(
+        "async/employees/",
+        AsyncEmployeeListAPIView.as_view(),
+        name="async-employees",
+    ),
+    path(
+        "async/employees/<int:pk>/",
+        AsyncEmployeeRetrieveAPIView.as_view(),
+        name="async-employee",
+    ),
 ]
@@ -3,6 +3,29 @@ import re
 from django.utils import timezone
 from rest_framework.serializers import ValidationError
 
+from tasks.models import Task
+
+# Фамилия, имя и необязательное отчество кириллицей через пробел или дефис
+NAME_PATTERN = re.compile(
+    r"^[А-ЯЁ]{1}[а-яё]{0,}[\s-]{1}(?:[А-Яа-яЁё]{1}[а-яё]{0,}[\s-]{1}){0,}[А-Яа-яЁё]{1}[а-яё]{0,}$"
+)
+NAME_MESSAGE = (
+    "Фамилия, имя и отчетсво могут содержать только буквы кириллицы и дефисы. "
+    "Фамилия, имя и отчетсво начинаются с заглавной буквы. Допустимо отсутсвие отчества."
+)
+
+
+def get_today(serializer):
+    """
+    Возвращает текущую дату, вычисляемую один раз на сериализатор верхнего
+    уровня (то есть на запрос) и сохраняемую в его контексте.
+    """
+    context = serializer.context
+    today = context.get("today")
+    if today is None:
+        today = context["today"] = timezone.now().date()
+    return today
+
 
 class NameValidator:
     """
@@ -13,31 +36,70 @@ class NameValidator:
         self.field = field
 
     def __call__(self, value):
-        reg = re.compile(
-            "^[А-ЯЁ]{1}[а-яё]{0,}[\s-]{1}(?:[А-Яа-яЁё]{1}[а-яё]{0,}[\s-]{1}){0,}[А-Яа-яЁё]{1}[а-яё]{0,}$"
-        )
-        tmp_name = dict(value).get(self.field)
-        if not bool(reg.match(tmp_name)):
-            raise ValidationError(
-                "Фамилия, имя и отчетсво могут содержать только буквы кириллицы и дефисы. "
-                "Фамилия, имя и отчетсво начинаются с заглавной буквы. Допустимо отсутсвие отчества."
-            )
+        name = value.get(self.field)
+        if name is not None and NAME_PATTERN.match(name) is None:
+            raise ValidationError(NAME_MESSAGE)
+
+
+DEADLINE_IN_PAST_MESSAGE = "Срок исполнения должен быть больше текущей даты."
+DEADLINE_BEFORE_PARENT_MESSAGE = (
+    "Срок исполнения задачи не может быть меньше срока исполнения связанной задачи."
+)
+DEADLINE_AFTER_DESCENDANTS_MESSAGE = (
+    "Срок исполнения задачи не может быть больше срока исполнения зависимых задач."
+)
+PARENT_TASK_CYCLE_MESSAGE = (
+    "Задача не может зависеть от самой себя или от зависимой от нее задачи."
+)
+TASK_DEPTH_MESSAGE = f"Уровень вложенности задач не может быть больше {Task.MAX_DEPTH}."
 
 
 class DeadlineValidator:
     """
     Валидатор срока исполнения задачи.
+
+    При изменении задачи также проверяет отсутствие циклов в зависимостях задач
+    и сроки исполнения всех зависимых задач по пути к задаче, без рекурсивных запросов.
+    При смене родительской задачи проверяет, что уровень вложенности задачи
+    и ее зависимых задач не превысит Task.MAX_DEPTH.
     """
 
+    requires_context = True
+
     def __init__(self, field):
         self.field = field
 
-    def __call__(self, value):
-        deadline = dict(value).get(self.field)
-        if deadline and deadline < timezone.now().date():
-            raise ValidationError("Срок исполнения должен быть больше текущей даты.")
+    def __call__(self, value, serializer):
+        instance = getattr(serializer, "instance", None)
+        deadline = value.get(self.field)
+        if deadline and deadline < get_today(serializer):
+            raise ValidationError(DEADLINE_IN_PAST_MESSAGE)
         parent_task = value.get("parent_task")
-        if parent_task and deadline < parent_task.deadline:
-            raise ValidationError(
-                "Срок исполнения задачи не может быть меньше срока исполнения связанной задачи."
-            )
+        if instance is not None:
+            if "parent_task" not in value and deadline:
+                parent_task = instance.parent_task
+            if parent_task and (
+                parent_task.pk == instance.pk
+                or instance.pk in parent_task.ancestor_ids
+            ):
+                raise ValidationError(PARENT_TASK_CYCLE_MESSAGE)
+            if (
+                "parent_task" in value
+                and parent_task
+                and parent_task.pk != instance.parent_task_id
+                and parent_task.depth >= instance.depth
+                and parent_task.depth + 1 + instance.get_subtree_height()
+                > Task.MAX_DEPTH
+            ):
+                raise ValidationError(TASK_DEPTH_MESSAGE)
+            if (
+                deadline
+                and deadline > instance.deadline
+                and instance.get_descendants().filter(deadline__lt=deadline).exists()
+            ):
+                raise ValidationError(DEADLINE_AFTER_DESCENDANTS_MESSAGE)
+            deadline = deadline or instance.deadline
+        elif parent_task and parent_task.depth >= Task.MAX_DEPTH:
+            raise ValidationError(TASK_DEPTH_MESSAGE)
+        if parent_task and deadline and deadline < parent_task.deadline:
+            raise ValidationError(DEADLINE_BEFORE_PARENT_MESSAGE)
@@ -1,14 +1,79 @@
-from django.db.models import Count
+import json
+
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import NotFound
+from rest_framework.fields import IntegerField
+from rest_framework.filters import SearchFilter
 from rest_framework.generics import (CreateAPIView, DestroyAPIView,
-                                     ListAPIView, RetrieveAPIView,
-                                     UpdateAPIView)
+                                     GenericAPIView, ListAPIView,
+                                     RetrieveAPIView, UpdateAPIView)
 from rest_framework.permissions import AllowAny
-
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from tasks.caching import (EMPLOYEES_CACHE_SCOPE, TASKS_CACHE_SCOPE,
+                           CachedResponseMixin)
+from tasks.exports import (EXPORT_CHUNK_SIZE, EXPORT_CONTENT_TYPES,
+                           EXPORT_WRITERS)
+from tasks.filters import TaskFilterBackend
 from tasks.models import Employee, Task
-from tasks.paginations import CustomPagination
-from tasks.serializers import (BusyEmployeeListSerializer, EmployeeSerializer,
+from tasks.paginations import (BusyEmployeeKeysetPagination, CustomPagination,
+                               EmployeeKeysetPagination, KeysetPaginationMixin,
+                               TaskKeysetPagination)
+from tasks.serializers import (BulkTaskCreateSerializer,
+                               BulkTaskUpdateSerializer,
+                               BusyEmployeeListSerializer, EmployeeSerializer,
                                ImportantTaskSerializer, TaskSerializer,
                                TaskUpdateSerializer)
+from tasks.services import get_ancestors, get_subtree, search_employees
+
+# Максимальное количество задач в одном пакетном запросе
+BULK_MAX_SIZE = 1000
+
+# Глубина дерева задач по умолчанию и максимальная глубина дерева задач
+TREE_DEFAULT_DEPTH = 10
+TREE_MAX_DEPTH = 100
+
+
+def get_tree_depth(request):
+    """
+    Возвращает глубину обхода дерева задач из параметра запроса depth.
+    """
+    return IntegerField(min_value=0, max_value=TREE_MAX_DEPTH).run_validation(
+        request.query_params.get("depth", TREE_DEFAULT_DEPTH)
+    )
+
+
+class ExportAPIView(GenericAPIView):
+    """
+    Базовый контроллер потоковой выгрузки записей в формате NDJSON или CSV.
+
+    Записи выбираются курсором порциями по EXPORT_CHUNK_SIZE в виде кортежей
+    значений без создания экземпляров моделей, поэтому расход памяти
+    не зависит от объема выгрузки.
+    """
+
+    # Выгружаемые поля: {<имя столбца>: <поле модели>}
+    export_fields = None
+    export_name = None
+
+    def get(self, request, *args, **kwargs):
+        export_format = self.kwargs["export_format"]
+        rows = (
+            self.filter_queryset(self.get_queryset())
+            .order_by("pk")
+            .values_list(*self.export_fields.values())
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        response = StreamingHttpResponse(
+            EXPORT_WRITERS[export_format](list(self.export_fields), rows),
+            content_type=EXPORT_CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.export_name}.{export_format}"'
+        )
+        return response
 
 
 class EmployeeCreateAPIView(CreateAPIView):
@@ -20,18 +85,23 @@ class EmployeeCreateAPIView(CreateAPIView):
     serializer_class = EmployeeSerializer
 
 
-class EmployeeListAPIView(ListAPIView):
+class EmployeeListAPIView(CachedResponseMixin, KeysetPaginationMixin, ListAPIView):
     """
-    Контроллер постраничного вывода списка сотрудников.
+    Контроллер постраничного вывода списка сотрудников
+    с поиском по ФИО (search).
     """
 
     queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
     pagination_class = CustomPagination
+    keyset_pagination_class = EmployeeKeysetPagination
     permission_classes = (AllowAny,)
+    cache_scope = EMPLOYEES_CACHE_SCOPE
+    filter_backends = (SearchFilter,)
+    search_fields = ("name",)
 
 
-class BusyEmployeeListAPIView(ListAPIView):
+class BusyEmployeeListAPIView(KeysetPaginationMixin, ListAPIView):
     """
     Контроллер постраничного вывода списка сотрудников,
     отсортированных по количеству их активных задач
@@ -41,17 +111,41 @@ class BusyEmployeeListAPIView(ListAPIView):
     queryset = Employee.objects.all()
     serializer_class = BusyEmployeeListSerializer
     pagination_class = CustomPagination
+    keyset_pagination_class = BusyEmployeeKeysetPagination
+
+    def get_queryset(self):
+        """
+        Возвращает сотрудников с количеством и списком активных задач,
+        отсортированных по количеству активных задач.
+        """
+        return Employee.objects.prefetch_related(
+            Prefetch(
+                "tasks",
+                queryset=Task.objects.filter(status="IN_PROGRESS").only(
+                    "title", "executor"
+                ),
+                to_attr="active_tasks",
+            )
+        ).order_by("-active_tasks_count", "name", "pk")
+
+
+class EmployeeSearchAPIView(ListAPIView):
+    """
+    Контроллер поиска сотрудников по началу слов ФИО (параметр q).
+    """
+
+    queryset = Employee.objects.all()
+    serializer_class = EmployeeSerializer
+    pagination_class = CustomPagination
+    permission_classes = (AllowAny,)
 
     def get_queryset(self):
-        self.queryset = Employee.objects.all()
-        self.queryset = self.queryset.select_related()
-        self.queryset = Employee.objects.annotate(tasks_count=Count("tasks")).order_by(
-            "-tasks_count"
+        return search_employees(
+            super().get_queryset(), self.request.query_params.get("q", "")
         )
-        return self.queryset
 
 
-class EmployeeRetrieveAPIView(RetrieveAPIView):
+class EmployeeRetrieveAPIView(CachedResponseMixin, RetrieveAPIView):
     """
     Контроллер просмотра информации по сотруднику.
     """
@@ -59,6 +153,19 @@ class EmployeeRetrieveAPIView(RetrieveAPIView):
     queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
     permission_classes = (AllowAny,)
+    cache_scope = EMPLOYEES_CACHE_SCOPE
+
+
+class EmployeeExportAPIView(ExportAPIView):
+    """
+    Контроллер выгрузки всех сотрудников.
+    """
+
+    queryset = Employee.objects.all()
+    export_fields = {"id": "id", "name": "name", "position": "position"}
+    export_name = "employees"
+    filter_backends = EmployeeListAPIView.filter_backends
+    search_fields = EmployeeListAPIView.search_fields
 
 
 class EmployeeUpdateAPIView(UpdateAPIView):
@@ -87,26 +194,74 @@ class TaskCreateAPIView(CreateAPIView):
     serializer_class = TaskSerializer
     queryset = Task.objects.all()
 
-    def perform_create(self, serializer):
-        """
-        Сохраняет новую задачу и
-        устанавливает статус "В работе" при назначении исполнителя
-        """
-        new_task = serializer.save()
-        if new_task.executor:
-            new_task.status = "IN_PROGRESS"
-        new_task.save()
+
+class TaskBulkCreateAPIView(CreateAPIView):
+    """
+    Пакетное создание задач.
+    """
+
+    serializer_class = BulkTaskCreateSerializer
+    queryset = Task.objects.all()
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.update(many=True, min_length=1, max_length=BULK_MAX_SIZE)
+        return super().get_serializer(*args, **kwargs)
 
 
-class TaskListAPIView(ListAPIView):
+class TaskBulkUpdateAPIView(GenericAPIView):
     """
-    Получение списка всех задач.
+    Пакетное изменение задач.
+    """
+
+    serializer_class = BulkTaskUpdateSerializer
+    queryset = Task.objects.all()
+
+    def patch(self, request, *args, **kwargs):
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            partial=True,
+            min_length=1,
+            max_length=BULK_MAX_SIZE,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+
+class TaskListAPIView(CachedResponseMixin, KeysetPaginationMixin, ListAPIView):
+    """
+    Получение списка задач с фильтрацией по параметрам запроса
+    (см. TaskFilterBackend) и поиском по наименованию (search).
     """
 
     serializer_class = TaskSerializer
     queryset = Task.objects.all()
     permission_classes = (AllowAny,)
     pagination_class = CustomPagination
+    keyset_pagination_class = TaskKeysetPagination
+    cache_scope = TASKS_CACHE_SCOPE
+    filter_backends = (TaskFilterBackend, SearchFilter)
+    search_fields = ("title",)
+
+
+class TaskExportAPIView(ExportAPIView):
+    """
+    Выгрузка всех задач.
+    """
+
+    queryset = Task.objects.all()
+    export_fields = {
+        "id": "id",
+        "title": "title",
+        "parent_task": "parent_task_id",
+        "executor": "executor_id",
+        "deadline": "deadline",
+        "status": "status",
+    }
+    export_name = "tasks"
+    filter_backends = TaskListAPIView.filter_backends
+    search_fields = TaskListAPIView.search_fields
 
 
 class ImportantTaskListAPIView(ListAPIView):
@@ -119,18 +274,13 @@ class ImportantTaskListAPIView(ListAPIView):
 
     def get_queryset(self):
         """
-        Возвращает перечень важных задач, не взятых в работу
+        Возвращает перечень важных задач, не взятых в работу,
+        по записям о важных задачах.
         """
-        important_tasks = []
-        dependent_tasks = Task.objects.exclude(parent_task=None).filter(
-            status="IN_PROGRESS", parent_task__status="NEW"
-        )
-        for task in dependent_tasks:
-            important_tasks.append(task.parent_task)
-        return important_tasks
+        return Task.objects.filter(important_snapshot__isnull=False)
 
 
-class TaskRetrieveAPIView(RetrieveAPIView):
+class TaskRetrieveAPIView(CachedResponseMixin, RetrieveAPIView):
     """
     Получение информации о конкретной задаче.
     """
@@ -138,25 +288,70 @@ class TaskRetrieveAPIView(RetrieveAPIView):
     serializer_class = TaskSerializer
     queryset = Task.objects.all()
     permission_classes = (AllowAny,)
+    cache_scope = TASKS_CACHE_SCOPE
 
 
-class TaskUpdateAPIView(UpdateAPIView):
+class TaskTreeAPIView(RetrieveAPIView):
     """
-    Изменение информации о задаче.
+    Получение задачи со всеми зависимыми от нее задачами в виде дерева:
+    {<Задача>, "subtasks": [{<Зависимая задача>, "subtasks": [...]}, ...]}.
+    Глубина дерева ограничивается параметром depth.
     """
 
-    serializer_class = TaskUpdateSerializer
+    serializer_class = TaskSerializer
     queryset = Task.objects.all()
+    permission_classes = (AllowAny,)
 
-    def perform_update(self, serializer):
+    def retrieve(self, request, *args, **kwargs):
+        tasks = get_subtree(self.kwargs["pk"], get_tree_depth(request))
+        if not tasks:
+            raise NotFound
+        subtasks = {}
+        for task in tasks[1:]:
+            subtasks.setdefault(task.parent_task_id, []).append(task)
+        return StreamingHttpResponse(
+            self.stream_tree(tasks[0], subtasks), content_type="application/json"
+        )
+
+    def stream_tree(self, task, subtasks):
         """
-        Если при изменении задачи назначается исполнитель,
-        устанавливает статус "В работе".
+        Поэлементно формирует JSON дерева задач, не собирая его целиком в памяти.
         """
-        task = serializer.save()
-        if task.executor and task.status == "NEW":
-            task.status = "IN_PROGRESS"
-        task.save()
+        data = json.dumps(
+            self.get_serializer(task).data, cls=JSONEncoder, ensure_ascii=False
+        )
+        yield f'{data[:-1]}, "subtasks": ['
+        for index, subtask in enumerate(subtasks.get(task.pk, [])):
+            if index:
+                yield ", "
+            yield from self.stream_tree(subtask, subtasks)
+        yield "]}"
+
+
+class TaskAncestorsAPIView(ListAPIView):
+    """
+    Получение цепочки родительских задач, начиная с непосредственной
+    родительской задачи. Длина цепочки ограничивается параметром depth.
+    """
+
+    serializer_class = TaskSerializer
+    queryset = Task.objects.all()
+    permission_classes = (AllowAny,)
+
+    def list(self, request, *args, **kwargs):
+        tasks = get_ancestors(self.kwargs["pk"], get_tree_depth(request))
+        if not tasks:
+            raise NotFound
+        return Response(self.get_serializer(tasks[1:], many=True).data)
+
+
+class TaskUpdateAPIView(UpdateAPIView):
+    """
+    Изменение информации о задаче.
+    """
+
+    serializer_class = TaskUpdateSerializer
+    queryset = Task.objects.all()
 
 
 class TaskDestroyAPIView(DestroyAPIView):
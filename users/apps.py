@@ -5,3 +5,9 @@ class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
     verbose_name = "Пользователи"
+
+    def ready(self):
+        import users.signals  # noqa: F401
+        from users.tokens import check_denylist_cache
+
+        check_denylist_cache()
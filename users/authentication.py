@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import (
+    JWTAuthentication, JWTStatelessUserAuthentication)
+from rest_framework_simplejwt.settings import api_settings
+
+from users.tokens import USER_CLAIMS, is_token_revoked
+
+
+class UserCache:
+    """
+    Кэш пользователей в памяти процесса с ограниченным временем хранения
+    (ttl секунд) и размером (max_size пользователей, вытесняются давно
+    добавленные).
+    """
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.users = OrderedDict()
+
+    def get(self, user_id, load):
+        """
+        Возвращает пользователя из кэша или загружает его функцией load.
+        """
+        now = time.monotonic()
+        with self.lock:
+            entry = self.users.get(user_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        user = load()
+        with self.lock:
+            self.users[user_id] = (now + self.ttl, user)
+            self.users.move_to_end(user_id)
+            while len(self.users) > self.max_size:
+                self.users.popitem(last=False)
+        return user
+
+    def discard(self, user_id):
+        with self.lock:
+            self.users.pop(user_id, None)
+
+    def clear(self):
+        with self.lock:
+            self.users.clear()
+
+
+user_cache = UserCache(
+    ttl=settings.JWT_USER_CACHE_TTL, max_size=settings.JWT_USER_CACHE_SIZE
+)
+
+
+class StatelessJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    Аутентификация JWT без запроса пользователя из БД.
+
+    Пользователь (TokenUser) строится по подписанным утверждениям токена
+    (USER_CLAIMS), которые добавляются при выдаче токена. Токены, выданные
+    до появления утверждений, проверяются по БД, а загруженные пользователи
+    кэшируются в памяти процесса на JWT_USER_CACHE_TTL секунд. Отзыв
+    токенов (выход, смена пароля, прав или блокировка пользователя)
+    проверяется по списку отозванных токенов в кэше без запроса к БД.
+    """
+
+    def get_user(self, validated_token):
+        if is_token_revoked(validated_token):
+            raise AuthenticationFailed("Токен отозван.", code="token_revoked")
+        if all(claim in validated_token for claim in USER_CLAIMS):
+            return super().get_user(validated_token)
+        return user_cache.get(
+            validated_token.get(api_settings.USER_ID_CLAIM),
+            lambda: JWTAuthentication.get_user(self, validated_token),
+        )
@@ -1,5 +1,36 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.contrib.auth.models import UserManager as BaseUserManager
+from django.db import models, transaction
+
+
+class UserQuerySet(models.QuerySet):
+    """
+    Набор пользователей, отзывающий токены при изменении запросом UPDATE.
+    """
+
+    def update(self, **kwargs):
+        """
+        Изменяет пользователей одним запросом. При изменении полей,
+        отзывающих токены (см. users.signals), отзывает токены измененных
+        пользователей: update() не отправляет сигналы сохранения.
+        Изменения через bulk_update() и SQL токены не отзывают.
+        """
+        from users.signals import REVOKING_FIELDS, revoke_user
+
+        if not set(kwargs) & set(REVOKING_FIELDS):
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            user_ids = list(self.values_list("pk", flat=True))
+            updated = super().update(**kwargs)
+            for user_id in user_ids:
+                revoke_user(user_id)
+        return updated
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
+    """
+    Менеджер пользователей.
+    """
 
 
 class User(AbstractUser):
@@ -10,6 +41,8 @@ class User(AbstractUser):
     username = None
     email = models.EmailField(unique=True, verbose_name="Почта")
 
+    objects = UserManager()
+
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
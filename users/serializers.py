@@ -1,4 +1,8 @@
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import (CharField, ModelSerializer,
+                                        Serializer, ValidationError)
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 
 from users.models import User
 
@@ -11,3 +15,20 @@ class UserSerializer(ModelSerializer):
     class Meta:
         model = User
         fields = "__all__"
+
+
+class LogoutSerializer(Serializer):
+    """
+    Сериализатор выхода пользователя с необязательным токеном обновления.
+    """
+
+    refresh = CharField(required=False)
+
+    def validate_refresh(self, value):
+        try:
+            refresh = RefreshToken(value)
+        except TokenError as error:
+            raise ValidationError(str(error))
+        if refresh.get(api_settings.USER_ID_CLAIM) != self.context["request"].user.pk:
+            raise ValidationError("Токен обновления выдан другому пользователю.")
+        return refresh
@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+
+from users.authentication import user_cache
+from users.models import User
+from users.tokens import USER_CLAIMS, revoke_user_tokens
+
+# Поля пользователя, изменение которых отзывает выданные ему токены
+REVOKING_FIELDS = ("password", "is_active", *USER_CLAIMS)
+
+
+def revoke_user(user_id):
+    """
+    Отзывает токены пользователя и удаляет его из кэша пользователей
+    после фиксации транзакции.
+    """
+
+    def revoke():
+        revoke_user_tokens(user_id)
+        user_cache.discard(user_id)
+
+    transaction.on_commit(revoke)
+
+
+@receiver(pre_save, sender=User)
+def revoke_tokens_on_change(sender, instance, raw, update_fields, **kwargs):
+    """
+    Отзывает токены пользователя при смене пароля, блокировке и изменении
+    утверждений, записанных в токены.
+    """
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not set(update_fields) & set(REVOKING_FIELDS):
+        return
+    loaded_state = User.objects.filter(pk=instance.pk).values(*REVOKING_FIELDS).first()
+    if loaded_state is None:
+        return
+    if any(
+        loaded_state[field] != getattr(instance, field) for field in REVOKING_FIELDS
+    ):
+        revoke_user(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def revoke_tokens_on_delete(sender, instance, **kwargs):
+    """
+    Отзывает токены удаленного пользователя.
+    """
+    revoke_user(instance.pk)
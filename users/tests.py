@@ -1,8 +1,18 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
+from users.authentication import StatelessJWTAuthentication, user_cache
 from users.models import User
+from users.tokens import (ISSUED_AT_CLAIM, check_denylist_cache,
+                          get_denylist_cache, get_user_key, revoke_token)
+
 
 
 class UserTestCase(APITestCase):
@@ -29,3 +39,185 @@ class UserTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         user = User.objects.get(email="user2@example.com")
         self.assertTrue(user.check_password("test123"))
+
+
+class StatelessJWTAuthenticationTestCase(APITestCase):
+    """
+    Класс тестов аутентификации JWT без запроса пользователя из БД.
+    """
+
+    def setUp(self):
+        get_denylist_cache().clear()
+        user_cache.clear()
+        self.user1 = User.objects.create(email="user1@example.com")
+        self.user1.set_password("test123")
+        self.user1.save()
+        self.factory = APIRequestFactory()
+
+    def authenticate(self, token):
+        request = self.factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return StatelessJWTAuthentication().authenticate(request)
+
+    def login(self):
+        response = self.client.post(
+            reverse("users:login"),
+            {"email": self.user1.email, "password": "test123"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_authenticate_by_claims(self):
+        """
+        Тестирование аутентификации по утверждениям токена без запросов к БД
+        """
+        access = AccessToken(self.login()["access"])
+        self.assertEqual(access["email"], self.user1.email)
+        self.assertIn(ISSUED_AT_CLAIM, access)
+
+        with self.assertNumQueries(0):
+            user, token = self.authenticate(access)
+        self.assertEqual(user.pk, self.user1.pk)
+        self.assertEqual(user.email, self.user1.email)
+        self.assertFalse(user.is_staff)
+        self.assertTrue(user.is_authenticated)
+
+    def test_authenticate_legacy_token(self):
+        """
+        Тестирование кэширования пользователя для токена без утверждений
+        """
+        access = RefreshToken.for_user(self.user1).access_token
+        with self.assertNumQueries(1):
+            user, token = self.authenticate(access)
+        self.assertEqual(user, self.user1)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate(access)[0], self.user1)
+
+    def test_revoked_token(self):
+        """
+        Тестирование отклонения отозванного токена
+        """
+        access = AccessToken(self.login()["access"])
+        revoke_token(access)
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+
+    def test_user_change_revokes_tokens(self):
+        """
+        Тестирование отзыва токенов при изменении прав и блокировке
+        пользователя
+        """
+        for field, value in (("is_staff", True), ("is_active", False)):
+            with self.subTest(field=field):
+                access = AccessToken(self.login()["access"])
+                setattr(self.user1, field, value)
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.user1.save()
+                with self.assertRaises(AuthenticationFailed):
+                    self.authenticate(access)
+                setattr(self.user1, field, not value)
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.user1.save()
+                access = AccessToken(self.login()["access"])
+                self.assertEqual(self.authenticate(access)[0].pk, self.user1.pk)
+
+    def test_unrelated_change_keeps_tokens(self):
+        """
+        Тестирование сохранения токенов при изменении прочих полей
+        """
+        access = AccessToken(self.login()["access"])
+        self.user1.first_name = "Имя"
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.user1.save()
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.authenticate(access)[0].pk, self.user1.pk)
+
+    def test_queryset_update_revokes_tokens(self):
+        """
+        Тестирование отзыва токенов при изменении пользователей запросом UPDATE
+        """
+        access = AccessToken(self.login()["access"])
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            User.objects.filter(pk=self.user1.pk).update(last_login=timezone.now())
+        self.assertEqual(callbacks, [])
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.user1.pk).update(is_active=False)
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+
+    def test_legacy_token_revoked_within_second(self):
+        """
+        Тестирование отзыва токена без времени входа в микросекундах,
+        выданного в секунду отзыва токенов пользователя
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.user1.pk).update(is_staff=True)
+        revoked_at = get_denylist_cache().get(get_user_key(self.user1.pk))
+        access = RefreshToken.for_user(self.user1).access_token
+        access["iat"] = revoked_at // 1_000_000
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+        access[ISSUED_AT_CLAIM] = revoked_at + 1
+        self.assertEqual(self.authenticate(access)[0].pk, self.user1.pk)
+
+    def test_logout(self):
+        """
+        Тестирование отзыва токенов при выходе пользователя
+        """
+        tokens = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        response = self.client.post(
+            reverse("users:logout"), {"refresh": tokens["refresh"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(tokens["access"])
+        self.client.credentials()
+        response = self.client.post(
+            reverse("users:token-refresh"), {"refresh": tokens["refresh"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_foreign_refresh_token(self):
+        """
+        Тестирование отказа в отзыве токена обновления другого пользователя
+        """
+        user2 = User.objects.create(email="user2@example.com")
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.post(
+            reverse("users:logout"), {"refresh": str(RefreshToken.for_user(user2))}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class DenylistCacheTestCase(APITestCase):
+    """
+    Класс тестов кэша списка отозванных токенов.
+    """
+
+    def test_stateless_auth_requires_shared_cache(self):
+        """
+        Тестирование отказа в запуске аутентификации без запроса к БД
+        со списком отозванных токенов в памяти процесса или в таблице БД
+        """
+        check_denylist_cache()
+        for backend in (
+            "django.core.cache.backends.locmem.LocMemCache",
+            "django.core.cache.backends.db.DatabaseCache",
+        ):
+            denylist_caches = {
+                **settings.CACHES,
+                "jwt-denylist": {"BACKEND": backend, "LOCATION": "jwt-denylist"},
+            }
+            with override_settings(JWT_STATELESS_AUTH=True, CACHES=denylist_caches):
+                with self.assertRaises(ImproperlyConfigured):
+                    check_denylist_cache()
+        denylist_caches = {
+            **settings.CACHES,
+            "jwt-denylist": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379/1",
+            },
+        }
+        with override_settings(JWT_STATELESS_AUTH=True, CACHES=denylist_caches):
+            check_denylist_cache()
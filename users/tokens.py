@@ -0,0 +1,139 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import (TokenObtainPairSerializer,
+                                                  TokenRefreshSerializer)
+from rest_framework_simplejwt.settings import api_settings
+
+# Утверждения токена, по которым пользователь определяется без запроса к БД
+USER_CLAIMS = ("email", "is_staff", "is_superuser")
+# Время входа пользователя в микросекундах: утверждение iat хранит время
+# с точностью до секунды и не позволяет отличить токены, выданные
+# в секунду отзыва токенов пользователя, от отозванных
+ISSUED_AT_CLAIM = "iat_us"
+
+DENYLIST_KEY_PREFIX = "jwt-denylist"
+
+
+def get_denylist_cache():
+    """
+    Возвращает кэш списка отозванных токенов.
+    """
+    return caches[settings.JWT_DENYLIST_CACHE_ALIAS]
+
+
+def check_denylist_cache():
+    """
+    Проверяет, что при аутентификации без запроса к БД список отозванных
+    токенов хранится в кэше, общем для всех рабочих процессов, и без
+    обращений к БД: отзыв токена в кэше памяти процесса не действует
+    в остальных процессах, а кэш в таблице БД заменяет запрос пользователя
+    запросом к кэшу.
+    """
+    if settings.JWT_STATELESS_AUTH and isinstance(
+        get_denylist_cache(), (LocMemCache, DummyCache, DatabaseCache)
+    ):
+        raise ImproperlyConfigured(
+            "При JWT_STATELESS_AUTH=True кэш JWT_DENYLIST_CACHE_ALIAS "
+            f"({settings.JWT_DENYLIST_CACHE_ALIAS}) должен быть общим "
+            "для рабочих процессов и не использовать БД, например Redis."
+        )
+
+
+def get_timestamp_us():
+    """
+    Возвращает текущее время в микросекундах.
+    """
+    return time.time_ns() // 1000
+
+
+def get_token_key(jti):
+    return f"{DENYLIST_KEY_PREFIX}:token:{jti}"
+
+
+def get_user_key(user_id):
+    return f"{DENYLIST_KEY_PREFIX}:user:{user_id}"
+
+
+def revoke_token(token):
+    """
+    Отзывает токен. Запись хранится до истечения срока действия токена.
+    """
+    timeout = max(token["exp"] - int(time.time()), 1)
+    get_denylist_cache().set(
+        get_token_key(token[api_settings.JTI_CLAIM]), True, timeout=timeout
+    )
+
+
+def revoke_user_tokens(user_id):
+    """
+    Отзывает все выданные пользователю токены: токены, выданные не позднее
+    текущей микросекунды, считаются отозванными. Запись хранится в течение
+    срока действия токена обновления.
+    """
+    get_denylist_cache().set(
+        get_user_key(user_id),
+        get_timestamp_us(),
+        timeout=int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()),
+    )
+
+
+def get_issued_at(token):
+    """
+    Возвращает время выдачи токена в микросекундах. Для токенов без
+    утверждения ISSUED_AT_CLAIM используется начало секунды iat, поэтому
+    такие токены, выданные в секунду отзыва, считаются отозванными.
+    """
+    issued_at = token.get(ISSUED_AT_CLAIM)
+    if issued_at is None:
+        issued_at = token.get("iat", 0) * 1_000_000
+    return issued_at
+
+
+def is_token_revoked(token):
+    """
+    Проверяет, отозван ли токен или все токены его пользователя.
+    Проверка выполняется одним обращением к кэшу.
+    """
+    token_key = get_token_key(token.get(api_settings.JTI_CLAIM))
+    user_key = get_user_key(token.get(api_settings.USER_ID_CLAIM))
+    values = get_denylist_cache().get_many((token_key, user_key))
+    if values.get(token_key):
+        return True
+    revoked_at = values.get(user_key)
+    return revoked_at is not None and get_issued_at(token) <= revoked_at
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Сериализатор получения токенов, добавляющий в токены утверждения
+    USER_CLAIMS для аутентификации без запроса пользователя из БД
+    (см. StatelessJWTAuthentication) и время входа ISSUED_AT_CLAIM.
+    Токены доступа, полученные по токену обновления, наследуют время входа,
+    поэтому отзыв токенов пользователя действует и на них.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        for claim in USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        token[ISSUED_AT_CLAIM] = get_timestamp_us()
+        return token
+
+
+class DenylistTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Сериализатор обновления токена, отклоняющий отозванные токены обновления.
+    """
+
+    def validate(self, attrs):
+        if is_token_revoked(self.token_class(attrs["refresh"])):
+            raise TokenError("Токен отозван.")
+        return super().validate(attrs)
@@ -1,7 +1,11 @@
-from rest_framework.generics import CreateAPIView
+from django.contrib.auth.hashers import make_password
+from rest_framework import status
+from rest_framework.generics import CreateAPIView, GenericAPIView
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 
-from users.serializers import UserSerializer
+from users.serializers import LogoutSerializer, UserSerializer
+from users.tokens import revoke_token
 
 
 class UserCreateAPIView(CreateAPIView):
@@ -13,6 +17,26 @@ class UserCreateAPIView(CreateAPIView):
     permission_classes = (AllowAny,)
 
     def perform_create(self, serializer):
-        user = serializer.save(is_active=True)
-        user.set_password(user.password)
-        user.save()
+        serializer.save(
+            is_active=True,
+            password=make_password(serializer.validated_data["password"]),
+        )
+
+
+class LogoutAPIView(GenericAPIView):
+    """
+    Контроллер выхода пользователя: отзывает токен доступа запроса
+    и переданный токен обновления.
+    """
+
+    serializer_class = LogoutSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if request.auth is not None:
+            revoke_token(request.auth)
+        refresh = serializer.validated_data.get("refresh")
+        if refresh is not None:
+            revoke_token(refresh)
+        return Response(status=status.HTTP_204_NO_CONTENT)